@@ -2,6 +2,8 @@ from dotenv import load_dotenv
 import streamlit as st
 import requests
 import os
+from result_cache import book_cache_key, get_book_cache
+from book_cards import render_cards
 
 load_dotenv()
 
@@ -11,6 +13,13 @@ CLIENT_SECRET = os.getenv("CSEC")
 
 # 책 검색 함수
 def search_books(query, display=5):
+    # 같은 검색어는 캐시(메모리 + data/book_cache.sqlite3)에서 바로 반환
+    cache = get_book_cache()
+    cache_key = book_cache_key(query, 1, display)
+    books = cache.get(cache_key)
+    if books is not None:
+        return books
+
     url = "https://openapi.naver.com/v1/search/book.json"
     headers = {
         "X-Naver-Client-Id": CLIENT_ID,
@@ -24,7 +33,9 @@ def search_books(query, display=5):
     response = requests.get(url, headers=headers, params=params)
 
     if response.status_code == 200:
-        return response.json().get('items', [])
+        books = response.json().get('items', [])
+        cache.set(cache_key, books)
+        return books
     else:
         st.error("API 오류 발생")
         return []
@@ -41,19 +52,7 @@ if st.button("검색하기"):
     books = search_books(query, display_num)
 
     if books:
-        for book in books:
-            # 카드 하나씩 표시
-            with st.container():
-                cols = st.columns([1, 3])
-                with cols[0]:
-                    st.image(book['image'], width=100)
-                with cols[1]:
-                    st.markdown(f"### {book['title']}")
-                    st.write(f"**저자**: {book['author']}")
-                    st.write(f"**출판사**: {book['publisher']}")
-                    st.write(f"**정가**: {book.get('price', '정보 없음')}원")
-                    st.write(f"**할인가**: {book.get('discount', '정보 없음')}원")
-                    st.markdown(f"[📖 책 보러가기]({book['link']})")
-            st.divider()
+        # 모든 카드를 한 번의 HTML 블록으로 표시 (표지는 화면에 보일 때 로드)
+        render_cards(books)
     else:
         st.info("검색 결과가 없어요 😥")
@@ -2,11 +2,55 @@ from dotenv import load_dotenv  # .env 파일에서 환경 변수를 로드하
 import streamlit as st  # Streamlit 라이브러리 import (웹 앱 개발)
 import requests  # HTTP 요청을 보내는 라이브러리
 import os  # 운영체제 관련 기능을 제공하는 라이브러리
+from metrics import METRICS  # 캐시 적중 횟수 / API 호출 시간 기록
+from book_fetch import BookFetchError, get_fetcher  # 네이버 책 검색 페이지 동시 요청 엔진
+from fetch_policy import SingleFlight  # 같은 검색어의 동시 요청 합치기
+from result_cache import book_cache_key, get_book_cache  # 책 검색 결과 메모리 + 디스크 캐시
+from book_records import SORT_ORDERS, records_for  # 정수 가격 / 출판사 색인 / ISBN 중복 제거로 정규화한 검색 결과
+from book_cards import load_more_button, page_limit, render_cards  # 한 번의 HTML 블록으로 출력하는 책 카드 ('더 보기' 지원)
 
 # streamlit run app_re.py
 
 load_dotenv()  # .env 파일에서 환경 변수를 로드합니다. (네이버 API 키 등을 읽어옴)
 
+BOOK_FLIGHTS = SingleFlight('books')  # 프로세스 전체(모든 세션)에서 공유: 같은 검색어를 동시에 요청하면 API 호출 한 번의 결과를 함께 사용
+
+
+def cached_books(query, max_results=100):
+    """캐시에 저장된 책 검색 결과를 반환합니다. (없거나 만료되었으면 None, 네트워크 호출 없음)"""
+    return get_book_cache().get(book_cache_key(query, 1, max_results))
+
+
+def fetch_books(query, max_results=100, client_id=None, client_secret=None):
+    """
+    네이버 책 검색 API를 호출하고 결과를 캐시에 저장합니다. (Streamlit 출력 없음, 백그라운드 스레드에서도 사용)
+
+    다른 세션이 같은 검색어를 이미 요청 중이면 새로 요청하지 않고 그 결과를 함께 사용합니다. (fetch_policy.SingleFlight)
+
+    Args:
+        query (str): 검색어 (자격증 이름)
+        max_results (int): 가져올 최대 검색 결과 수
+        client_id (str): 네이버 Client ID (없으면 환경 변수 "CID")
+        client_secret (str): 네이버 Client Secret (없으면 환경 변수 "CSEC")
+
+    Returns:
+        list: 검색된 책 정보 리스트
+
+    Raises:
+        BookFetchError: API 가 200 이 아닌 상태 코드로 응답한 경우
+        requests.exceptions.RequestException: 연결 실패 또는 제한 시간 초과
+    """
+    cache_key = book_cache_key(query, 1, max_results)  # 정규화된 검색어 + 결과 범위
+    fetcher = get_fetcher(client_id or os.getenv("CID"), client_secret or os.getenv("CSEC"))  # 프로세스 전체에서 공유하는 요청 엔진 (연결 재사용)
+
+    def fetch_and_store():  # 실제 API 호출과 캐시 저장 (같은 검색어의 동시 요청 중 하나만 실행)
+        with METRICS.span('books.fetch', keyword=query):  # 캐시에 없을 때의 전체 API 호출 시간
+            books = fetcher.fetch(query, max_results=max_results)
+        get_book_cache().set(cache_key, books)  # 성공한 결과만 캐시에 저장 (오류는 저장하지 않음)
+        return books
+
+    return BOOK_FLIGHTS.do(cache_key, fetch_and_store)
+
 class BookSearchApp:
     """자격증 관련 책을 검색하여 보여주는 Streamlit 앱 클래스"""
     def __init__(self):
@@ -20,7 +64,7 @@ class BookSearchApp:
         st.write("검색창에 자격증 이름을 입력하면 관련 서적을 카드 형태로 보여드려요!")  # 앱에 대한 간단한 설명을 화면에 표시
 
         # 사용자 입력 위젯 생성
-        self.display_num = st.slider("📚 표시할 책 개수 선택", 1, 10, 5)  # 표시할 책의 개수를 선택하는 슬라이더 위젯 생성 (최소 1개, 최대 10개, 기본값 5개)
+        self.display_num = st.slider("📚 표시할 책 개수 선택", 1, 10, 5)  # 한 번에 표시할 책의 개수를 선택하는 슬라이더 위젯 생성 (최소 1개, 최대 10개, 기본값 5개, '더 보기'로 같은 개수씩 추가)
         self.filter_publisher = st.text_input("출판사 필터 (선택 사항)")  # 출판사로 검색 결과를 필터링할 수 있는 텍스트 입력 위젯 생성
 
         # 검색 버튼
@@ -33,7 +77,12 @@ class BookSearchApp:
 
     def search_books(self, query, max_results=100):
         """
-        네이버 책 검색 API를 여러 번 호출하여 최대 max_results개의 책 정보를 가져오는 메서드
+        네이버 책 검색 API를 호출하여 최대 max_results개의 책 정보를 가져오는 메서드
+
+        같은 검색어(공백/대소문자 정규화)와 결과 범위의 검색 결과는 메모리 + 디스크 캐시에서 바로 반환하여 API를 호출하지 않습니다.
+        다른 세션이 같은 검색어를 이미 요청 중이면 새로 요청하지 않고 그 결과를 함께 사용합니다. (fetch_policy.SingleFlight)
+        캐시에 없으면 한 번에 최대 100개씩 요청하고, 첫 페이지 이후의 페이지는 keep-alive 연결 풀을 공유하는 작업자 풀에서 동시에 요청합니다.
+        (book_fetch.BookFetcher 사용, 요청마다 제한 시간 적용, 결과는 원래 순서대로 합쳐짐)
 
         Args:
             query (str): 검색어 (자격증 이름)
@@ -42,35 +91,20 @@ class BookSearchApp:
         Returns:
             list: 검색된 책 정보 리스트 (각 책 정보는 딕셔너리 형태), API 오류 발생 시 빈 리스트 반환
         """
-        url = "https://openapi.naver.com/v1/search/book.json"  # 네이버 책 검색 API 엔드포인트 URL
-        headers = {
-            "X-Naver-Client-Id": self.CLIENT_ID,  # 네이버 API Client ID를 요청 헤더에 포함
-            "X-Naver-Client-Secret": self.CLIENT_SECRET  # 네이버 API Client Secret을 요청 헤더에 포함
-        }
-        all_books = []  # 검색된 모든 책 정보를 저장할 빈 리스트 초기화
-        start = 1  # API 검색 시작 위치 (페이지) 초기화
-        display_count = 10  # 한 번의 API 호출로 가져올 책 개수 (최대 100)
+        books = cached_books(query, max_results)  # 정규화된 검색어 + 결과 범위로 캐시 확인 (미리 불러오기로 채워진 결과 포함)
+        if books is not None:  # 캐시 적중 시 네트워크 호출 없이 반환
+            METRICS.incr('books.cache_hit')
+            return books
+        METRICS.incr('books.cache_miss')
 
         with st.spinner("책 정보를 가져오는 중..."):  # Streamlit의 로딩 스피너를 표시하며 내부 코드 실행
-            while len(all_books) < max_results:  # 가져온 책의 수가 최대 결과 수보다 작을 동안 반복
-                params = {
-                    "query": query,  # 검색어 파라미터
-                    "display": min(display_count, max_results - len(all_books)),  # 한 번에 가져올 개수 설정 (남은 결과 수와 display_count 중 작은 값)
-                    "start": start  # 검색 시작 위치 파라미터
-                }
-                response = requests.get(url, headers=headers, params=params)  # 네이버 책 검색 API에 GET 요청을 보냄
-
-                if response.status_code == 200:  # HTTP 상태 코드가 200 (성공)인 경우
-                    items = response.json().get('items', [])  # JSON 응답에서 'items' 키의 값(책 정보 리스트)을 가져옴, 없으면 빈 리스트 반환
-                    if not items:  # 가져온 책 정보 리스트가 비어있으면 (더 이상 검색 결과가 없으면)
-                        break  # while 루프 종료
-                    all_books.extend(items)  # 가져온 책 정보 리스트를 전체 책 리스트에 추가
-                    start += display_count  # 다음 API 호출을 위한 시작 위치 증가
-                else:  # HTTP 상태 코드가 200이 아닌 경우 (API 오류 발생)
-                    st.error(f"API 오류 발생 (상태 코드: {response.status_code})")  # 오류 메시지 표시
-                    return []  # 빈 리스트 반환
-
-        return all_books  # 검색된 모든 책 정보가 담긴 리스트 반환
+            try:
+                return fetch_books(query, max_results, self.CLIENT_ID, self.CLIENT_SECRET)  # 검색된 모든 책 정보가 담긴 리스트 반환 (다른 세션이 같은 검색어를 요청 중이면 그 결과를 기다림)
+            except BookFetchError as e:  # HTTP 상태 코드가 200이 아닌 경우 (API 오류 발생)
+                st.error(str(e))  # 오류 메시지 표시
+            except requests.exceptions.RequestException as e:  # 연결 실패 또는 제한 시간 초과
+                st.error(f"API 요청 실패: {e}")  # 오류 메시지 표시
+        return []  # 빈 리스트 반환
 
     def display_book_results(self):
         """검색된 책 정보를 필터링, 정렬 후 카드 형태로 화면에 표시하는 메서드"""
@@ -80,41 +114,25 @@ class BookSearchApp:
             st.info("검색 결과가 없어요 😥")  # 정보 메시지 표시
             return
 
-        filtered_books = all_books  # 초기 필터링된 책 리스트는 모든 검색 결과
-        if self.filter_publisher:  # 출판사 필터가 입력된 경우
-            filtered_books = [book for book in filtered_books if self.filter_publisher.lower() in book['publisher'].lower()]
-            # 필터링된 책 리스트를 업데이트: 입력된 출판사를 (대소문자 구분 없이) 포함하는 책만 남김
+        records = records_for(book_cache_key(self.query, 1, 100), all_books)
+        # 검색 결과를 한 번만 정규화 (ISBN 중복 제거, 정렬 가격 정수 배열, 소문자 출판사 색인) - 같은 결과면 모든 세션이 재사용
+
+        rows = records.filter_publisher(self.filter_publisher)  # 출판사 색인에서 입력된 출판사를 (대소문자 구분 없이) 포함하는 책의 행 번호
 
-        if not filtered_books:  # 필터링 후 책이 없는 경우
+        if len(rows) == 0:  # 필터링 후 책이 없는 경우
             st.info(f"'{self.filter_publisher}' 출판사의 검색 결과가 없어요 😥")  # 해당 출판사의 검색 결과가 없다는 정보 메시지 표시
             return
 
-        filtering = st.selectbox("정렬 기준", ['기본', '낮은 가격 순', '높은 가격 순'])  # 정렬 기준을 선택하는 Selectbox 위젯 생성
-        if filtering == '낮은 가격 순':
-            filtered_books = sorted(filtered_books, key=lambda x: int(x.get('discount', x.get('price', '0')).replace(',', '') or 0))
-            # 필터링된 책을 'discount' (할인가) 또는 'price' (정가)를 기준으로 낮은 가격 순으로 정렬
-            # 가격 정보가 없거나 숫자로 변환할 수 없으면 0으로 처리
-        elif filtering == '높은 가격 순':
-            filtered_books = sorted(filtered_books, key=lambda x: int(x.get('discount', x.get('price', '0')).replace(',', '') or 0), reverse=True)
-            # 필터링된 책을 'discount' (할인가) 또는 'price' (정가)를 기준으로 높은 가격 순으로 정렬
-            # 가격 정보가 없거나 숫자로 변환할 수 없으면 0으로 처리, reverse=True로 내림차순 정렬
-
-        displayed_books = filtered_books[:self.display_num]  # 선택한 개수만큼만 필터링된 책 리스트에서 슬라이싱하여 가져옴
+        filtering = st.selectbox("정렬 기준", SORT_ORDERS)  # 정렬 기준을 선택하는 Selectbox 위젯 생성
+        limit = page_limit('books', (self.query, self.filter_publisher, filtering), self.display_num)
+        # 지금까지 '더 보기'로 늘어난 표시 개수 (검색어 / 출판사 / 정렬 / 개수가 바뀌면 첫 페이지로)
+        displayed_books = [records.books[row] for row in records.top(limit, filtering, rows)]
+        # 'discount' (할인가) 또는 'price' (정가) 정수 배열 기준으로 전체를 정렬하지 않고 힙으로 표시할 개수만큼만 선택
+        # (가격 정보가 없거나 숫자로 변환할 수 없으면 0으로 처리, 가격이 같으면 검색 결과 순서 유지)
 
         if displayed_books:  # 표시할 책이 있는 경우
-            for book in displayed_books:  # 각 책에 대해 반복
-                with st.container():  # Streamlit 컨테이너 생성 (책 정보 그룹화)
-                    cols = st.columns([1, 3])  # 1:3 비율로 두 개의 컬럼 생성 (이미지, 텍스트 정보)
-                    with cols[0]:  # 첫 번째 컬럼 (이미지 영역)
-                        st.image(book['image'], width=100)  # 책 이미지 표시 (최대 너비 100px)
-                    with cols[1]:  # 두 번째 컬럼 (텍스트 정보 영역)
-                        st.markdown(f"### {book['title']}")  # 책 제목을 Markdown 형식의 h3 태그로 표시
-                        st.write(f"**저자**: {book['author']}")  # 저자 정보 표시 (볼드체 적용)
-                        st.write(f"**출판사**: {book['publisher']}")  # 출판사 정보 표시
-                        st.write(f"**정가**: {book.get('price', '정보 없음')}원")  # 정가 정보 표시 (없으면 '정보 없음')
-                        st.write(f"**할인가**: {book.get('discount', book.get('price', '정보 없음'))}원")  # 할인가 정보 표시 (없으면 정가 또는 '정보 없음')
-                        st.markdown(f"[📖 책 보러가기]({book['link']})")  # 책 상세 페이지 링크를 Markdown 형식으로 표시
-                    st.divider()  # 각 책 정보 사이에 구분선 추가
+            render_cards(displayed_books)  # 모든 책 카드(표지, 제목, 저자, 출판사, 정가, 할인가, 링크)를 한 번의 HTML 블록으로 표시 (표지는 화면에 보일 때 로드)
+            load_more_button('books', self.display_num, limit, len(rows))  # 남은 책이 있으면 '더 보기' 버튼
         else:  # 표시할 책이 없는 경우
             st.info("표시할 책이 없어요 😥")  # 정보 메시지 표시
 
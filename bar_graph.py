@@ -1,82 +1,118 @@
-import os  # 운영체제 관련 기능을 제공하는 모듈
-import re  # 정규 표현식 관련 기능을 제공하는 모듈
-
-import pandas as pd  # 데이터 분석 및 조작을 위한 라이브러리
-
-# 연도별 자격증 합격률 csv 파일 불러오기 ('UTF-8' 인코딩이 아닌 'EUC-KR' 인코딩이라 설정)
-pr_df = pd.read_csv('data\passing_rate.csv', encoding='EUC-KR')
-# pandas의 read_csv 함수를 사용하여 'data' 폴더 내의 'passing_rate.csv' 파일을 읽어 DataFrame 객체 'pr_df'에 저장합니다.
-# encoding='EUC-KR' 파라미터는 파일의 인코딩 방식을 명시적으로 지정합니다.
-
-print("----------------------------------------------------------------")
-print(f"pr_df 컬럼들: \n{pr_df.columns}")
-# DataFrame 'pr_df'의 컬럼 이름을 출력합니다. 이는 데이터의 구조를 파악하는 데 유용합니다.
-# 예상 출력: Index(['종목별', '항목', '단위', '2019 년', '2020 년', '2021 년', '2022 년', '2023 년','Unnamed: 8'], dtype='object')
-print("----------------------------------------------------------------")
-print("pr_df 길이: {}".format(len(pr_df)))
-# DataFrame 'pr_df'의 행의 개수 (길이)를 출력합니다. 이는 전체 데이터의 크기를 나타냅니다.
-# 예상 출력: pr_df 길이: 6832
-
-# 'Unnamed: 8'이라는 필요없는 컬럼 drop
-pr_df = pr_df.drop(columns='Unnamed: 8')
-# DataFrame 'pr_df'에서 'Unnamed: 8'이라는 이름의 컬럼을 제거합니다.
-# drop 함수의 columns 파라미터에 제거할 컬럼 이름을 리스트 형태로 전달합니다.
-
-print("----------------------------------------------------------------")
-# 데이터 결측치 %로 확인
-print("전체데이터 길이: {}".format(len(pr_df)))
-# 컬럼 제거 후 DataFrame 'pr_df'의 전체 데이터 길이를 다시 출력합니다.
-print()
-print(f"19년도 결측치: {pr_df['2019 년'].isnull().sum()/len(pr_df):.04f}")
-# '2019 년' 컬럼의 결측치 개수를 전체 데이터 길이로 나누어 결측치 비율을 소수점 4자리까지 출력합니다.
-# isnull() 함수는 각 요소가 결측치인지 여부를 True/False로 반환하고, sum() 함수는 True의 개수를 세어 결측치 개수를 얻습니다.
-print(f"20년도 결측치: {pr_df['2020 년'].isnull().sum()/len(pr_df):.04f}")
-# '2020 년' 컬럼의 결측치 비율을 계산하여 출력합니다.
-print(f"21년도 결측치: {pr_df['2021 년'].isnull().sum()/len(pr_df):.04f}")
-# '2021 년' 컬럼의 결측치 비율을 계산하여 출력합니다.
-print(f"22년도 결측치: {pr_df['2022 년'].isnull().sum()/len(pr_df):.04f}")
-# '2022 년' 컬럼의 결측치 비율을 계산하여 출력합니다.
-print(f"23년도 결측치: {pr_df['2023 년'].isnull().sum()/len(pr_df):.04f}")
-# '2023 년' 컬럼의 결측치 비율을 계산하여 출력합니다.
-print("----------------------------------------------------------------")
-# 결측치가 약 1%에서 약 2% 사아이기에 결측치를 전부 0으로 대체
-pr_df = pr_df.fillna(0)
-# DataFrame 'pr_df'의 모든 결측치(NaN) 값을 0으로 채웁니다.
-# fillna() 함수는 결측치를 지정된 값으로 채우는 데 사용됩니다.
-
-print()
-
-# 혹시 모르니까 결측값 다시 확인
-print(f"전체 결측값: \n{pr_df.isnull().sum()}")
-# fillna() 함수 적용 후 DataFrame 'pr_df'의 컬럼별 결측치 개수를 다시 확인하여 결측치가 모두 0으로 대체되었는지 검증합니다.
-# 예상 출력:
-# 전체 결측값:
-# 종목별    0
-# 항목      0
-# 단위      0
-# 2019 년    0
-# 2020 년    0
-# 2021 년    0
-# 2022 년    0
-# 2023 년    0
-# dtype: int64
-print("----------------------------------------------------------------")
-print()
-
-# pr_df의 합격 인원만 가져오기
-people_pr_df = pr_df.loc[pr_df['단위'] != '%'].reset_index(drop=True)
-# DataFrame 'pr_df'에서 '단위' 컬럼의 값이 '%'가 아닌 행들만 선택하여 새로운 DataFrame 'people_pr_df'를 생성합니다.
-# loc[] 인덱서를 사용하여 조건에 맞는 행을 선택합니다.
-# reset_index(drop=True)는 새로운 DataFrame의 인덱스를 0부터 시작하도록 재설정하고, 이전 인덱스를 삭제합니다.
-
-# pr_df의 합격률만 가져오기
-per_pr_df = pr_df.loc[pr_df['단위'] == '%'].reset_index(drop=True)
-# DataFrame 'pr_df'에서 '단위' 컬럼의 값이 '%'인 행들만 선택하여 새로운 DataFrame 'per_pr_df'를 생성합니다.
-# 이는 합격률 데이터를 분리하는 작업입니다.
-
-# 각 데이터 프레임 길이
-print("dataFrame length")
-print("people_per_df: {}\nper_pr_df: {}".format(len(people_pr_df), len(per_pr_df)))
-# 생성된 'people_pr_df' (합격 인원)와 'per_pr_df' (합격률) DataFrame의 길이를 각각 출력하여 데이터가 올바르게 분리되었는지 확인합니다.
-
-print("----------------------------------------------------------------")
\ No newline at end of file
+import functools  # 함수 결과를 프로세스 단위로 캐싱하기 위한 모듈
+
+import dataset  # 합격률 데이터 바이너리 캐시 로더
+from stats_cube import StatsCube  # 등급별 / 연도별 집계
+
+# 이 모듈은 import 할 때 아무 작업도 하지 않습니다.
+# 데이터는 load_views()를 처음 호출할 때 한 번만 읽으며, 진단 정보는 report()로 따로 출력합니다.
+# load_table()이 반환하는 테이블은 프로세스 전체(모든 세션, 모든 탭)에서 공유하는 읽기 전용 객체입니다.
+#   people_view, per_view = bar_graph.load_views()
+# 합격 인원 / 합격률 보기는 하나의 정규화 테이블(stats_table.StatsTable)을 복사 없이 나누어 보는 것이며,
+# 결측값은 0으로 채우지 않고 NaN 으로 유지합니다.
+# 기존 코드와의 호환을 위해 bar_graph.pr_df / people_pr_df / per_pr_df 속성으로 데이터프레임에 접근하는 것도 지원합니다. (처음 접근할 때 생성)
+
+
+@functools.lru_cache(maxsize=None)
+def load_table():
+    """
+    연도별 자격증 합격률 정규화 테이블을 반환합니다. (프로세스당 한 번만 로드)
+
+    'data' 폴더 내의 'passing_rate.csv' (EUC-KR 인코딩) 파일을 한 번만 디코딩하여 'data/passing_rate.npz' 캐시로 저장하고,
+    이후에는 캐시에서 바로 테이블을 구성합니다. (원본 CSV가 바뀌면 캐시를 자동으로 다시 만듭니다.)
+    모든 탭과 세션이 복사 없이 같은 객체를 공유하므로, 배열은 읽기 전용입니다. (StatsTable.freeze())
+
+    Returns:
+        StatsTable: (종목, 항목, 단위, 연도, 값) 읽기 전용 정규화 테이블
+    """
+    return dataset.load_table().freeze()
+
+
+def load_views():
+    """
+    합격 인원 / 합격률 보기를 반환합니다.
+
+    '단위' 컬럼의 값이 '%'가 아닌 계열은 합격 인원, '%'인 계열은 합격률 데이터입니다.
+    보기는 테이블의 계열 번호만 가지고 있으며, 검색 결과처럼 필요한 행만 데이터프레임으로 만듭니다.
+
+    Returns:
+        tuple: (people_view, per_view) - 합격 인원 보기, 합격률 보기 (stats_table.StatsView)
+    """
+    table = load_table()
+    return table.view('people'), table.view('rate')
+
+
+@functools.lru_cache(maxsize=None)
+def load_cube():
+    """
+    등급별 합계, 가중 합격률, 전년 대비 증감, 자격증 순위를 미리 계산한 집계 큐브를 반환합니다. (프로세스당 한 번만 계산)
+
+    Returns:
+        StatsCube: 등급별 / 연도별 집계 큐브
+    """
+    return StatsCube(load_table())
+
+
+@functools.lru_cache(maxsize=None)
+def load_pr_df():
+    """전체 합격률 데이터를 원본 CSV 형태의 데이터프레임으로 반환합니다. (기존 코드 호환용, 결측값은 NaN)"""
+    return load_table().wide()
+
+
+@functools.lru_cache(maxsize=None)
+def load_frames():
+    """
+    합격 인원 / 합격률 데이터프레임을 반환합니다. (기존 코드 호환용, 결측값은 NaN)
+
+    전체 행을 펼친 데이터프레임을 만들므로, 새 코드에서는 load_views()를 사용하세요.
+
+    Returns:
+        tuple: (people_pr_df, per_pr_df) - 합격 인원 데이터프레임, 합격률 데이터프레임
+    """
+    people_view, per_view = load_views()
+    return people_view.frame(), per_view.frame()
+
+
+def report():
+    """
+    데이터 구조와 결측치 비율, 보기별 길이 등 진단 정보를 출력합니다. (선택 사항)
+
+    데이터 로드 자체는 load_table()의 캐시를 그대로 사용하므로, 여러 번 호출해도 데이터를 다시 읽지 않습니다.
+    """
+    table = load_table()
+    print("----------------------------------------------------------------")
+    print(f"연도: {table.year_labels()}")
+    # 데이터의 구조를 파악하기 위해 사용 가능한 연도를 출력합니다. (연도는 컬럼이 아닌 '연도' 값으로 저장됨)
+    # 예상 출력: 연도: ['2019 년', '2020 년', '2021 년', '2022 년', '2023 년'] (ingest_stats.py 로 추가한 연도는 뒤에 붙음)
+    print("----------------------------------------------------------------")
+    # 데이터 결측치 %로 확인
+    print("전체데이터 길이: {}".format(table.n_series))
+    # 예상 출력: 전체데이터 길이: 6832
+    print("관측값 수: {} ({:.1f} KB)".format(len(table), table.nbytes / 1024))
+    print()
+    for year, ratio in table.missing_ratio().items():
+        print(f"{str(year)[2:]}년도 결측치: {ratio:.04f}")
+        # 연도별 결측치 개수를 전체 데이터 길이로 나누어 결측치 비율을 소수점 4자리까지 출력합니다.
+    print("----------------------------------------------------------------")
+    print()
+
+    # 각 보기 길이
+    people_view, per_view = load_views()
+    print("dataFrame length")
+    print("people_per_df: {}\nper_pr_df: {}".format(len(people_view), len(per_view)))
+    # 합격 인원과 합격률 보기의 길이를 각각 출력하여 데이터가 올바르게 분리되었는지 확인합니다.
+    print("----------------------------------------------------------------")
+
+
+def __getattr__(name):
+    """기존 모듈 속성(pr_df, people_pr_df, per_pr_df)에 처음 접근할 때 데이터프레임을 만듭니다."""
+    if name == 'pr_df':
+        return load_pr_df()
+    if name == 'people_pr_df':
+        return load_frames()[0]
+    if name == 'per_pr_df':
+        return load_frames()[1]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if __name__ == '__main__':
+    report()  # python bar_graph.py 로 직접 실행하면 진단 정보 출력
@@ -0,0 +1,490 @@
+import argparse  # 명령줄 인자 처리
+import contextlib  # 벤치마크별 준비/정리 작업 관리
+import gc  # 측정 중 가비지 컬렉션 끄기
+import glob  # 큐넷 HTML 픽스처 목록
+import json  # 결과 / 기준값 파일
+import logging  # 한글 폰트가 없는 환경의 폰트 검색 로그 숨김
+import os  # 경로 및 환경 변수
+import platform  # 실행 환경 기록
+import statistics  # 중앙값 계산
+import sys  # 종료 코드
+import tempfile  # 벤치마크 전용 책 검색 캐시 폴더
+import time  # 시간 측정
+import warnings  # 한글 폰트가 없는 환경의 그래프 경고 숨김
+
+# 네트워크 없이 앱의 주요 경로(hot path) 실행 시간을 측정하는 벤치마크 모음
+#   python benchmarks.py                       # 측정 후 bench/results.json 저장, bench/baseline.json 과 비교
+#   python benchmarks.py --filter search       # 이름에 'search' 가 들어간 벤치마크만
+#   python benchmarks.py --update-baseline     # 현재 결과를 새 기준값으로 저장 (비교와 같은 조건이 되도록 --filter 없이 전체 실행)
+# 큐넷 일정은 bench/fixtures/qnet_*.html, 책 검색은 bench/fixtures/naver_book.json 을 반환하는 로컬 스텁 서버를 사용합니다.
+# 기준값보다 중앙값이 threshold 비율 이상 느려진 항목이 있으면 종료 코드 1 을 반환하므로 배포 전 확인에 사용할 수 있습니다.
+
+os.environ.setdefault('MPLBACKEND', 'Agg')  # 화면 없이 그래프 그리기
+
+BENCH_DIR = 'bench'
+FIXTURE_DIR = os.path.join(BENCH_DIR, 'fixtures')
+BASELINE_PATH = os.path.join(BENCH_DIR, 'baseline.json')
+RESULTS_PATH = os.path.join(BENCH_DIR, 'results.json')
+DEFAULT_REPEAT = 20  # 벤치마크별 기본 반복 횟수 (개별 벤치마크에서 줄일 수 있음)
+DEFAULT_THRESHOLD = 0.25  # 기준값 대비 25% 이상 느려지면 성능 저하로 판단
+MIN_REGRESSION_MS = 0.5  # 이보다 작은 차이는 측정 오차로 보고 무시
+STUB_LATENCY = 0.005  # 스텁 서버의 요청별 지연 시간 (초)
+
+BENCHMARKS = []  # (이름, 준비 함수, 반복 횟수)
+THRESHOLDS = {}  # 이름 -> 벤치마크별 성능 저하 판단 비율 (기본값보다 크게 잡은 것만)
+
+
+def benchmark(name, repeat=DEFAULT_REPEAT, threshold=None):
+    """
+    벤치마크 등록 데코레이터
+
+    등록하는 함수는 contextlib.ExitStack 을 받아 준비 작업을 하고, 측정할 인자 없는 함수를 반환합니다.
+    (서버 종료 등 정리 작업은 stack.callback 으로 등록)
+    threshold 를 주면 실행할 때마다 편차가 큰 벤치마크(그래프 그리기 등)만 --threshold 보다 큰 비율로 비교합니다.
+    """
+    def register(setup):
+        BENCHMARKS.append((name, setup, repeat))
+        if threshold is not None:
+            THRESHOLDS[name] = threshold
+        return setup
+    return register
+
+
+def measure(func, repeat, warmup=1):
+    """
+    func 를 warmup 번 실행한 뒤 repeat 번 실행 시간을 잰 목록 (ms)
+
+    앞서 실행한 벤치마크가 남긴 객체 때문에 측정 중 가비지 컬렉션이 끼어들지 않도록,
+    측정 전에 한 번 정리하고 측정하는 동안에는 끕니다. (timeit 과 같은 방식)
+    """
+    for _ in range(warmup):
+        func()
+    gc.collect()
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        timings = []
+        for _ in range(repeat):
+            began = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - began) * 1000)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return timings
+
+
+# ----------------------------------------------------------------------------
+# 합격률 데이터 (bar_graph / dataset / my_re)
+# ----------------------------------------------------------------------------
+
+@benchmark('bar_graph.parse_csv', repeat=5)
+def bench_parse_csv(stack):
+    """캐시 없이 원본 CSV 를 디코딩하여 정규화 테이블로 변환 (CSV 가 바뀐 뒤 첫 실행)"""
+    import dataset
+    from stats_table import StatsTable
+    return lambda: StatsTable.from_wide(dataset._read_csv(dataset.DEFAULT_CSV))
+
+
+@benchmark('bar_graph.load_and_split')
+def bench_load_and_split(stack):
+    """바이너리 캐시에서 테이블을 읽고 공유용으로 고정(표시 문자열, 보기별 색인 생성)한 뒤 보기로 나누기 (프로세스 시작 후 첫 호출)"""
+    import bar_graph as bg
+    bg.load_table()  # 캐시 파일이 없으면 먼저 만들어 둠
+
+    def run():
+        bg.load_table.cache_clear()
+        bg.load_views()
+    return run
+
+
+@benchmark('dataset.append_year', repeat=30)
+def bench_append_year(stack):
+    """새 연도(한 해, 6천여 계열)의 키 / 단위 검증 후 공유 테이블 뒤에 블록으로 이어 붙이기 (ingest_stats.py, 연도 추가 후 첫 실행)"""
+    import bar_graph as bg
+    import dataset
+    table = bg.load_table()
+    last = table.years[-1]
+    df = table.wide(years=[last]).rename(columns={f"{last} 년": f"{last + 1} 년"})  # 마지막 연도 값을 다음 해 데이터로 사용
+    return lambda: table.append_years(*dataset.align_years(table, df))
+
+
+@benchmark('my_re.load_data')
+def bench_my_re_load_data(stack):
+    """CertificationSearchApp._load_data (세션이 다시 실행될 때마다 호출, 공유 테이블 반환)"""
+    from my_re import CertificationSearchApp
+    app = CertificationSearchApp.__new__(CertificationSearchApp)  # 화면 구성 없이 메서드만 사용
+    app._load_data()
+    return app._load_data
+
+
+def _search_benchmark(keyword):
+    def setup(stack):
+        import bar_graph as bg
+        people_view, per_view = bg.load_views()
+        per_view.index  # 색인은 미리 만들어 둠 (프로세스당 한 번)
+        return lambda: per_view.search(keyword)
+    return setup
+
+
+for _keyword in ['기사', '정보처리']:
+    benchmark(f'search.filter[{_keyword}]')(_search_benchmark(_keyword))
+
+
+def _engine_benchmark(keyword):
+    def setup(stack):
+        import dataset
+        from search_engine import CertificationSearchEngine
+        engine = CertificationSearchEngine(dataset.load_table().series_names())
+        return lambda: engine.search(keyword, k=20)
+    return setup
+
+
+for _keyword in ['정보처리', 'ㅈㅂㅊㄹ', '정보처리기ㅅ', '정보처라기사']:
+    benchmark(f'search.engine[{_keyword}]')(_engine_benchmark(_keyword))
+
+
+@benchmark('format.values_all', repeat=10)
+def bench_format_all(stack):
+    """테이블 전체(3만여 개 값)의 표시 문자열 변환 (stats_table.format_values)"""
+    import bar_graph as bg
+    from stats_table import format_values
+    table = bg.load_table()
+    units = table.categories['단위'][table.codes['단위']]
+    return lambda: format_values(table.value[:, None], table.is_rate, units)
+
+
+@benchmark('format.display[기사]')
+def bench_format_display(stack):
+    """넓은 검색어('기사', 약 2천 행)의 표시용 데이터프레임 생성 (StatsTable.display)"""
+    import bar_graph as bg
+    table = bg.load_table()
+    table.labels  # 표시 문자열은 프로세스당 한 번 생성
+    series_ids = table.view('people').series_ids[table.view('people').index.rows('기사')]
+    return lambda: table.display(series_ids)
+
+
+# ----------------------------------------------------------------------------
+# 큐넷 시험 일정 (test_calender)
+# ----------------------------------------------------------------------------
+
+@benchmark('qnet.parse_schedule', repeat=10)
+def bench_parse_schedule(stack):
+    """저장된 큐넷 월별 HTML 픽스처 전체를 QnetScheduleApp.parse_schedule 로 파싱"""
+    from test_calender import QnetScheduleApp
+    app = QnetScheduleApp.__new__(QnetScheduleApp)
+    pages = []
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, 'qnet_*.html'))):
+        with open(path, 'r', encoding='utf-8') as f:
+            pages.append(f.read())
+    if not pages:
+        raise FileNotFoundError(f"{FIXTURE_DIR} 에 큐넷 HTML 픽스처가 없습니다.")
+    return lambda: [app.parse_schedule(html) for html in pages]
+
+
+@benchmark('qnet.schedule_store', repeat=10)
+def bench_schedule_store(stack):
+    """파싱된 12개월 일정으로 날짜 색인 저장소 만들기 + '다음 30일' 질의"""
+    import datetime
+    from schedule_store import ScheduleStore
+    from test_calender import QnetScheduleApp
+    app = QnetScheduleApp.__new__(QnetScheduleApp)
+    schedules = {}
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, 'qnet_*.html'))):
+        with open(path, 'r', encoding='utf-8') as f:
+            schedules[int(os.path.basename(path)[10:12])] = app.parse_schedule(f.read())
+
+    def run():
+        store = ScheduleStore.from_schedules(schedules, 2025)
+        store.upcoming(30, today=datetime.date(2025, 3, 1))
+    return run
+
+
+@benchmark('qnet.join_upcoming')
+def bench_join_upcoming(stack):
+    """ScheduleJoinIndex.upcoming - 자격증 선택 시 다가오는 일정 조회 (색인 지문 확인 포함, 색인은 미리 생성)"""
+    import datetime
+    import schedule_join
+    from test_calender import QnetScheduleApp
+    data_dir = stack.enter_context(tempfile.TemporaryDirectory())
+    app = QnetScheduleApp.__new__(QnetScheduleApp)
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, 'qnet_*.html'))):
+        with open(path, 'r', encoding='utf-8') as f:
+            schedule = app.parse_schedule(f.read())
+        with open(os.path.join(data_dir, f'test_schedule_{int(os.path.basename(path)[10:12])}.json'), 'w', encoding='utf-8') as f:
+            json.dump(schedule, f, ensure_ascii=False)
+    schedule_join.load_join_index(data_dir, 2025)  # 색인 생성 (측정하지 않음)
+    today = datetime.date(2025, 3, 1)
+    return lambda: schedule_join.load_join_index(data_dir, 2025).upcoming('정보처리산업기사', today=today, limit=10)
+
+
+# ----------------------------------------------------------------------------
+# 책 검색 (app_Re + 스텁 서버)
+# ----------------------------------------------------------------------------
+
+def _book_app(stack):
+    """스텁 서버와 벤치마크 전용 캐시를 사용하는 BookSearchApp (화면 구성 없이 메서드만 사용)"""
+    from stub_server import load_canned_books, start_stub_server
+    server = start_stub_server(latency=STUB_LATENCY,
+                               books=load_canned_books(os.path.join(FIXTURE_DIR, 'naver_book.json')))
+    stack.callback(server.shutdown)
+
+    import book_fetch
+    import result_cache
+    cache_dir = stack.enter_context(tempfile.TemporaryDirectory())
+    cache = result_cache.TwoTierCache(os.path.join(cache_dir, 'book_cache.sqlite3'), ttl=result_cache.BOOK_CACHE_TTL)
+    fetcher = book_fetch.BookFetcher("bench", "bench", url=server.url)
+    stack.callback(fetcher.close)
+
+    import app_Re
+    originals = app_Re.get_book_cache, app_Re.get_fetcher
+    app_Re.get_book_cache = lambda: cache  # 사용자의 실제 캐시 파일과 네이버 API 대신 사용
+    app_Re.get_fetcher = lambda *args, **kwargs: fetcher
+    stack.callback(lambda: setattr(app_Re, 'get_book_cache', originals[0]))
+    stack.callback(lambda: setattr(app_Re, 'get_fetcher', originals[1]))
+
+    app = app_Re.BookSearchApp.__new__(app_Re.BookSearchApp)
+    app.CLIENT_ID = app.CLIENT_SECRET = "bench"
+    return app, cache
+
+
+@benchmark('books.search_books_uncached', repeat=10)
+def bench_search_books(stack):
+    """BookSearchApp.search_books - 캐시를 비운 상태에서 스텁 서버로 100권 요청"""
+    app, cache = _book_app(stack)
+
+    def run():
+        cache.clear()
+        books = app.search_books("정보처리기사", max_results=100)
+        assert len(books) == 100, len(books)
+    return run
+
+
+@benchmark('books.search_books_cached')
+def bench_search_books_cached(stack):
+    """BookSearchApp.search_books - 메모리 캐시 적중"""
+    app, cache = _book_app(stack)
+    app.search_books("정보처리기사", max_results=100)
+    return lambda: app.search_books("정보처리기사", max_results=100)
+
+
+@benchmark('books.select_sorted')
+def bench_select_sorted(stack):
+    """BookRecords.filter_publisher + top - 정규화된 100권에서 출판사 필터 + 낮은 가격 순 상위 10권 (정렬 기준 / 개수 변경 시 다시 실행되는 부분)"""
+    from book_records import BookRecords
+    with open(os.path.join(FIXTURE_DIR, 'naver_book.json'), encoding='utf-8') as f:
+        records = BookRecords(json.load(f)['items'])
+
+    def run():
+        rows = records.filter_publisher('시대')  # app_Re.BookSearchApp 과 같은 순서
+        return [records.books[row] for row in records.top(10, '낮은 가격 순', rows)]
+    return run
+
+
+@benchmark('books.normalize')
+def bench_normalize(stack):
+    """BookRecords - 100권 검색 결과 정규화 (새 검색 결과마다 한 번)"""
+    from book_records import BookRecords
+    with open(os.path.join(FIXTURE_DIR, 'naver_book.json'), encoding='utf-8') as f:
+        books = json.load(f)['items']
+    return lambda: BookRecords(books)
+
+
+@benchmark('books.cards_html')
+def bench_cards_html(stack):
+    """book_cards.cards_html - 10권 카드를 하나의 HTML 블록으로 (책 검색 화면이 실행마다 만드는 부분)"""
+    from book_cards import cards_html
+    with open(os.path.join(FIXTURE_DIR, 'naver_book.json'), encoding='utf-8') as f:
+        books = json.load(f)['items'][:10]
+    return lambda: cards_html(books)
+
+
+# ----------------------------------------------------------------------------
+# 그래프 (streamlit_app_re)
+# ----------------------------------------------------------------------------
+
+def _chart_view(stack):
+    warnings.filterwarnings('ignore', message='Glyph .* missing from font')  # 한글 폰트가 없는 서버에서 글자마다 쌓이는 경고
+    logging.getLogger('matplotlib.font_manager').setLevel(logging.ERROR)
+    import bar_graph as bg
+    return bg.load_table().view('rate')  # 합격률 보기 (y축 0~100)
+
+
+@benchmark('viz.render_row', repeat=5, threshold=0.5)
+def bench_render_row(stack):
+    """streamlit_app_re.render_chart_grid - 한 행의 막대 그래프"""
+    from streamlit_app_re import render_chart_grid
+    view = _chart_view(stack)
+    years = view.year_labels()
+    row = view.search('정보처리기사').iloc[:1]
+    values = row[years].to_numpy(dtype=float)
+    return lambda: render_chart_grid(years, values, ["정보처리기사"], ["합격률 (%)"], 100)
+
+
+@benchmark('viz.render_page', repeat=3, threshold=0.5)
+def bench_render_page(stack):
+    """streamlit_app_re.render_chart_grid - 한 페이지(12개) 그래프를 한 장의 이미지로 (chart_page_image 의 캐시 미스 경로)"""
+    from streamlit_app_re import CHARTS_PER_PAGE, render_chart_grid
+    view = _chart_view(stack)
+    years = view.year_labels()
+    page_df = view.search('기사').iloc[:CHARTS_PER_PAGE]
+    values = page_df[years].to_numpy(dtype=float)
+    titles = (page_df['종목별'].astype(str) + " - " + page_df['항목'].astype(str)).tolist()
+    return lambda: render_chart_grid(years, values, titles, ["합격률 (%)"] * len(titles), 100)
+
+
+@benchmark('viz.page_image_cached', repeat=5)
+def bench_page_image_cached(stack):
+    """streamlit_app_re.chart_page_image - 캐시에 있는 페이지 이미지 (다시 그리지 않음)"""
+    from streamlit_app_re import CHARTS_PER_PAGE, chart_page_image
+    view = _chart_view(stack)
+    years = view.year_labels()
+    page_df = view.search('기사').iloc[:CHARTS_PER_PAGE]
+    chart_page_image(page_df, years, "합격률 (%)", "합격률 (%)", 100)  # 캐시 채우기
+    return lambda: chart_page_image(page_df, years, "합격률 (%)", "합격률 (%)", 100)
+
+
+# ----------------------------------------------------------------------------
+# 실행 / 비교
+# ----------------------------------------------------------------------------
+
+def _quiet_streamlit():
+    """Streamlit 없이 앱 메서드를 호출할 때 매번 나오는 경고(ScriptRunContext 없음) 숨김"""
+    import streamlit  # noqa: F401 - Streamlit 로거가 만들어진 뒤에 꺼야 적용됨
+    logging.getLogger('streamlit.runtime.scriptrunner_utils.script_run_context').disabled = True
+
+
+def run_benchmarks(name_filter=None, repeat=None):
+    """
+    등록된 벤치마크를 실행합니다.
+
+    Args:
+        name_filter (str): 이름에 이 문자열이 들어간 벤치마크만 실행
+        repeat (int): 반복 횟수 (기본값: 벤치마크별 설정)
+
+    Returns:
+        dict: {이름: {median_ms, min_ms, mean_ms, repeat}}
+    """
+    _quiet_streamlit()
+    results = {}
+    for name, setup, default_repeat in BENCHMARKS:
+        if name_filter and name_filter not in name:
+            continue
+        with contextlib.ExitStack() as stack:
+            func = setup(stack)
+            timings = measure(func, repeat or default_repeat)
+        results[name] = {
+            'median_ms': round(statistics.median(timings), 4),
+            'min_ms': round(min(timings), 4),
+            'mean_ms': round(statistics.fmean(timings), 4),
+            'repeat': len(timings),
+        }
+        print(f"  {name:<32} {results[name]['median_ms']:>10.3f} ms (최소 {results[name]['min_ms']:.3f})", flush=True)
+    return results
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    기준값과 중앙값을 비교합니다.
+
+    Returns:
+        dict: {이름: {baseline_ms, median_ms, ratio, status}} - status 는 'ok' / 'faster' / 'regression' / 'new'
+    """
+    comparison = {}
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            comparison[name] = {'baseline_ms': None, 'median_ms': result['median_ms'], 'ratio': None, 'status': 'new'}
+            continue
+        ratio = result['median_ms'] / base['median_ms'] if base['median_ms'] else float('inf')
+        diff = result['median_ms'] - base['median_ms']
+        limit = max(threshold, THRESHOLDS.get(name, threshold))  # 벤치마크별 비율은 더 느슨하게만 적용
+        if ratio > 1 + limit and diff > MIN_REGRESSION_MS:
+            status = 'regression'
+        elif ratio < 1 - limit and -diff > MIN_REGRESSION_MS:
+            status = 'faster'
+        else:
+            status = 'ok'
+        comparison[name] = {'baseline_ms': base['median_ms'], 'median_ms': result['median_ms'],
+                            'ratio': round(ratio, 3), 'status': status}
+    return comparison
+
+
+def environment():
+    """결과 파일에 함께 기록할 실행 환경"""
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+    }
+
+
+def _load_json(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json(path, data):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    os.replace(tmp_path, path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="네트워크 없이 앱의 주요 경로 실행 시간을 측정합니다.")
+    parser.add_argument('--filter', help="이름에 이 문자열이 들어간 벤치마크만 실행")
+    parser.add_argument('--repeat', type=int, help="반복 횟수 (기본값: 벤치마크별 설정)")
+    parser.add_argument('--output', default=RESULTS_PATH, help="결과 파일 (기본값: bench/results.json)")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="비교할 기준값 파일 (기본값: bench/baseline.json)")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help="성능 저하로 판단할 비율 (기본값: 0.25)")
+    parser.add_argument('--update-baseline', action='store_true', help="현재 결과를 기준값 파일에 저장")
+    parser.add_argument('--list', action='store_true', help="벤치마크 목록만 출력")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, _, repeat in BENCHMARKS:
+            print(f"{name} (반복 {repeat}회)")
+        return 0
+
+    print("벤치마크 실행 중...")
+    results = run_benchmarks(args.filter, args.repeat)
+    baseline_data = _load_json(args.baseline)
+    baseline = (baseline_data or {}).get('results', {})
+    comparison = compare(results, baseline, args.threshold) if baseline else {}
+    _write_json(args.output, {'environment': environment(), 'threshold': args.threshold,
+                              'results': results, 'comparison': comparison})
+    print(f"결과 저장: {args.output}")
+
+    if args.update_baseline:
+        merged = dict(baseline)
+        merged.update(results)  # --filter 로 일부만 실행한 경우 나머지 기준값은 유지
+        _write_json(args.baseline, {'environment': environment(), 'results': merged})
+        print(f"기준값 저장: {args.baseline}")
+        return 0
+
+    if not comparison:
+        print(f"기준값 파일({args.baseline})이 없어 비교하지 않았습니다. --update-baseline 으로 만들 수 있습니다.")
+        return 0
+
+    regressions = {name: item for name, item in comparison.items() if item['status'] == 'regression'}
+    for name, item in comparison.items():
+        if item['status'] in ('regression', 'faster'):
+            print(f"  [{item['status']}] {name}: {item['baseline_ms']:.3f} ms -> {item['median_ms']:.3f} ms "
+                  f"(x{item['ratio']:.2f})")
+    if regressions:
+        print(f"성능 저하 {len(regressions)}건 (기준값 대비 {args.threshold:.0%} 이상 느려짐)")
+        return 1
+    print("기준값 대비 성능 저하 없음")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
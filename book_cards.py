@@ -0,0 +1,102 @@
+import html  # 책 정보 HTML 이스케이프
+
+import streamlit as st  # Streamlit 라이브러리 import (웹 앱 개발)
+
+# 책 검색 결과 카드 렌더러
+#   limit = page_limit('books', (검색어, 출판사, 정렬), page_size)   # '더 보기'로 늘어난 표시 개수 (조건이 바뀌면 첫 페이지로)
+#   render_cards(books[:limit])                                       # 모든 카드를 한 번의 HTML 블록으로 출력
+#   load_more_button('books', page_size, limit, total)                # 남은 책이 있으면 '더 보기' 버튼
+# 책마다 컨테이너 / 컬럼 / 이미지 / 글자 위젯을 따로 만들지 않으므로, 표시하는 책 수와 관계없이 실행마다 보내는 요소 수가 일정합니다.
+# 표지 이미지는 브라우저가 화면에 보일 때 불러옵니다. (loading="lazy")
+
+CARD_STYLE = """
+<style>
+.book-cards { display: flex; flex-direction: column; gap: 0; }
+.book-card { display: flex; gap: 1.25rem; padding: 1rem 0; border-bottom: 1px solid rgba(128, 128, 128, 0.3); }
+.book-card .cover { flex: 0 0 100px; }
+.book-card .cover img { width: 100px; height: auto; border-radius: 4px; }
+.book-card .cover .no-cover { width: 100px; height: 140px; border-radius: 4px; background: rgba(128, 128, 128, 0.15); }
+.book-card .info { flex: 1; min-width: 0; }
+.book-card .info h3 { margin: 0 0 0.5rem 0; padding: 0; font-size: 1.25rem; }
+.book-card .info p { margin: 0.15rem 0; }
+</style>
+"""
+
+
+def _text(value, default='정보 없음'):
+    """HTML 에 넣을 문자열 (이스케이프, 없으면 default)"""
+    return html.escape(str(value)) if value not in (None, '') else default
+
+
+def card_html(book):
+    """
+    책 한 권의 카드 HTML
+
+    기존 카드와 같은 항목(표지, 제목, 저자, 출판사, 정가, 할인가, 책 보러가기 링크)을 표시하며,
+    API 값은 모두 이스케이프합니다.
+
+    Args:
+        book (dict): 네이버 책 검색 API 결과 한 건
+
+    Returns:
+        str: 카드 HTML
+    """
+    image = book.get('image')
+    cover = (f'<img src="{html.escape(image, quote=True)}" loading="lazy" decoding="async" alt="">' if image
+             else '<div class="no-cover"></div>')  # 표지가 없으면 빈 자리만 표시
+    price = book.get('price')
+    discount = book.get('discount', price)  # 할인가 (없으면 정가)
+    link = book.get('link')
+    link_html = (f'<p><a href="{html.escape(link, quote=True)}" target="_blank" rel="noopener noreferrer">📖 책 보러가기</a></p>'
+                 if link else '')
+    return (f'<div class="book-card"><div class="cover">{cover}</div><div class="info">'
+            f'<h3>{_text(book.get("title"), "")}</h3>'
+            f'<p><b>저자</b>: {_text(book.get("author"))}</p>'
+            f'<p><b>출판사</b>: {_text(book.get("publisher"))}</p>'
+            f'<p><b>정가</b>: {_text(price)}원</p>'
+            f'<p><b>할인가</b>: {_text(discount)}원</p>'
+            f'{link_html}</div></div>')
+
+
+def cards_html(books):
+    """여러 권의 카드를 하나의 HTML 블록으로 합칩니다. (스타일 포함)"""
+    return CARD_STYLE + '<div class="book-cards">' + ''.join(card_html(book) for book in books) + '</div>'
+
+
+def render_cards(books):
+    """책 카드 목록을 한 번의 st.html 호출로 출력합니다. (책 수와 관계없이 요소 하나)"""
+    st.html(cards_html(books))
+
+
+def page_limit(key, signature, page_size):
+    """
+    현재 표시할 책 수를 반환합니다.
+
+    '더 보기'를 누를 때마다 page_size 만큼 늘어나며, 검색어 / 필터 / 정렬 / 페이지 크기(signature)가 바뀌면 첫 페이지로 돌아갑니다.
+
+    Args:
+        key (str): 세션 상태 키 접두사 (화면마다 다르게)
+        signature (tuple): 표시 조건 (바뀌면 처음부터)
+        page_size (int): 한 페이지의 책 수
+
+    Returns:
+        int: 표시할 책 수
+    """
+    if st.session_state.get(f'{key}_signature') != (signature, page_size):
+        st.session_state[f'{key}_signature'] = (signature, page_size)
+        st.session_state[f'{key}_limit'] = page_size
+    return st.session_state[f'{key}_limit']
+
+
+def _load_more(key, page_size):
+    """'더 보기' 버튼 콜백: 표시할 책 수를 한 페이지만큼 늘립니다."""
+    st.session_state[f'{key}_limit'] = st.session_state.get(f'{key}_limit', page_size) + page_size
+
+
+def load_more_button(key, page_size, shown, total):
+    """남은 책이 있으면 표시 개수와 '더 보기' 버튼을, 없으면 표시 개수만 출력합니다."""
+    shown = min(shown, total)
+    if shown < total:
+        st.button(f"더 보기 ({shown} / {total})", key=f'{key}_more', on_click=_load_more, args=(key, page_size))
+    else:
+        st.caption(f"{total}권 모두 표시했어요.")
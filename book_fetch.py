@@ -0,0 +1,133 @@
+import os  # 환경 변수 (API 주소 변경용)
+from concurrent.futures import ThreadPoolExecutor  # 페이지 동시 요청용 작업자 풀
+import functools  # 프로세스 단위 객체 재사용
+import threading  # 작업자 풀 생성 잠금
+
+import requests  # HTTP 요청 라이브러리
+from requests.adapters import HTTPAdapter  # 연결 풀 크기 설정
+
+from fetch_policy import throttle  # 호스트별 요청 속도 제한
+from metrics import METRICS  # 요청 횟수 / 시간 기록
+
+# 네이버 책 검색 API 주소 (로컬 스텁 서버로 측정할 때는 NAVER_BOOK_URL 환경 변수로 변경)
+NAVER_BOOK_URL = os.getenv("NAVER_BOOK_URL", "https://openapi.naver.com/v1/search/book.json")
+MAX_DISPLAY = 100  # API 한 번 호출로 가져올 수 있는 최대 책 개수
+MAX_START = 1000  # API 가 허용하는 최대 검색 시작 위치
+DEFAULT_TIMEOUT = (3.05, 5)  # 요청별 (연결, 응답) 제한 시간 (초)
+
+
+class BookFetchError(Exception):
+    """네이버 책 검색 API 가 200 이 아닌 상태 코드를 반환한 경우 발생하는 예외"""
+    def __init__(self, status_code):
+        super().__init__(f"API 오류 발생 (상태 코드: {status_code})")
+        self.status_code = status_code
+
+
+class BookFetcher:
+    """
+    네이버 책 검색 API 페이지 요청 엔진 클래스
+
+    keep-alive 연결을 유지하는 requests.Session 하나로 요청을 보내고,
+    첫 페이지 이후의 페이지는 크기가 제한된 작업자 풀에서 동시에 요청합니다.
+    결과는 항상 원래 페이지 순서대로 합쳐지며, 빈 페이지가 나오면 그 뒤의 결과는 버립니다.
+    """
+    def __init__(self, client_id, client_secret, url=NAVER_BOOK_URL, max_workers=4, timeout=DEFAULT_TIMEOUT):
+        """
+        Args:
+            client_id (str): 네이버 API Client ID
+            client_secret (str): 네이버 API Client Secret
+            url (str): 책 검색 API 주소
+            max_workers (int): 동시에 요청할 최대 페이지 수
+            timeout (tuple): 요청별 (연결, 응답) 제한 시간 (초)
+        """
+        self.url = url
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update({
+            "X-Naver-Client-Id": client_id or "",  # 네이버 API Client ID를 요청 헤더에 포함
+            "X-Naver-Client-Secret": client_secret or "",  # 네이버 API Client Secret을 요청 헤더에 포함
+        })
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)  # 작업자 수만큼 연결을 재사용
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _pool(self):
+        """작업자 풀을 처음 필요할 때 만들어 반환합니다."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="book-fetch")
+            return self._executor
+
+    def fetch_page(self, query, start, display):
+        """
+        한 페이지를 요청합니다.
+
+        Args:
+            query (str): 검색어
+            start (int): 검색 시작 위치 (1부터)
+            display (int): 가져올 책 개수 (최대 100)
+
+        Returns:
+            dict: API 응답 JSON ('items', 'total' 등)
+
+        Raises:
+            BookFetchError: 상태 코드가 200 이 아닌 경우
+            requests.exceptions.RequestException: 연결 실패 또는 제한 시간 초과
+        """
+        params = {"query": query, "display": display, "start": start}
+        throttle(self.url)  # 네이버 API 초당 호출 제한을 넘지 않도록 차례를 기다림 (실패하지 않고 대기)
+        METRICS.incr('naver.requests')
+        with METRICS.span('naver.request'):
+            response = self.session.get(self.url, params=params, timeout=self.timeout)
+        if response.status_code != 200:
+            raise BookFetchError(response.status_code)
+        return response.json()
+
+    def fetch(self, query, max_results=100):
+        """
+        최대 max_results 개의 책 정보를 가져옵니다.
+
+        첫 페이지로 전체 결과 수(total)를 확인한 뒤, 나머지 페이지만 동시에 요청합니다.
+
+        Args:
+            query (str): 검색어
+            max_results (int): 가져올 최대 검색 결과 수
+
+        Returns:
+            list: 책 정보 리스트 (API 결과 순서 그대로)
+        """
+        page_size = min(MAX_DISPLAY, max_results)
+        first = self.fetch_page(query, 1, page_size)
+        books = first.get('items', [])
+        limit = min(max_results, int(first.get('total', max_results) or 0))
+        if len(books) < page_size or limit <= page_size:
+            return books[:limit]
+
+        starts = range(1 + page_size, min(limit, MAX_START) + 1, page_size)
+        futures = [self._pool().submit(self.fetch_page, query, start, min(page_size, limit - start + 1))
+                   for start in starts]
+        try:
+            for future in futures:  # 원래 순서대로 결과를 합침
+                items = future.result().get('items', [])
+                if not items:  # 빈 페이지가 나오면 더 이상 결과가 없음
+                    break
+                books.extend(items)
+        finally:
+            for future in futures:
+                future.cancel()  # 오류 또는 빈 페이지 이후 아직 시작하지 않은 요청은 취소
+        return books[:limit]
+
+    def close(self):
+        """작업자 풀과 연결을 정리합니다."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+
+
+@functools.lru_cache(maxsize=None)
+def get_fetcher(client_id, client_secret, url=NAVER_BOOK_URL):
+    """같은 API 키에 대해서는 프로세스 전체에서 하나의 BookFetcher(연결 풀)를 공유합니다."""
+    return BookFetcher(client_id, client_secret, url=url)
@@ -0,0 +1,130 @@
+import heapq  # 가격 기준 상위 k개 선택
+import threading  # 여러 세션에서 같은 결과 정규화 캐시에 접근
+from collections import OrderedDict  # 정규화 결과 LRU 캐시
+
+import numpy as np  # 가격 / 행 번호 배열
+
+from name_index import NameIndex  # 출판사 부분 문자열 색인
+from stats_table import freeze_arrays  # 여러 세션이 공유하는 배열을 읽기 전용으로
+
+SORT_ORDERS = ['기본', '낮은 가격 순', '높은 가격 순']  # 정렬 기준 (화면의 선택 상자와 같은 순서)
+RECORDS_CACHE_SIZE = 64  # 메모리에 보관할 정규화 결과 수
+
+
+def parse_price(text):
+    """'22,900' 같은 가격 문자열을 정수로 변환합니다. (비어 있거나 숫자가 아니면 0)"""
+    digits = str(text or '').replace(',', '').strip()
+    return int(digits) if digits.isdigit() else 0
+
+
+def isbn_key(book):
+    """
+    중복 제거용 ISBN 키
+
+    네이버 API 의 isbn 은 'ISBN10 ISBN13' 처럼 공백으로 나뉜 경우가 있어 마지막 값(ISBN13)을 사용하고,
+    ISBN 이 없으면 링크, 그것도 없으면 제목 + 출판사를 사용합니다.
+    """
+    parts = str(book.get('isbn') or '').split()
+    if parts:
+        return 'isbn:' + parts[-1]
+    if book.get('link'):
+        return 'link:' + book['link']
+    return f"title:{book.get('title', '')}|{book.get('publisher', '')}"
+
+
+class BookRecords:
+    """
+    정규화된 책 검색 결과 클래스
+
+    API 결과를 한 번만 훑어서 ISBN 으로 중복을 제거하고, 정렬에 쓰는 가격(할인가, 없으면 정가)을 정수 배열로,
+    출판사는 대소문자 구분 없는 부분 문자열 색인(NameIndex)으로 만들어 둡니다.
+    화면에서는 행 번호만 고르고(출판사 필터 -> 가격 상위 k개), 책 딕셔너리는 표시할 행만 꺼내므로
+    정렬 기준이나 표시 개수를 바꿔도 전체 결과를 다시 가공하지 않습니다.
+    배열은 여러 세션이 공유하므로 읽기 전용입니다.
+    """
+    def __init__(self, books):
+        """
+        Args:
+            books (list): 네이버 책 검색 API 결과 (책 딕셔너리 리스트, API 순서)
+        """
+        seen = set()
+        self.books = []  # 중복을 제거한 책 딕셔너리 (API 순서, 화면 표시용 원본 문자열 유지)
+        for book in books:
+            key = isbn_key(book)
+            if key not in seen:
+                seen.add(key)
+                self.books.append(book)
+        # 정렬 가격: 할인가 키가 있으면 할인가 (빈 값은 0), 없으면 정가 - 기존 화면의 정렬 기준과 같음
+        self.prices = np.array([parse_price(book['discount'] if 'discount' in book else book.get('price'))
+                                for book in self.books], dtype=np.int64)
+        self.publishers = [str(book.get('publisher') or '').casefold() for book in self.books]  # 소문자 출판사
+        self._publisher_index = NameIndex(self.publishers)
+        self._all_rows = np.arange(len(self.books))
+        freeze_arrays(self.prices, self._all_rows)
+
+    def __len__(self):
+        return len(self.books)
+
+    def filter_publisher(self, publisher):
+        """
+        출판사 이름에 publisher 를 포함하는 책의 행 번호를 API 순서대로 반환합니다. (대소문자 구분 없음, 비어 있으면 전체)
+
+        Returns:
+            np.ndarray: 행 번호 배열
+        """
+        if not publisher:
+            return self._all_rows
+        return self._publisher_index.rows(publisher)
+
+    def top(self, k, order='기본', rows=None):
+        """
+        정렬 기준에 따라 처음 k개 행 번호를 반환합니다.
+
+        가격 순은 전체를 정렬하지 않고 힙으로 k개만 고르며(O(n log k)), 가격이 같으면 API 순서를 유지합니다.
+
+        Args:
+            k (int): 반환할 행 수
+            order (str): 정렬 기준 ('기본', '낮은 가격 순', '높은 가격 순')
+            rows (np.ndarray): 후보 행 번호 (filter_publisher() 결과, 없으면 전체)
+
+        Returns:
+            list: 행 번호 리스트
+        """
+        rows = self._all_rows if rows is None else rows
+        if order == '낮은 가격 순':
+            return heapq.nsmallest(k, rows.tolist(), key=self.prices.__getitem__)
+        if order == '높은 가격 순':
+            return heapq.nlargest(k, rows.tolist(), key=self.prices.__getitem__)
+        return rows[:k].tolist()
+
+
+# 검색 결과별 정규화 캐시 (캐시 키 -> (원본 리스트, BookRecords), 모든 세션이 공유)
+_records_cache = OrderedDict()
+_records_lock = threading.Lock()
+
+
+def records_for(key, books):
+    """
+    검색 결과의 BookRecords 를 반환합니다. (같은 키의 같은 결과 리스트는 처음 한 번만 정규화)
+
+    책 검색 캐시는 메모리 적중 시 같은 리스트 객체를 돌려주므로, 리스트 객체가 바뀐 경우(새로 요청하거나 디스크에서 읽은 경우)에만 다시 만듭니다.
+
+    Args:
+        key (str): 책 검색 결과 캐시 키 (result_cache.book_cache_key)
+        books (list): 책 검색 결과
+
+    Returns:
+        BookRecords: 정규화된 검색 결과
+    """
+    with _records_lock:
+        entry = _records_cache.get(key)
+        if entry is not None and entry[0] is books:
+            _records_cache.move_to_end(key)
+            return entry[1]
+    records = BookRecords(books)
+    with _records_lock:
+        _records_cache[key] = (books, records)
+        _records_cache.move_to_end(key)
+        while len(_records_cache) > RECORDS_CACHE_SIZE:
+            _records_cache.popitem(last=False)  # 가장 오래 쓰지 않은 결과부터 제거
+    return records
@@ -1,9 +1,13 @@
 import streamlit as st  # Streamlit 라이브러리 import (웹 앱 개발)
-from app_re import BookSearchApp as bs  # app_re.py 파일에서 BookSearchApp 클래스를 bs라는 이름으로 import
+from app_Re import BookSearchApp as bs  # app_Re.py 파일에서 BookSearchApp 클래스를 bs라는 이름으로 import
 from my_re import CertificationSearchApp as cs  # my_re.py 파일에서 CertificationSearchApp 클래스를 cs라는 이름으로 import
 from test_calender import QnetScheduleApp as qs  # test_calender.py 파일에서 QnetScheduleApp 클래스를 qs라는 이름으로 import
 from streamlit_app_re import CertificationVisualizer as cv  # streamlit_app_re.py 파일에서 CertificationVisualizer 클래스를 cv라는 이름으로 import
-import bar_graph as bg  # bar_graph.py 파일을 bg라는 이름으로 import (데이터프레임 객체 포함)
+import bar_graph as bg  # bar_graph.py 파일을 bg라는 이름으로 import (합격률 데이터 로더, import 시에는 데이터를 읽지 않음)
+import pandas as pd  # 성능 지표 표 표시
+import time  # 미리 불러오기 시각 표시
+from metrics import METRICS, profile_run  # 구간별 실행 시간 / 횟수 기록 및 1회 프로파일링
+from warmup import start_warmup  # 인기 검색어 미리 불러오기 (프로세스당 한 번만 시작)
 
 # streamlit run certi_search.py
 
@@ -13,6 +17,7 @@ class PrepareCertification :
     st.set_page_config(page_title="자격증 정보 통합 검색", page_icon=" 통합")  # 웹 페이지의 제목과 아이콘 설정
 
     def main(self):
+        warmup = start_warmup()  # 인기 검색어의 책 / 일정 / 그래프를 백그라운드에서 미리 불러오는 스케줄러 (이미 시작했으면 그대로 사용)
         st.sidebar.header = '자격증명 검색'  # 사이드바에 헤더 텍스트 표시
         search_keyword = st.sidebar.text_input("검색할 자격증을 입력해주세요. ")  # 사이드바에 자격증 검색을 위한 텍스트 입력 위젯 생성
 
@@ -24,37 +29,79 @@ class PrepareCertification :
 
         st.title(f"{selected_tab}")  # 선택된 탭의 이름을 앱의 제목으로 표시
 
-        if selected_tab == "자격증 검색":
-            app = cs()  # my_re.py의 CertificationSearchApp 인스턴스 생성
-            app.keyword = search_keyword  # 검색 키워드를 CertificationSearchApp 객체의 keyword 속성에 할당
-            app.display_results()  # 자격증 검색 결과 표시 메서드 호출
-            if search_keyword:  # 검색어가 있는 경우
-                st.session_state.search_keyword = app.certi_name  # 선택된 자격증 이름을 세션 상태에 저장 (다른 탭에서 사용)
-        elif selected_tab == "합격 인원 및 합격률 보기":
-            visualizer = cv(bg.people_pr_df, bg.per_pr_df)  # streamlit_app_re.py의 CertificationVisualizer 인스턴스 생성 (데이터프레임 전달)
-            if st.session_state.search_keyword:  # 세션 상태에 검색 키워드가 있는 경우
-                visualizer.search_term = st.session_state.search_keyword  # CertificationVisualizer 객체의 search_term 속성에 할당
-            else:  # 세션 상태에 검색 키워드가 없는 경우 (초기 또는 검색어 삭제)
-                visualizer.search_term = search_keyword  # 현재 사이드바의 검색어를 CertificationVisualizer 객체의 search_term 속성에 할당
-            visualizer.display_results()  # 합격 인원 및 합격률 시각화 결과 표시 메서드 호출
-        elif selected_tab == "책 검색":
-            app = bs()  # app_re.py의 BookSearchApp 인스턴스 생성
-            if st.session_state.search_keyword:  # 세션 상태에 검색 키워드가 있는 경우
-                app.query = st.session_state.search_keyword  # BookSearchApp 객체의 query 속성에 할당
-            else:  # 세션 상태에 검색 키워드가 없는 경우
-                app.query = search_keyword  # 현재 사이드바의 검색어를 BookSearchApp 객체의 query 속성에 할당
-
-            # app_re.py의 검색 버튼 클릭 상태를 확인하여 결과 표시 (세션 상태를 이용)
-            if st.session_state.get('search_button_clicked', False):
-                app.display_book_results()
-        elif selected_tab == "시험일정 확인":
-            app = qs()  # test_calender.py의 QnetScheduleApp 인스턴스 생성
-            if st.session_state.search_keyword:  # 세션 상태에 검색 키워드가 있는 경우
-                app.tag = st.session_state.search_keyword  # QnetScheduleApp 객체의 tag 속성에 할당
-            else:  # 세션 상태에 검색 키워드가 없는 경우
-                app.tag = search_keyword  # 현재 사이드바의 검색어를 QnetScheduleApp 객체의 tag 속성에 할당
-
-            app.run()  # 큐넷 시험 일정 검색 앱 실행
+        profile_once = st.session_state.pop('profile_next_run', False)  # '프로파일링' 버튼을 누른 직후의 한 번만 측정
+        with profile_run(selected_tab, enabled=profile_once) as profile:
+            with METRICS.span(f'tab.{selected_tab}', tab=selected_tab, keyword=search_keyword):  # 탭별 전체 실행 시간 (탭 이름, 검색어 태그)
+
+                if selected_tab == "자격증 검색":
+                    app = cs()  # my_re.py의 CertificationSearchApp 인스턴스 생성
+                    app.keyword = search_keyword  # 검색 키워드를 CertificationSearchApp 객체의 keyword 속성에 할당
+                    app.display_results()  # 자격증 검색 결과 표시 메서드 호출
+                    if search_keyword:  # 검색어가 있는 경우
+                        if app.certi_name != st.session_state.get('search_keyword'):  # 새로 선택한 자격증이면 인기 검색어 순위에 반영 (다시 실행될 때마다 세지 않음)
+                            warmup.record(app.certi_name)
+                        st.session_state.search_keyword = app.certi_name  # 선택된 자격증 이름을 세션 상태에 저장 (다른 탭에서 사용)
+                elif selected_tab == "합격 인원 및 합격률 보기":
+                    people_view, per_view = bg.load_views()  # 이 탭을 처음 열 때만 데이터를 로드 (이후에는 프로세스 캐시 사용)
+                    visualizer = cv(people_view, per_view)  # streamlit_app_re.py의 CertificationVisualizer 인스턴스 생성 (합격 인원 / 합격률 보기 전달)
+                    if st.session_state.search_keyword:  # 세션 상태에 검색 키워드가 있는 경우
+                        visualizer.search_term = st.session_state.search_keyword  # CertificationVisualizer 객체의 search_term 속성에 할당
+                    else:  # 세션 상태에 검색 키워드가 없는 경우 (초기 또는 검색어 삭제)
+                        visualizer.search_term = search_keyword  # 현재 사이드바의 검색어를 CertificationVisualizer 객체의 search_term 속성에 할당
+                    visualizer.display_results()  # 합격 인원 및 합격률 시각화 결과 표시 메서드 호출
+                elif selected_tab == "책 검색":
+                    app = bs()  # app_re.py의 BookSearchApp 인스턴스 생성
+                    if st.session_state.search_keyword:  # 세션 상태에 검색 키워드가 있는 경우
+                        app.query = st.session_state.search_keyword  # BookSearchApp 객체의 query 속성에 할당
+                    else:  # 세션 상태에 검색 키워드가 없는 경우
+                        app.query = search_keyword  # 현재 사이드바의 검색어를 BookSearchApp 객체의 query 속성에 할당
+
+                    # app_re.py의 검색 버튼 클릭 상태를 확인하여 결과 표시 (세션 상태를 이용)
+                    if st.session_state.get('search_button_clicked', False):
+                        app.display_book_results()
+                elif selected_tab == "시험일정 확인":
+                    app = qs()  # test_calender.py의 QnetScheduleApp 인스턴스 생성
+                    if st.session_state.search_keyword:  # 세션 상태에 검색 키워드가 있는 경우
+                        app.tag = st.session_state.search_keyword  # QnetScheduleApp 객체의 tag 속성에 할당
+                    else:  # 세션 상태에 검색 키워드가 없는 경우
+                        app.tag = search_keyword  # 현재 사이드바의 검색어를 QnetScheduleApp 객체의 tag 속성에 할당
+
+                    app.run()  # 큐넷 시험 일정 검색 앱 실행
+
+        METRICS.flush()  # 구간별 백분위수와 횟수를 data/metrics.json 에 저장
+        self._display_metrics(profile.get('path'))
+        self._display_warmup(warmup.status())
+
+    def _display_metrics(self, profile_path):
+        """사이드바에 구간별 실행 시간 백분위수와 횟수를 표시하고, 1회 프로파일링 버튼을 제공하는 내부 메서드"""
+        with st.sidebar.expander("⏱️ 성능 측정"):
+            if profile_path:
+                st.success(f"프로파일 저장: {profile_path}")
+            st.button("🔬 다음 실행 프로파일링 (1회)", key="profile_button",
+                      on_click=lambda: st.session_state.update(profile_next_run=True))
+            snapshot = METRICS.snapshot()
+            if snapshot['spans']:
+                st.dataframe(pd.DataFrame.from_dict(snapshot['spans'], orient='index'))  # 구간별 횟수, p50/p90/p99 (ms)
+            if snapshot['counters']:
+                st.json(snapshot['counters'])  # 캐시 적중 / 외부 요청 횟수
+
+    def _display_warmup(self, status):
+        """사이드바에 인기 검색어 순위와 무엇을 언제 미리 불러왔는지 표시하는 내부 메서드"""
+        def clock(at):  # 시각 표시 (없으면 '-')
+            return time.strftime('%m-%d %H:%M:%S', time.localtime(at)) if at else '-'
+
+        with st.sidebar.expander("🔥 인기 검색어 미리 불러오기"):
+            st.caption(f"{'실행 중' if status['running'] else '중지됨'} · 다음 실행 {clock(status['next_run_at'])}")
+            if status['ranking']:
+                st.dataframe(pd.DataFrame(status['ranking'])[['keyword', 'score', 'count']], hide_index=True)  # 인기 검색어 순위
+            last_run = status['last_run']
+            if last_run:
+                st.caption(f"마지막 실행 {clock(last_run['started_at'])} · 준비 {len(last_run['warmed'])}건 · "
+                           f"예산 초과로 미룸 {len(last_run['skipped'])}건 · 오류 {len(last_run['errors'])}건")
+            if status['history']:
+                history = pd.DataFrame(status['history'])
+                history['at'] = history['at'].map(clock)
+                st.dataframe(history[['at', 'kind', 'target', 'detail', 'ms']], hide_index=True)  # 최근 미리 불러온 항목 (최근 항목부터)
 
 if __name__ == "__main__":
     app = PrepareCertification()  # PrepareCertification 클래스의 인스턴스 생성
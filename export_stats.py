@@ -0,0 +1,272 @@
+import argparse  # 명령줄 인자 처리
+import functools  # 작업 함수에 출력 폴더 인자 고정
+import hashlib  # 입력 데이터 지문(fingerprint) 계산
+import json  # 요약 및 매니페스트 저장
+import os  # 파일 경로 및 CPU 수 확인
+import re  # 파일 이름에 쓸 수 없는 문자 치환
+import time  # 처리량 측정
+import warnings  # 작업자 프로세스의 폰트 경고 숨김
+from concurrent.futures import ProcessPoolExecutor  # CPU 코어별 그래프 렌더링
+
+import numpy as np  # 연도별 값 배열
+import pandas as pd  # CSV 요약 작성
+
+import bar_graph as bg  # 합격률 데이터 및 집계 큐브 로더
+from stats_cube import OTHER_TIER, TIERS  # 등급 구분
+
+# 자격증별 연도 통계를 Streamlit 없이 한 번에 내보내는 명령줄 도구
+#   python export_stats.py --output export --workers 4
+# 자격증마다 <출력 폴더>/<등급>/<자격증>.png / .json / .csv 를 만들고, 전체 요약(summary.csv / summary.json)을 씁니다.
+# 5개 등급 밖(1급/2급/3급/단일등급)의 자격증('워드프로세서', '비서1급' 등)은 <출력 폴더>/기타/ 에 씁니다.
+# 입력 값과 렌더링 버전으로 만든 지문을 manifest.json 에 기록해 두고, 다시 실행할 때 지문이 같은 자격증은 건너뜁니다.
+
+RENDER_VERSION = 1  # 그래프/요약 형식이 바뀌면 올려서 기존 결과물을 모두 다시 만듦
+DEFAULT_OUTPUT = 'export'
+MANIFEST_NAME = 'manifest.json'
+CHART_COLUMNS = 4  # 자격증 한 장에 한 줄로 그릴 항목 수 (필기 4개 / 실기 4개)
+RATE_Y_MAX = 100  # 합격률 그래프의 y축 최대값
+UNSAFE_CHARS = re.compile(r'[\\/:*?"<>|\s]+')
+
+
+def safe_filename(name):
+    """자격증 이름을 파일 이름으로 쓸 수 있게 바꿉니다. ('소방설비기사(기계분야)' 는 그대로, 경로 구분자 등은 '_')"""
+    return UNSAFE_CHARS.sub('_', name).strip('_') or '_'
+
+
+def fingerprint(job):
+    """작업 입력(자격증, 항목, 연도, 값)과 렌더링 버전으로 만든 지문 (같으면 결과물도 같음)"""
+    digest = hashlib.sha256()
+    digest.update(json.dumps([RENDER_VERSION, job['name'], job['tier'], job['items'], job['years']],
+                             ensure_ascii=False).encode('utf-8'))
+    digest.update(np.ascontiguousarray(job['values'], dtype=np.float32).tobytes())
+    return digest.hexdigest()
+
+
+def build_jobs(cube, names, years=None, tier=None):
+    """
+    합격률 데이터의 종목별 이름 순서대로 자격증별 내보내기 작업 목록을 만듭니다.
+
+    등급 자격증은 큐브의 자격증 값을, 등급 밖 자격증은 큐브의 기타 자격증 값(OTHER_TIER)을 사용하며,
+    등급 머리행('기사', '1급' 등)과 분야 소계('건설', '경영.회계.사무' 등)는 건너뜁니다.
+
+    Args:
+        cube (StatsCube): bar_graph.load_cube() 결과
+        names (np.ndarray): 계열별 종목명 (bar_graph.load_table().series_names())
+        years (list): 내보낼 연도 (기본값: 전체)
+        tier (str): 내보낼 등급 (기본값: 전체, OTHER_TIER 이면 등급 밖 자격증만)
+
+    Returns:
+        list: 작업 딕셔너리 리스트 (key, name, tier, items, years, values, yoy, fingerprint)
+    """
+    years = cube.years if not years else [int(year) for year in years]
+    year_pos = [cube.years.index(year) for year in years]
+    certs = {}  # 자격증 이름 -> (등급, (항목, 연도) 값, 전년 대비)
+    for name, tier_pos, values, yoy in zip(cube.cert_names.tolist(), cube.cert_tier.tolist(), cube.cert_values, cube.cert_yoy):
+        certs[name] = (cube.tiers[tier_pos], values, yoy)
+    for name, values, yoy in zip(cube.other_names.tolist(), cube.other_values, cube.other_yoy):
+        certs[name] = (OTHER_TIER, values, yoy)
+
+    jobs = []
+    for name in pd.unique(np.asarray(names, dtype=str)).tolist():  # 원본에 처음 나오는 순서
+        if name not in certs:  # 등급 머리행 / 분야 소계
+            continue
+        tier_name, values, yoy = certs[name]
+        if tier and tier_name != tier:
+            continue
+        job = {
+            'key': f"{tier_name}/{safe_filename(name)}",
+            'name': name,
+            'tier': tier_name,
+            'items': cube.items,
+            'years': years,
+            'values': values[:, year_pos],  # (항목, 연도)
+            'yoy': yoy[:, year_pos],
+        }
+        job['fingerprint'] = fingerprint(job)
+        jobs.append(job)
+    return jobs
+
+
+def artifact_paths(output_dir, key):
+    """작업 키에 해당하는 결과물 경로 (png, json, csv)"""
+    base = os.path.join(output_dir, *key.split('/'))
+    return base + '.png', base + '.json', base + '.csv'
+
+
+def _write_atomic(path, data):
+    """임시 파일에 쓴 뒤 교체하여, 중간에 멈춰도 반쯤 쓴 결과물이 남지 않게 저장합니다."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _write_if_changed(path, data):
+    """내용이 같으면 쓰지 않습니다. (썼으면 True)"""
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    _write_atomic(path, data)
+    return True
+
+
+def _to_number(value):
+    """JSON 으로 쓸 값 (NaN 은 null, 정수 값은 int)"""
+    if np.isnan(value):
+        return None
+    return int(value) if float(value).is_integer() else round(float(value), 2)
+
+
+def _init_worker():
+    """작업자 프로세스 초기화: 화면 없이 그리는 Agg 백엔드와 한글 폰트 설정"""
+    import matplotlib
+    matplotlib.use('Agg')
+    warnings.filterwarnings('ignore', message='Glyph .* missing from font')  # 한글 폰트가 없는 서버에서 글자마다 경고가 쌓이지 않도록
+    import streamlit_app_re  # noqa: F401 - import 할 때 한글 폰트(rcParams)를 한 번 설정
+
+
+def export_one(job, output_dir):
+    """
+    자격증 하나의 그래프(PNG)와 요약(JSON/CSV)을 만듭니다. (작업자 프로세스에서 실행)
+
+    그래프는 Streamlit 화면과 같은 streamlit_app_re.render_chart_grid() 로 그립니다.
+
+    Returns:
+        tuple: (작업 키, 지문)
+    """
+    from streamlit_app_re import render_chart_grid
+
+    year_labels = [f"{year} 년" for year in job['years']]
+    is_rate = ['%' in item for item in job['items']]
+    png = render_chart_grid(year_labels, job['values'], job['items'],
+                            ["합격률 (%)" if rate else "인원 (명)" for rate in is_rate],
+                            [RATE_Y_MAX if rate else None for rate in is_rate], columns=CHART_COLUMNS)
+
+    summary = {
+        'name': job['name'],
+        'tier': job['tier'],
+        'years': job['years'],
+        'items': {item: {str(year): _to_number(value) for year, value in zip(job['years'], values)}
+                  for item, values in zip(job['items'], job['values'])},
+        'yoy': {item: {str(year): _to_number(value) for year, value in zip(job['years'], values)}
+                for item, values in zip(job['items'], job['yoy'])},
+    }
+    frame = pd.DataFrame(job['values'], index=pd.Index(job['items'], name='항목'), columns=year_labels)
+
+    png_path, json_path, csv_path = artifact_paths(output_dir, job['key'])
+    _write_atomic(png_path, png)
+    _write_atomic(json_path, json.dumps(summary, ensure_ascii=False, indent=2).encode('utf-8'))
+    _write_atomic(csv_path, frame.to_csv(float_format='%.10g').encode('utf-8-sig'))  # 엑셀에서 한글이 깨지지 않도록 BOM 포함
+    return job['key'], job['fingerprint']
+
+
+def load_manifest(output_dir):
+    """이전 실행의 매니페스트 {작업 키: 지문} (없으면 빈 딕셔너리)"""
+    try:
+        with open(os.path.join(output_dir, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+            return json.load(f).get('artifacts', {})
+    except (OSError, ValueError):
+        return {}
+
+
+def is_fresh(job, manifest, output_dir):
+    """지문이 이전 실행과 같고 결과물 파일이 모두 남아 있으면 True (다시 만들 필요 없음)"""
+    return (manifest.get(job['key']) == job['fingerprint']
+            and all(os.path.exists(path) for path in artifact_paths(output_dir, job['key'])))
+
+
+def write_summary(jobs, output_dir):
+    """전체 자격증의 가장 최근 연도 값과 전년 대비 증감을 summary.csv / summary.json 으로 씁니다. (바뀐 경우에만)"""
+    rows = []
+    for job in jobs:
+        row = {'등급': job['tier'], '종목별': job['name']}
+        for item, values, yoy in zip(job['items'], job['values'], job['yoy']):
+            row[item] = _to_number(values[-1])
+            row[f'{item} 전년 대비'] = _to_number(yoy[-1])
+        rows.append(row)
+    frame = pd.DataFrame(rows)
+    year = jobs[-1]['years'][-1] if jobs else None
+    changed = _write_if_changed(os.path.join(output_dir, 'summary.csv'), frame.to_csv(index=False, float_format='%.10g').encode('utf-8-sig'))
+    payload = {'year': year, 'certifications': rows}
+    changed |= _write_if_changed(os.path.join(output_dir, 'summary.json'),
+                                 json.dumps(payload, ensure_ascii=False, indent=2).encode('utf-8'))
+    return changed
+
+
+def run(output_dir=DEFAULT_OUTPUT, workers=None, years=None, tier=None, force=False, limit=None):
+    """
+    모든 자격증의 그래프와 요약을 내보냅니다.
+
+    Args:
+        output_dir (str): 출력 폴더
+        workers (int): 작업자 프로세스 수 (기본값: CPU 코어 수, 1 이면 현재 프로세스에서 실행)
+        years (list): 내보낼 연도 (기본값: 전체)
+        tier (str): 내보낼 등급 (기본값: 전체)
+        force (bool): True 이면 바뀌지 않은 자격증도 다시 만듦
+        limit (int): 내보낼 자격증 수 제한 (시험 실행용)
+
+    Returns:
+        dict: 처리 결과 (rendered, skipped, elapsed, per_second)
+    """
+    started = time.perf_counter()
+    cube = bg.load_cube()
+    jobs = build_jobs(cube, bg.load_table().series_names(), years, tier)[:limit]
+    manifest = load_manifest(output_dir)
+    todo = [job for job in jobs if force or not is_fresh(job, manifest, output_dir)]
+    workers = max(1, workers or os.cpu_count() or 1)
+
+    done = {}
+    export = functools.partial(export_one, output_dir=output_dir)
+    if workers == 1 or len(todo) <= 1:
+        _init_worker()
+        for job in todo:
+            key, digest = export(job)
+            done[key] = digest
+    else:
+        chunksize = max(1, len(todo) // (workers * 4))  # 작업 전달 비용을 줄이도록 묶어서 보냄
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            for key, digest in pool.map(export, todo, chunksize=chunksize):
+                done[key] = digest
+
+    manifest.update(done)
+    if not tier and not limit:  # 전체를 내보낸 경우에는 데이터에서 사라진 자격증을 매니페스트에서 제거
+        keys = {job['key'] for job in jobs}
+        manifest = {key: digest for key, digest in manifest.items() if key in keys}
+    manifest_data = json.dumps({'render_version': RENDER_VERSION, 'artifacts': manifest},
+                               ensure_ascii=False, indent=2, sort_keys=True).encode('utf-8')
+    _write_if_changed(os.path.join(output_dir, MANIFEST_NAME), manifest_data)
+    write_summary(jobs, output_dir)
+
+    elapsed = time.perf_counter() - started
+    return {
+        'rendered': len(done),
+        'skipped': len(jobs) - len(done),
+        'charts': len(done) * len(cube.items),
+        'elapsed': elapsed,
+        'per_second': len(done) / elapsed if elapsed else 0.0,
+        'workers': workers,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="자격증별 연도 통계 그래프와 요약을 일괄로 내보냅니다.")
+    parser.add_argument('--output', '-o', default=DEFAULT_OUTPUT, help="출력 폴더 (기본값: export)")
+    parser.add_argument('--workers', '-j', type=int, default=None, help="작업자 프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument('--years', nargs='+', type=int, help="내보낼 연도 (예: --years 2022 2023)")
+    parser.add_argument('--tier', choices=TIERS + [OTHER_TIER], help="내보낼 등급 ('기타': 1급/2급/3급/단일등급 자격증)")
+    parser.add_argument('--force', action='store_true', help="바뀌지 않은 자격증도 다시 만듭니다")
+    parser.add_argument('--limit', type=int, help="내보낼 자격증 수 제한")
+    args = parser.parse_args(argv)
+
+    result = run(args.output, args.workers, args.years, args.tier, args.force, args.limit)
+    print(f"자격증 {result['rendered']}개 생성 (그래프 {result['charts']}개), {result['skipped']}개 건너뜀 "
+          f"- {result['elapsed']:.1f}초, 초당 {result['per_second']:.1f}개 (작업자 {result['workers']}개)")
+    return result
+
+
+if __name__ == '__main__':
+    main()
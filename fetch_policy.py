@@ -0,0 +1,274 @@
+import threading  # 상태 보호 잠금 및 백그라운드 갱신
+import time  # 실패 시각 및 재시도 대기 시간 계산
+from concurrent.futures import ThreadPoolExecutor  # 백그라운드 갱신 작업자 풀
+from urllib.parse import urlparse  # 요청 주소의 호스트 확인
+
+from metrics import METRICS  # 합쳐진 / 실제로 보낸 요청 수, 대기 시간 기록
+
+# 호스트별 요청 속도 제한 (초당 요청 수, 한 번에 허용하는 최대 요청 수)
+# 목록에 없는 호스트(로컬 스텁 서버 등)는 제한하지 않습니다.
+HOST_RATES = {
+    'openapi.naver.com': (10.0, 10),  # 네이버 검색 API 초당 호출 제한
+    'www.q-net.or.kr': (2.0, 4),  # 큐넷 일정 페이지 (사이트 부담을 줄이기 위해 낮게 설정)
+}
+
+
+class CircuitOpenError(Exception):
+    """차단기가 열려 있어 외부 요청을 보내지 않은 경우 발생하는 예외"""
+
+
+class CircuitBreaker:
+    """
+    외부 사이트 요청 차단기 클래스
+
+    요청이 연속으로 failure_threshold 번 실패하면 차단기를 열고, reset_timeout 초 동안은 요청을 보내지 않고
+    바로 CircuitOpenError 를 발생시킵니다. 대기 시간이 지나면 한 번만 시험 요청을 허용하여(half-open)
+    성공하면 다시 닫고, 실패하면 다시 대기합니다.
+    """
+    def __init__(self, failure_threshold=3, reset_timeout=60, failure_exceptions=(Exception,)):
+        """
+        Args:
+            failure_threshold (int): 차단기를 열기까지 허용하는 연속 실패 횟수
+            reset_timeout (float): 차단기를 연 뒤 시험 요청을 허용하기까지의 대기 시간 (초)
+            failure_exceptions (tuple): 실패로 셀 예외 종류
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failure_exceptions = failure_exceptions
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        """현재 상태 ('closed', 'open', 'half-open')"""
+        with self._lock:
+            if self._opened_at is None:
+                return 'closed'
+            if self._probing or time.monotonic() - self._opened_at >= self.reset_timeout:
+                return 'half-open'
+            return 'open'
+
+    def _before_call(self):
+        """요청을 보내도 되는지 확인합니다. (열려 있으면 CircuitOpenError, 이 호출이 시험 요청이면 True)"""
+        with self._lock:
+            if self._opened_at is None:
+                return False
+            if self._probing or time.monotonic() - self._opened_at < self.reset_timeout:
+                raise CircuitOpenError("외부 요청이 연속으로 실패하여 잠시 중단되었습니다.")
+            self._probing = True  # 대기 시간이 지나면 시험 요청 하나만 허용
+            return True
+
+    def _after_call(self, probe, failed=False, counted=True):
+        """
+        호출 결과를 기록합니다.
+
+        시험 요청만 차단기를 닫거나 시험 상태를 풀 수 있습니다. 차단기가 열리기 전에 시작된 느린 요청이
+        시험 요청 도중에 끝나더라도 차단기 상태를 바꾸지 않습니다.
+
+        Args:
+            probe (bool): 이 호출이 시험 요청인지 여부 (_before_call() 의 반환값)
+            failed (bool): 실패로 세는 예외가 발생했는지 여부
+            counted (bool): 결과를 기록할지 여부 (실패로 세지 않는 예외는 False)
+        """
+        with self._lock:
+            if probe:
+                self._probing = False  # 시험 요청 종료 (실패로 세지 않는 예외면 닫지도 다시 열지도 않음)
+            elif self._opened_at is not None:
+                return  # 열리기 전에 시작된 요청의 결과는 무시
+            if not counted:
+                return
+            if not failed:
+                self._failures = 0
+                self._opened_at = None
+                return
+            self._failures += 1
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()  # 차단기 열기 (또는 시험 요청 실패 시 다시 대기)
+
+    def call(self, func, *args, **kwargs):
+        """
+        차단기를 거쳐 func 를 호출합니다.
+
+        Raises:
+            CircuitOpenError: 차단기가 열려 있는 경우
+        """
+        probe = self._before_call()
+        try:
+            result = func(*args, **kwargs)
+        except self.failure_exceptions:
+            self._after_call(probe, failed=True)
+            raise
+        except BaseException:
+            self._after_call(probe, counted=False)  # 실패로 세지 않는 예외는 그대로 전달 (시험 요청이면 시험 상태만 풂)
+            raise
+        self._after_call(probe)
+        return result
+
+
+class BackgroundRefresher:
+    """
+    오래된 캐시를 백그라운드에서 갱신하는 클래스 (stale-while-revalidate)
+
+    같은 키의 갱신이 이미 진행 중이면 새로 시작하지 않으며, 작업자 스레드 수는 max_workers 개로 제한됩니다.
+    갱신 작업 안에서는 Streamlit 출력을 하지 않아야 합니다.
+    """
+    def __init__(self, max_workers=2):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="refresh")
+        self._in_flight = set()
+        self._lock = threading.Lock()
+
+    def submit(self, key, func, *args):
+        """
+        key 에 대한 갱신이 진행 중이 아니면 func(*args) 를 백그라운드에서 실행합니다.
+
+        Returns:
+            bool: 새로 갱신을 시작했으면 True
+        """
+        with self._lock:
+            if key in self._in_flight:
+                return False
+            self._in_flight.add(key)
+        future = self._executor.submit(func, *args)
+        future.add_done_callback(lambda _: self._done(key))
+        return True
+
+    def _done(self, key):
+        with self._lock:
+            self._in_flight.discard(key)
+
+    def in_flight(self):
+        """진행 중인 갱신 키 목록"""
+        with self._lock:
+            return sorted(self._in_flight, key=str)
+
+
+class SingleFlight:
+    """
+    같은 키의 요청을 하나로 합치는 클래스 (single-flight)
+
+    키가 같은 요청이 이미 진행 중이면 새로 보내지 않고 그 요청이 끝나기를 기다려 같은 결과(또는 같은 예외)를 받습니다.
+    진행 중인 요청만 합치며, 결과를 보관하지는 않습니다. (결과 보관은 캐시가 담당)
+    합쳐진 요청과 실제로 보낸 요청 수는 '<name>.coalesced' / '<name>.issued' 횟수로 기록합니다.
+    """
+    class _Flight:
+        def __init__(self):
+            self.done = threading.Event()
+            self.result = None
+            self.error = None
+
+    def __init__(self, name):
+        """
+        Args:
+            name (str): 지표 이름 앞에 붙일 이름 ('books', 'qnet' 등)
+        """
+        self.name = name
+        self._flights = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, func, *args, **kwargs):
+        """
+        key 에 대해 진행 중인 요청이 없으면 func(*args, **kwargs) 를 실행하고, 있으면 그 결과를 기다립니다.
+
+        Returns:
+            func 의 반환값 (같은 키로 기다린 호출은 같은 객체를 받으므로 수정하지 말아야 함)
+
+        Raises:
+            func 가 발생시킨 예외 (기다린 호출에도 같은 예외 전달)
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = self._Flight()
+        if not leader:
+            METRICS.incr(f'{self.name}.coalesced')
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        METRICS.incr(f'{self.name}.issued')
+        try:
+            flight.result = func(*args, **kwargs)
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def in_flight(self):
+        """진행 중인 요청 키 목록"""
+        with self._lock:
+            return sorted(self._flights, key=str)
+
+
+class TokenBucket:
+    """
+    요청 속도 제한 클래스 (token bucket)
+
+    초당 rate 개씩 토큰이 채워지고 최대 capacity 개까지 쌓입니다. 토큰이 없으면 실패하지 않고 차례가 올 때까지 기다립니다.
+    (먼저 요청한 순서대로 토큰을 예약하므로 기다리는 요청끼리 순서가 바뀌지 않음)
+    """
+    def __init__(self, rate, capacity, name='rate'):
+        """
+        Args:
+            rate (float): 초당 요청 수
+            capacity (int): 한 번에 허용하는 최대 요청 수 (버스트)
+            name (str): 지표 이름 앞에 붙일 이름
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.name = name
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens):
+        """토큰을 예약하고 기다려야 할 시간(초)을 반환합니다."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens  # 음수이면 앞선 요청들이 예약한 만큼 기다림
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self, tokens=1):
+        """
+        토큰을 얻을 때까지 기다립니다.
+
+        Returns:
+            float: 기다린 시간 (초)
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            METRICS.incr(f'{self.name}.throttled')
+            METRICS.record(f'{self.name}.wait', wait * 1000)
+            time.sleep(wait)
+        return wait
+
+
+_host_limiters = {}
+_host_limiters_lock = threading.Lock()
+
+
+def throttle(url):
+    """
+    url 호스트의 요청 속도 제한(HOST_RATES)에 따라 차례가 올 때까지 기다립니다. (프로세스 전체에서 호스트별로 공유)
+
+    Returns:
+        float: 기다린 시간 (초, 제한이 없는 호스트는 0)
+    """
+    host = urlparse(url).hostname or ''
+    if host not in HOST_RATES:
+        return 0.0
+    with _host_limiters_lock:
+        limiter = _host_limiters.get(host)
+        if limiter is None:
+            rate, capacity = HOST_RATES[host]
+            limiter = _host_limiters[host] = TokenBucket(rate, capacity, name=f'rate.{host}')
+    return limiter.acquire()
@@ -0,0 +1,86 @@
+import argparse  # 명령줄 인자 처리
+import sys  # 검증 실패 시 종료 코드
+
+import numpy as np  # 연도별 결측값 수 계산
+
+import dataset  # 합격률 데이터 로더 / 연도별 추가 파일
+from metrics import METRICS  # 추가 소요 시간 기록
+from stats_table import year_label  # 연도 컬럼 이름
+
+# 새 연도 합격률 통계를 코드 수정 없이 추가하는 명령줄 도구
+#   python ingest_stats.py 2024_자격증.csv             # KOSIS 에서 내려받은 CSV (2024 년 컬럼 포함)
+#   python ingest_stats.py 2024_자격증.csv --dry-run   # 검증만 하고 저장하지 않음
+# 새 파일의 (종목별, 항목, 순번) 키와 단위를 기존 데이터와 맞춰 본 뒤, 새 연도만 data/passing_rate_2024.csv 로 저장하고
+# 바이너리 캐시(.npz)에는 새 연도 블록만 이어 붙입니다. 원본 CSV 와 기존 연도는 다시 읽거나 만들지 않습니다.
+# 화면과 내보내기 도구는 연도 목록을 데이터에서 찾으므로, 앱을 다시 시작하면 새 연도가 바로 표시됩니다.
+
+
+def ingest(source, csv_path=dataset.DEFAULT_CSV, cache_path=None, allow_missing=False, dry_run=False):
+    """
+    새 연도 통계 CSV 를 검증하고 저장된 데이터에 추가합니다.
+
+    Args:
+        source (str): KOSIS 형식 CSV 경로 ('종목별', '항목', '단위', 연도 컬럼)
+        csv_path (str): 원본 합격률 CSV 경로
+        cache_path (str): 캐시 파일 경로 (기본값: 원본 CSV 와 같은 위치의 .npz)
+        allow_missing (bool): 새 파일에 없는 기존 계열을 결측값으로 채울지 여부
+        dry_run (bool): 검증만 하고 저장하지 않을지 여부
+
+    Returns:
+        dict: 결과 요약 (years, skipped, files, missing, n_series, all_years)
+
+    Raises:
+        DatasetError: 새 파일이 기존 데이터와 맞지 않거나 추가할 새 연도가 없는 경우
+    """
+    table = dataset.load_table(csv_path, cache_path)
+    df = dataset.read_source(source)
+    years, values = dataset.align_years(table, df, allow_missing)
+    skipped = [year for year in table.years if year_label(year) in df.columns]
+    if not years:
+        raise dataset.DatasetError(f"추가할 새 연도가 없습니다. (기존: {table.years[0]}~{table.years[-1]}년)")
+
+    files = []
+    if not dry_run:
+        for year, block in zip(years, values):
+            files.append(dataset.write_increment(table, year, block, csv_path))
+        with METRICS.span('ingest.update_cache'):
+            table = dataset.load_table(csv_path, cache_path)  # 캐시에 새 연도 블록만 이어 붙임
+    return {
+        'years': years,
+        'skipped': skipped,
+        'files': files,
+        'missing': dict(zip(years, np.isnan(values).sum(axis=1).tolist())),
+        'n_series': table.n_series,
+        'all_years': list(table.years) + (years if dry_run else []),  # 저장했으면 다시 읽은 테이블에 이미 포함
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="새 연도 자격증 합격률 통계(KOSIS CSV)를 검증하고 추가합니다.")
+    parser.add_argument('source', help="KOSIS 에서 내려받은 CSV 파일")
+    parser.add_argument('--data', default=dataset.DEFAULT_CSV, help="원본 합격률 CSV (기본값: data/passing_rate.csv)")
+    parser.add_argument('--allow-missing', action='store_true', help="새 파일에 없는 기존 계열을 결측값으로 채웁니다")
+    parser.add_argument('--dry-run', action='store_true', help="검증만 하고 저장하지 않습니다")
+    args = parser.parse_args(argv)
+
+    try:
+        result = ingest(args.source, args.data, allow_missing=args.allow_missing, dry_run=args.dry_run)
+    except dataset.DatasetError as e:
+        print(f"추가 실패: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if result['skipped']:
+        print(f"이미 있는 연도는 건너뜀: {result['skipped']}")
+    for year in result['years']:
+        print(f"{year_label(year)}: 계열 {result['n_series']}개, 결측값 {result['missing'][year]}개")
+    if args.dry_run:
+        print("검증 통과 (--dry-run 이므로 저장하지 않음)")
+    else:
+        for path in result['files']:
+            print(f"저장: {path}")
+        print(f"사용 가능한 연도: {result['all_years']} - 앱을 다시 시작하면 새 연도가 표시됩니다.")
+    return result
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,433 @@
+import argparse  # 명령행 인자 처리
+import asyncio  # 여러 세션을 동시에 실행
+import functools  # 설치된 Streamlit 위젯 형식 확인 결과 재사용
+import json  # 결과 저장
+import os  # 파일 경로 / 환경 변수
+import random  # 세션별 검색어 / 월 선택
+import shutil  # 작업 폴더 준비
+import socket  # 빈 포트 찾기
+import subprocess  # Streamlit 서버 실행
+import sys  # 현재 파이썬 실행 파일
+import tempfile  # 작업 폴더
+import time  # 경과 시간 측정
+import urllib.request  # 서버 준비 확인
+
+import numpy as np  # 백분위수 계산
+
+from stub_server import load_canned_books, start_stub_server  # 네이버 / 큐넷 스텁 서버
+
+# 여러 사용자가 동시에 certi_search.py 를 사용하는 상황을 흉내 내는 부하 테스트
+#   python load_test.py                                      # 동시 세션 1, 2, 4, 8개
+#   python load_test.py --sessions 4,16 --iterations 3 --latency 0.3 --jitter 0.2 --error-rate 0.05
+#   python load_test.py --replay bench/recordings            # stub_server.py --record 로 기록한 실제 응답 재생
+#
+# 실제 Streamlit 서버(streamlit run certi_search.py)를 띄우고, 세션마다 브라우저처럼 웹소켓으로 접속하여
+# 위젯 값을 바꾸고 스크립트 실행이 끝날 때까지의 시간을 잽니다.
+# 네이버 책 검색 API 와 큐넷 일정 페이지는 로컬 스텁 서버(지연 / 오류 주입, 기록 재생)로 대신합니다.
+# 서버는 임시 작업 폴더에서 실행되므로 사용자의 data 폴더(일정 파일, 책 캐시)는 바뀌지 않습니다.
+#
+# 필요 패키지: websockets (웹소켓 클라이언트)
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(REPO_DIR, 'certi_search.py')
+FIXTURE_DIR = os.path.join(REPO_DIR, 'bench', 'fixtures')
+DATA_FILES = ('passing_rate.csv', 'passing_rate.npz')  # 작업 폴더로 복사할 데이터 (일정 / 책 캐시는 비운 상태로 시작)
+
+KEYWORDS = ['정보처리기사', '전기기사', '산업안전기사', '건축기사', '미용사', '한식조리기능사', '지게차운전기능사', '사회조사분석사']
+# certi_search.PrepareCertification.main 의 탭
+TAB_SEARCH, TAB_STATS, TAB_BOOKS, TAB_SCHEDULE = "자격증 검색", "합격 인원 및 합격률 보기", "책 검색", "시험일정 확인"
+TABS = [TAB_SEARCH, TAB_STATS, TAB_BOOKS, TAB_SCHEDULE]
+STEPS = ['open', 'search', 'stats', 'books.tab', 'books.search', 'schedule.tab', 'schedule.load']  # 한 세션의 단계
+
+DEFAULT_SESSIONS = '1,2,4,8'
+STEP_TIMEOUT = 120  # 한 단계(스크립트 1회 실행)의 제한 시간 (초)
+SERVER_START_TIMEOUT = 60  # 서버 준비 대기 시간 (초)
+RSS_INTERVAL = 0.2  # 서버 메모리 사용량 측정 간격 (초)
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def process_rss_mb(pid):
+    """프로세스의 현재 메모리 사용량(RSS, MB)을 반환합니다. (확인할 수 없으면 None)"""
+    try:
+        with open(f'/proc/{pid}/status', 'r') as f:  # Linux
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    try:
+        import psutil  # 선택 사항 (Windows / macOS)
+        return psutil.Process(pid).memory_info().rss / (1024 * 1024)
+    except Exception:
+        return None
+
+
+# ----------------------------------------------------------------------------
+# Streamlit 서버와 세션
+# ----------------------------------------------------------------------------
+
+def prepare_workdir(workdir):
+    """서버를 실행할 작업 폴더에 합격률 데이터만 복사합니다."""
+    data_dir = os.path.join(workdir, 'data')
+    os.makedirs(data_dir, exist_ok=True)
+    for name in DATA_FILES:
+        source = os.path.join(REPO_DIR, 'data', name)
+        if os.path.exists(source):
+            shutil.copy2(source, os.path.join(data_dir, name))  # 수정 시각을 유지하여 .npz 캐시를 그대로 사용
+
+
+class StreamlitServer:
+    """certi_search.py 를 실행하는 Streamlit 서버 프로세스 (스텁 서버 주소를 환경 변수로 전달)"""
+    def __init__(self, workdir, env):
+        self.workdir = workdir
+        self.port = _free_port()
+        self.url = f'http://127.0.0.1:{self.port}'
+        self.ws_url = f'ws://127.0.0.1:{self.port}/_stcore/stream'
+        command = [sys.executable, '-m', 'streamlit', 'run', APP_PATH,
+                   '--server.headless', 'true', '--server.address', '127.0.0.1', '--server.port', str(self.port),
+                   '--server.enableXsrfProtection', 'false', '--server.fileWatcherType', 'none',
+                   '--browser.gatherUsageStats', 'false']
+        self.log_path = os.path.join(workdir, 'server.log')
+        self._log = open(self.log_path, 'w', encoding='utf-8')
+        self.process = subprocess.Popen(command, cwd=workdir, env=env, stdout=self._log, stderr=subprocess.STDOUT)
+
+    def wait_ready(self, timeout=SERVER_START_TIMEOUT):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"Streamlit 서버가 종료되었습니다. ({self.log_path} 참고)")
+            try:
+                with urllib.request.urlopen(self.url + '/_stcore/health', timeout=1) as response:
+                    if response.status == 200:
+                        return
+            except OSError:
+                time.sleep(0.2)
+        raise TimeoutError(f"Streamlit 서버가 {timeout}초 안에 준비되지 않았습니다. ({self.log_path} 참고)")
+
+    def rss_mb(self):
+        return process_rss_mb(self.process.pid)
+
+    def counters(self):
+        """서버가 기록한 횟수 지표 (data/metrics.json 의 counters, 캐시 적중 / 합쳐진 요청 등)"""
+        try:
+            with open(os.path.join(self.workdir, 'data', 'metrics.json'), 'r', encoding='utf-8') as f:
+                return json.load(f).get('counters', {})
+        except (OSError, ValueError):
+            return {}
+
+    def stop(self):
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+        self._log.close()
+
+
+@functools.lru_cache(maxsize=None)
+def _value_based_widgets():
+    """
+    설치된 Streamlit 이 라디오 값을 선택한 문자열로, 숫자 입력 값을 실수로 주고받는지 확인합니다.
+
+    최근 버전은 선택지 번호 대신 값 자체(raw_value)를 사용하며, 이전 버전은 선택지 번호와 정수 값을 사용합니다.
+    (서버와 이 스크립트는 같은 Streamlit 설치를 사용)
+    """
+    from streamlit.proto.Radio_pb2 import Radio
+    return 'raw_value' in Radio.DESCRIPTOR.fields_by_name
+
+
+class SimulatedSession:
+    """
+    브라우저 한 탭처럼 Streamlit 서버에 웹소켓으로 접속하여 위젯을 조작하는 세션
+
+    스크립트가 실행될 때마다 화면에 나온 위젯(ID, 레이블, key)을 기억해 두고,
+    다음 실행 요청에는 브라우저와 같이 지금까지 바꾼 위젯 값과 누른 버튼을 함께 보냅니다.
+    """
+    def __init__(self, ws_url):
+        self.ws_url = ws_url
+        self.ws = None
+        self.widgets = {}  # 레이블 / key -> (위젯 ID, 위젯 종류, 요소 proto)
+        self.states = {}  # 위젯 ID -> WidgetState (사용자가 바꾼 값)
+
+    async def connect(self):
+        import websockets
+        self.ws = await websockets.connect(self.ws_url, subprotocols=['streamlit'], max_size=None)
+
+    async def close(self):
+        if self.ws is not None:
+            await self.ws.close()
+
+    async def rerun(self, trigger=None):
+        """
+        스크립트를 한 번 실행하고 끝날 때까지 기다립니다.
+
+        Args:
+            trigger (str): 누를 버튼의 레이블 또는 key
+
+        Returns:
+            tuple: (경과 시간 ms, 오류 메시지 리스트) - 예외 또는 st.error 가 있으면 오류로 기록
+        """
+        from streamlit.proto.Alert_pb2 import Alert
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        message = BackMsg()
+        client_state = message.rerun_script
+        client_state.query_string = ''
+        for state in self.states.values():
+            client_state.widget_states.widgets.append(state)
+        if trigger is not None:
+            button = client_state.widget_states.widgets.add()
+            button.id = self.widgets[trigger][0]
+            button.trigger_value = True
+
+        began = time.perf_counter()
+        await self.ws.send(message.SerializeToString())
+        widgets, errors = {}, []
+        while True:
+            forward = ForwardMsg()
+            forward.ParseFromString(await asyncio.wait_for(self.ws.recv(), STEP_TIMEOUT))
+            kind = forward.WhichOneof('type')
+            if kind == 'script_finished':
+                break
+            if kind != 'delta' or forward.delta.WhichOneof('type') != 'new_element':
+                continue
+            element = forward.delta.new_element
+            element_type = element.WhichOneof('type')
+            proto = getattr(element, element_type)
+            if element_type == 'exception':
+                errors.append(f"{proto.type}: {proto.message}")
+            elif element_type == 'alert' and proto.format == Alert.ERROR:
+                errors.append(proto.body)
+            widget_id = getattr(proto, 'id', '')
+            if widget_id.startswith('$$ID-'):  # 위젯 (텍스트 입력, 라디오, 버튼 등)
+                key = widget_id.rsplit('-', 1)[-1]
+                widgets[proto.label] = widgets[key] = (widget_id, element_type, proto)
+        elapsed = (time.perf_counter() - began) * 1000
+        self.widgets = widgets
+        mounted = {widget_id for widget_id, _, _ in widgets.values()}
+        self.states = {widget_id: state for widget_id, state in self.states.items() if widget_id in mounted}
+        return elapsed, errors
+
+    def set_value(self, name, value):
+        """레이블 또는 key 로 찾은 위젯의 값을 바꿉니다. (다음 rerun() 에 반영)"""
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+        widget_id, element_type, proto = self.widgets[name]
+        state = WidgetState(id=widget_id)
+        if element_type == 'text_input':
+            state.string_value = value
+        elif element_type == 'radio':
+            if _value_based_widgets():
+                state.string_value = value
+            else:
+                state.int_value = list(proto.options).index(value)
+        elif element_type == 'number_input':
+            if _value_based_widgets():
+                state.double_value = float(value)
+            else:
+                state.int_value = int(value)
+        else:
+            raise ValueError(f"지원하지 않는 위젯: {element_type}")
+        self.states[widget_id] = state
+
+
+async def run_scenario(ws_url, rng, think_time, record):
+    """
+    한 사용자의 흐름을 실행합니다: 접속 -> 자격증 검색 -> 합격률 탭 -> 책 검색 -> 시험 일정 불러오기
+
+    각 단계의 (단계 이름, 경과 시간 ms, 오류 리스트)를 record 에 추가합니다.
+    """
+    session = SimulatedSession(ws_url)
+    keyword = rng.choice(KEYWORDS)
+
+    async def step(name, action=None, trigger=None):
+        if action is not None:
+            action()
+        try:
+            elapsed, errors = await session.rerun(trigger)
+        except Exception as e:  # 연결 끊김, 제한 시간 초과 등
+            record.append((name, STEP_TIMEOUT * 1000.0, [f"{type(e).__name__}: {e}"]))
+            raise
+        record.append((name, elapsed, errors))
+        if think_time:
+            await asyncio.sleep(rng.uniform(0, think_time))
+
+    await session.connect()
+    try:
+        await step('open')
+        await step('search', lambda: session.set_value("검색할 자격증을 입력해주세요. ", keyword))
+        await step('stats', lambda: session.set_value('main_tab_selector', TAB_STATS))
+        await step('books.tab', lambda: session.set_value('main_tab_selector', TAB_BOOKS))
+        await step('books.search', trigger="검색하기")
+        await step('schedule.tab', lambda: session.set_value('main_tab_selector', TAB_SCHEDULE))
+        await step('schedule.load', lambda: session.set_value("월을 입력하세요 (예: 1):", rng.randint(1, 12)),
+                   trigger="일정 불러오기")
+    except Exception:
+        pass  # 실패한 단계는 record 에 오류로 남기고 다음 세션으로 진행
+    finally:
+        await session.close()
+
+
+# ----------------------------------------------------------------------------
+# 부하 단계 실행과 보고
+# ----------------------------------------------------------------------------
+
+def _percentiles(values):
+    if not values:
+        return {'p50_ms': None, 'p95_ms': None, 'p99_ms': None, 'max_ms': None}
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {'p50_ms': round(float(p50), 1), 'p95_ms': round(float(p95), 1), 'p99_ms': round(float(p99), 1),
+            'max_ms': round(float(np.max(values)), 1)}
+
+
+async def run_level(server, stub, sessions, iterations, think_time, seed):
+    """
+    동시 세션 sessions 개가 각각 iterations 번의 흐름을 실행하는 동안의 처리량, 지연 시간, 서버 메모리를 측정합니다.
+
+    Returns:
+        dict: 동시 세션 수, 처리량, 전체 / 단계별 백분위수, 오류 수, 스텁 요청 수, 서버 RSS
+    """
+    record = []
+    rss_samples = []
+    stub_before = dict(stub.request_counts), stub.error_count
+    counters_before = server.counters()
+
+    async def sample_rss():
+        while True:
+            rss_samples.append(server.rss_mb())
+            await asyncio.sleep(RSS_INTERVAL)
+
+    async def user(index):
+        rng = random.Random(f"{seed}-{sessions}-{index}")
+        for _ in range(iterations):
+            await run_scenario(server.ws_url, rng, think_time, record)
+
+    sampler = asyncio.create_task(sample_rss())
+    began = time.perf_counter()
+    await asyncio.gather(*(user(i) for i in range(sessions)))
+    duration = time.perf_counter() - began
+    sampler.cancel()
+    rss_samples.append(server.rss_mb())
+    rss_samples = [value for value in rss_samples if value is not None]
+
+    latencies = [elapsed for _, elapsed, _ in record]
+    by_step = {name: _percentiles([elapsed for step, elapsed, _ in record if step == name]) for name in STEPS}
+    upstream = {path: count - stub_before[0].get(path, 0) for path, count in stub.request_counts.items()}
+    counters = {name: count - counters_before.get(name, 0) for name, count in server.counters().items()}
+    error_messages = [message for _, _, errors in record for message in errors]
+    return {
+        'sessions': sessions,
+        'steps': len(record),
+        'duration_s': round(duration, 2),
+        'throughput_steps_s': round(len(record) / duration, 2),
+        'throughput_users_min': round(sessions * iterations / duration * 60, 1),
+        **_percentiles(latencies),
+        'errors': len(error_messages),
+        'error_samples': sorted(set(error_messages))[:5],
+        'upstream_requests': upstream,
+        'injected_errors': stub.error_count - stub_before[1],
+        'rss_mb': round(rss_samples[-1], 1) if rss_samples else None,
+        'rss_peak_mb': round(max(rss_samples), 1) if rss_samples else None,
+        'server_counters': {name: count for name, count in counters.items() if count},
+        'by_step': by_step,
+    }
+
+
+def _fmt(value, width, digits=0):
+    text = '-' if value is None else f"{value:.{digits}f}" if isinstance(value, float) else str(value)
+    return text.rjust(width)
+
+
+def print_report(levels):
+    """동시 세션 수별 결과를 표로 출력합니다."""
+    print()
+    print(f"{'세션':>4} {'단계/s':>7} {'사용자/분':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8} {'오류':>5} "
+          f"{'네이버':>6} {'큐넷':>5} {'RSS MB':>7} {'최대 RSS':>8}")
+    for level in levels:
+        upstream = level['upstream_requests']
+        print(f"{level['sessions']:>4} {_fmt(level['throughput_steps_s'], 7, 2)} {_fmt(level['throughput_users_min'], 8, 1)} "
+              f"{_fmt(level['p50_ms'], 8)} {_fmt(level['p95_ms'], 8)} {_fmt(level['p99_ms'], 8)} {_fmt(level['max_ms'], 8)} "
+              f"{level['errors']:>5} {upstream.get('/v1/search/book.json', 0):>6} {upstream.get('/crf021.do', 0):>5} "
+              f"{_fmt(level['rss_mb'], 7, 1)} {_fmt(level['rss_peak_mb'], 8, 1)}")
+    print()
+    print("단계별 p95 (ms)")
+    print(f"{'세션':>4} " + ' '.join(f"{name:>13}" for name in STEPS))
+    for level in levels:
+        print(f"{level['sessions']:>4} " + ' '.join(_fmt(level['by_step'][name]['p95_ms'], 13) for name in STEPS))
+    print()
+    print("외부 요청 (실제로 보냄 / 진행 중인 요청에 합쳐짐)")
+    for level in levels:
+        counters = level['server_counters']
+        print(f"{level['sessions']:>4} " + '  '.join(
+            f"{name} {counters.get(name + '.issued', 0)} / {counters.get(name + '.coalesced', 0)}" for name in ('books', 'qnet')))
+    for level in levels:
+        for message in level['error_samples']:
+            print(f"[세션 {level['sessions']}] 오류 예: {message[:120]}")
+
+
+def _parse_sessions(text):
+    return [int(value) for value in text.split(',') if value.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="동시 세션 수를 늘려 가며 certi_search.py 의 처리량, 지연 시간, 메모리를 측정합니다.")
+    parser.add_argument('--sessions', type=_parse_sessions, default=_parse_sessions(DEFAULT_SESSIONS),
+                        help=f"동시 세션 수 목록 (기본값: {DEFAULT_SESSIONS})")
+    parser.add_argument('--iterations', type=int, default=2, help="세션마다 반복할 사용자 흐름 수 (매번 새로 접속)")
+    parser.add_argument('--think', type=float, default=0.0, help="단계 사이 최대 대기 시간 (초, 0 ~ 값 사이 무작위)")
+    parser.add_argument('--latency', type=float, default=0.2, help="스텁 서버 요청별 지연 시간 (초)")
+    parser.add_argument('--jitter', type=float, default=0.1, help="스텁 서버 요청별 추가 무작위 지연 최대값 (초)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="스텁 서버가 500/503 오류를 반환할 비율 (0 ~ 1)")
+    parser.add_argument('--replay', metavar='DIR', help="stub_server.py --record 로 기록한 응답 폴더")
+    parser.add_argument('--seed', type=int, default=0, help="검색어 / 월 선택, 지연 / 오류 주입 난수 시드")
+    parser.add_argument('--workdir', help="서버 작업 폴더 (기본값: 임시 폴더, 실행 후 삭제)")
+    parser.add_argument('--output', '-o', help="결과를 저장할 JSON 파일")
+    parser.add_argument('--warmup', action='store_true',
+                        help="서버의 인기 검색어 미리 불러오기 스레드를 켬 (기본값: 끔, 측정 중 백그라운드 요청이 섞이지 않도록)")
+    args = parser.parse_args(argv)
+
+    try:
+        import websockets  # noqa: F401
+    except ImportError:
+        parser.error("websockets 패키지가 필요합니다. (pip install websockets)")
+
+    stub = start_stub_server(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate, seed=args.seed,
+                             books=load_canned_books(os.path.join(FIXTURE_DIR, 'naver_book.json')),
+                             qnet_dir=FIXTURE_DIR, recordings_dir=args.replay)
+    workdir = args.workdir or tempfile.mkdtemp(prefix='certi_load_')
+    prepare_workdir(workdir)
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [REPO_DIR, os.environ.get('PYTHONPATH')])),
+               NAVER_BOOK_URL=stub.url, QNET_SCHEDULE_URL=stub.qnet_url, CID='load-test', CSEC='load-test',
+               WARMUP_ENABLED='1' if args.warmup else '0')
+    server = StreamlitServer(workdir, env)
+    levels = []
+    try:
+        server.wait_ready()
+        print(f"서버 {server.url} (작업 폴더 {workdir}), 시작 RSS {_fmt(server.rss_mb(), 0, 1)} MB")
+        for sessions in args.sessions:
+            level = asyncio.run(run_level(server, stub, sessions, args.iterations, args.think, args.seed))
+            levels.append(level)
+            print(f"동시 세션 {sessions}: {level['steps']}단계 {level['duration_s']}초, "
+                  f"p95 {level['p95_ms']} ms, 오류 {level['errors']}, RSS {level['rss_mb']} MB")
+    finally:
+        server.stop()
+        stub.shutdown()
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    print_report(levels)
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'args': {key: value for key, value in vars(args).items() if key != 'output'},
+                       'levels': levels}, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
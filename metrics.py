@@ -0,0 +1,153 @@
+import contextlib  # 측정 구간(span) 컨텍스트 매니저
+import cProfile  # 한 번의 실행(rerun) 프로파일링
+import functools  # 함수 측정 데코레이터
+import json  # 지표 파일 저장
+import os  # 파일 경로
+import pstats  # 프로파일 요약 텍스트
+import threading  # 여러 세션(스레드)에서 동시에 기록
+import time  # 경과 시간 측정
+from collections import deque  # 최근 측정값 보관 (개수 제한)
+
+import numpy as np  # 백분위수 계산
+
+# 앱 전체(모든 세션)에서 공유하는 성능 지표 모음
+#   with METRICS.span('books.fetch', keyword=query): ...   # 구간 실행 시간 기록
+#   METRICS.incr('books.cache_hit')                        # 횟수 기록 (캐시 적중, 외부 요청 등)
+# 구간별 백분위수(p50/p90/p99)와 횟수는 METRICS.flush() 로 data/metrics.json 에 저장합니다.
+
+METRICS_PATH = os.path.join('data', 'metrics.json')  # 지표 파일
+PROFILE_DIR = os.path.join('data', 'profiles')  # cProfile 결과 폴더
+MAX_SAMPLES = 1000  # 구간별로 백분위수 계산에 사용할 최근 측정값 수
+MAX_RECENT = 200  # 지표 파일에 함께 기록할 최근 구간 수 (태그 포함)
+PERCENTILES = (50, 90, 99)
+
+
+class Metrics:
+    """
+    구간 실행 시간(span)과 횟수(counter)를 모으는 클래스
+
+    구간마다 최근 MAX_SAMPLES 개의 실행 시간(ms)만 보관하여 메모리 사용량이 일정하며,
+    태그(탭 이름, 검색어 등)가 붙은 최근 구간은 MAX_RECENT 개까지 따로 보관합니다.
+    """
+    def __init__(self, max_samples=MAX_SAMPLES, max_recent=MAX_RECENT):
+        self.max_samples = max_samples
+        self._samples = {}  # 구간 이름 -> deque(ms)
+        self._totals = {}  # 구간 이름 -> 전체 실행 횟수
+        self._counters = {}
+        self._recent = deque(maxlen=max_recent)
+        self._lock = threading.Lock()
+
+    def record(self, name, elapsed_ms, **tags):
+        """구간 실행 시간(ms)을 기록합니다."""
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self.max_samples)
+            samples.append(elapsed_ms)
+            self._totals[name] = self._totals.get(name, 0) + 1
+            if tags:
+                self._recent.append({'name': name, 'ms': round(elapsed_ms, 3), 'at': round(time.time(), 3), **tags})
+
+    @contextlib.contextmanager
+    def span(self, name, **tags):
+        """with 블록의 실행 시간을 name 구간으로 기록합니다. (예외가 나도 기록하고 'error' 태그를 붙임)"""
+        began = time.perf_counter()
+        try:
+            yield
+        except BaseException as e:
+            tags['error'] = type(e).__name__
+            raise
+        finally:
+            self.record(name, (time.perf_counter() - began) * 1000, **tags)
+
+    def timed(self, name):
+        """함수 실행 시간을 name 구간으로 기록하는 데코레이터"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def incr(self, name, n=1):
+        """횟수를 n 만큼 늘립니다."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def snapshot(self):
+        """
+        현재 지표를 딕셔너리로 반환합니다.
+
+        Returns:
+            dict: {'spans': {이름: {count, p50_ms, p90_ms, p99_ms, max_ms, mean_ms}}, 'counters': {...}, 'recent': [...]}
+        """
+        with self._lock:
+            samples = {name: np.array(values, dtype=float) for name, values in self._samples.items()}
+            totals = dict(self._totals)
+            counters = dict(self._counters)
+            recent = list(self._recent)
+        spans = {}
+        for name, values in sorted(samples.items()):
+            summary = {'count': totals[name]}
+            for p, value in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+                summary[f'p{p}_ms'] = round(float(value), 3)
+            summary['max_ms'] = round(float(values.max()), 3)
+            summary['mean_ms'] = round(float(values.mean()), 3)
+            spans[name] = summary
+        return {'updated_at': round(time.time(), 3), 'spans': spans, 'counters': dict(sorted(counters.items())),
+                'recent': recent}
+
+    def flush(self, path=METRICS_PATH):
+        """현재 지표를 JSON 파일로 저장합니다. (임시 파일에 쓴 뒤 교체)"""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.snapshot(), f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
+    def reset(self):
+        """모든 지표를 지웁니다."""
+        with self._lock:
+            self._samples.clear()
+            self._totals.clear()
+            self._counters.clear()
+            self._recent.clear()
+
+
+METRICS = Metrics()  # 프로세스 전체에서 공유
+
+
+@contextlib.contextmanager
+def profile_run(label, enabled=True, profile_dir=PROFILE_DIR):
+    """
+    with 블록을 cProfile 로 측정하여 .prof 파일과 누적 시간 상위 40개 함수 요약(.txt)을 저장합니다.
+
+    enabled 가 False 이면 아무것도 하지 않습니다. (평소에는 꺼 두고 한 번의 실행만 측정할 때 사용)
+    저장된 파일은 python -m pstats <파일> 또는 snakeviz 등으로 볼 수 있습니다.
+
+    Args:
+        label (str): 파일 이름에 붙일 이름 (탭 이름 등)
+        enabled (bool): 프로파일링 여부
+        profile_dir (str): 저장 폴더
+
+    Yields:
+        dict: 블록이 끝난 뒤 'path' 키에 저장된 .prof 파일 경로가 들어감
+    """
+    result = {}
+    if not enabled:
+        yield result
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield result
+    finally:
+        profiler.disable()
+        os.makedirs(profile_dir, exist_ok=True)
+        safe_label = ''.join(ch if ch.isalnum() else '_' for ch in label)
+        base = os.path.join(profile_dir, f"{time.strftime('%Y%m%d-%H%M%S')}_{safe_label}")
+        profiler.dump_stats(base + '.prof')
+        with open(base + '.txt', 'w', encoding='utf-8') as f:
+            pstats.Stats(profiler, stream=f).sort_stats('cumulative').print_stats(40)
+        result['path'] = base + '.prof'
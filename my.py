@@ -1,15 +1,23 @@
 import streamlit as st
 import pandas as pd
+from name_index import NameIndex
+from stats_table import format_values
 
-# 데이터 로드 함수
-@st.cache_data
+# 데이터 로드 함수 (모든 세션이 복사 없이 같은 데이터프레임을 공유, 수정하지 않고 읽기만 함)
+@st.cache_resource
 def load_data():
     df = pd.read_csv("data\자격증.csv", encoding='cp949')
     df = df.drop(columns=[col for col in df.columns if "Unnamed" in col])
     df.columns = df.columns.str.strip()  # 컬럼명 공백 제거
     return df
 
+# 자격증 이름 색인 (모든 세션이 같은 객체를 공유)
+@st.cache_resource
+def load_index():
+    return NameIndex(load_data()['종목별'])
+
 df = load_data()
+index = load_index()
 
 # 앱 제목
 st.title("📘 자격증 종목 통계 검색")
@@ -19,7 +27,7 @@ st.markdown("자격증 **종목명**을 입력하면 연도별 응시 및 합격
 keyword = st.text_input("🔍 자격증(종목) 이름을 입력하세요:", placeholder="예: 정보처리")
 
 if keyword:
-    filtered = df[df['종목별'].str.contains(keyword, case=False, na=False)].copy()
+    filtered = df.iloc[index.rows(keyword)].copy()  # 검색 결과 행만 복사 (표시 문자열로 바꿔도 공유 데이터는 그대로)
 
     if not filtered.empty:
         st.success(f"✅ '{keyword}' 관련 항목 {len(filtered)}건이 검색되었습니다.")
@@ -27,20 +35,10 @@ if keyword:
         # 연도 컬럼 찾기
         year_cols = [col for col in df.columns if '년' in col]
 
-        # 수치에 단위 또는 % 기호 붙이기
-        def format_value(x, 항목, 단위):
-            if pd.isna(x):
-                return "-"
-            try:
-                if "합격률" in 항목:
-                    return f"{float(x):.1f}%"
-                else:
-                    return f"{int(x):,}{단위}"
-            except:
-                return str(x)
-
-        for col in year_cols:
-            filtered[col] = filtered.apply(lambda row: format_value(row[col], row['항목'], row['단위']), axis=1)
+        # 수치에 단위 또는 % 기호 붙이기 (모든 연도 컬럼을 한 번에 변환)
+        is_rate = filtered['항목'].str.contains('합격률').to_numpy()
+        labels = format_values(filtered[year_cols].to_numpy(dtype=float), is_rate, filtered['단위'].to_numpy())
+        filtered[year_cols] = labels
 
         # 표시 컬럼 구성
         display_cols = ['종목별', '항목'] + year_cols
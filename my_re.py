@@ -1,10 +1,18 @@
 import streamlit as st  # Streamlit 라이브러리 import (웹 앱 개발)
-import pandas as pd  # Pandas 라이브러리 import (데이터 조작 및 분석)
+import numpy as np  # 계열 번호 배열 처리
+import bar_graph as bg  # 프로세스 전체에서 공유하는 합격률 테이블
+from metrics import METRICS  # 검색 시간 기록
+from search_engine import CertificationSearchEngine  # 자격증 이름 순위 검색 엔진 (초성/오타 검색 지원)
+from schedule_join import load_join_index  # 자격증 -> 큐넷 시험 일정 조인 색인
+from schedule_store import ScheduleStore  # 일정 표시용 데이터프레임 변환
 
 # streamlit run my_re.py
 
 class CertificationSearchApp:
     """자격증 종목 통계 검색 앱 클래스"""
+    TOP_K = 20  # 자격증 선택 Selectbox에 표시할 최대 검색 결과 수
+    UPCOMING_LIMIT = 10  # 표시할 다가오는 시험 일정 수
+
     def __init__(self):
         """
         초기화 메서드
@@ -13,75 +21,104 @@ class CertificationSearchApp:
         """
         st.title("📘 자격증 종목 통계 검색")  # 앱 제목 표시
         st.markdown("자격증 **종목명**을 입력하면 연도별 응시 및 합격률 데이터를 확인할 수 있습니다.")  # 앱 설명 Markdown 텍스트 표시
-        self.df = self._load_data()  # 데이터를 로드하여 클래스 변수에 저장
+        self.table = self._load_data()  # 데이터를 로드하여 클래스 변수에 저장 (정규화 테이블, 실패 시 None)
+        self.engine = self._load_engine() if self.table is not None else None  # 자격증 이름 검색 엔진 (프로세스 전체에서 한 번만 생성)
         # self.keyword = st.text_input("🔍 자격증(종목) 이름을 입력하세요:", placeholder="예: 정보처리")  # 사용자로부터 검색어를 입력받는 텍스트 입력 위젯 생성 (certi_search.py에서 처리)
         self.keyword = None # 검색 키워드를 초기화 (certi_search.py에서 값을 할당할 예정)
         self.certi_name = None # 선택된 자격증명을 저장할 변수 초기화
 
-    @st.cache_data
+    @st.cache_resource
     def _load_data(_self):  # 첫 번째 인자 이름에 밑줄 추가 (관례)
         """
         데이터를 로드하고 전처리하는 내부 메서드
 
-        CSV 파일을 읽어들이고, 불필요한 컬럼을 제거하며, 컬럼명 공백을 정리합니다.
-        @st.cache_data 데코레이터를 사용하여 함수 실행 결과를 캐싱하여 앱 성능을 향상시킵니다.
+        bar_graph.load_table()이 바이너리 캐시(data/passing_rate.npz)에서 읽은 테이블을 그대로 사용합니다.
+        (자격증.csv 와 동일한 내용의 passing_rate.csv 를 한 번만 디코딩하여 캐시로 변환하며,
+        불필요한 컬럼 제거와 컬럼명 공백 정리도 캐시를 만들 때 처리됩니다.)
+        데이터는 원본처럼 연도를 컬럼으로 펼치지 않고, 범주 코드와 float32 값으로 이루어진 정규화 테이블로 유지합니다.
+        @st.cache_resource 데코레이터를 사용하여 모든 세션이 같은 읽기 전용 테이블을 공유합니다.
+        (@st.cache_data 는 실행할 때마다 테이블 전체를 역직렬화한 복사본을 반환하므로 세션 수만큼 메모리를 사용합니다.)
 
         Returns:
-            pd.DataFrame: 로드 및 전처리된 데이터프레임
+            StatsTable: 로드 및 전처리된 정규화 테이블 (로드 실패 시 None)
         """
         try:
-            df = pd.read_csv("data\자격증.csv", encoding='cp949')  # CSV 파일 읽기 (인코딩 지정: CP949는 한글 Windows 환경에서 주로 사용)
+            table = bg.load_table()  # 바이너리 캐시에서 읽기 (원본 CSV가 바뀐 경우에만 CP949 디코딩 후 캐시 재생성, 합격률 탭과 같은 객체)
             st.success("✅ 자격증 데이터 로드 성공!") # 데이터 로드 성공 메시지 표시
         except FileNotFoundError:
-            st.error("❌ 자격증.csv 파일을 찾을 수 없습니다. 앱과 동일한 경로에 파일이 있는지 확인해주세요.")
-            return pd.DataFrame() # 파일이 없으면 빈 데이터프레임 반환
+            st.error("❌ 자격증 데이터(passing_rate.csv) 파일을 찾을 수 없습니다. 앱과 동일한 경로에 파일이 있는지 확인해주세요.")
+            return None # 파일이 없으면 None 반환
         except Exception as e:
             st.error(f"❌ 데이터 로드 중 오류 발생: {e}")
-            return pd.DataFrame() # 오류 발생 시 빈 데이터프레임 반환
+            return None # 오류 발생 시 None 반환
+
+        return table  # 전처리된 정규화 테이블 반환
+
+    @st.cache_resource
+    def _load_engine(_self):
+        """
+        자격증 이름(종목별) 검색 엔진을 만드는 내부 메서드
 
-        df = df.drop(columns=[col for col in df.columns if "Unnamed" in col], errors='ignore')  # "Unnamed"를 포함하는 불필요한 컬럼 제거 (errors='ignore'는 해당 컬럼이 없어도 오류를 발생시키지 않음)
-        df.columns = df.columns.str.strip()  # 컬럼명 좌우 공백 제거
-        return df  # 전처리된 데이터프레임 반환
+        고유한 종목명마다 초성/자모 분해 문자열과 n-gram 색인을 미리 만들어 둡니다.
+        @st.cache_resource 데코레이터를 사용하여 한 번만 만들고, 모든 세션이 복사 없이 같은 객체를 공유합니다.
 
-    def _format_value(self, x, 항목, 단위):
+        Returns:
+            CertificationSearchEngine: 자격증 이름 검색 엔진
+        """
+        return CertificationSearchEngine(bg.load_table().series_names())
+
+    def _stats_frame(self, certi_name):
         """
-        수치 데이터에 단위 또는 % 기호를 붙이는 내부 메서드
+        선택한 자격증의 연도별 통계를 표시용 데이터프레임으로 만드는 내부 메서드
 
-        데이터의 '항목'에 따라 숫자 값에 적절한 단위(%, 명 등)를 추가합니다.
-        결측값은 '-'로 표시하고, 숫자 포맷팅 중 오류가 발생하면 원래 값을 문자열로 반환합니다.
+        수치에 단위 또는 % 기호를 붙이는 작업을 행마다 반복하지 않고, 테이블 전체의 표시 문자열을 한 번에 만들어 둔 뒤
+        선택한 행만 배열 색인으로 가져옵니다. (합격률은 소수점 한 자리 + '%', 그 외는 천 단위 쉼표 + 단위, 결측값은 '-')
 
         Args:
-            x: 포맷팅할 값
-            항목 (str): 데이터의 항목 (예: '합격률', '응시자 수')
-            단위 (str): 데이터의 단위 (예: '%', ' 명')
+            certi_name (str): 자격증 종목명
 
         Returns:
-            str: 포맷팅된 문자열
+            pd.DataFrame: '종목별', '항목', 연도 컬럼으로 이루어진 표시용 데이터프레임
         """
-        if pd.isna(x):  # 값이 NaN(결측값)인 경우
-            return "-"
-        try:
-            if "합격률" in 항목:  # 항목이 '합격률'을 포함하는 경우
-                return f"{float(x):.1f}%"  # 부동 소수점 형태로 변환하여 소수점 한 자리까지 표시 후 '%' 추가
-            else:  # 그 외의 경우 (응시자 수, 합격자 수 등)
-                return f"{int(x):,}{단위}"  # 정수 형태로 변환하여 천 단위마다 쉼표를 찍고 단위 추가
-        except:  # 숫자 포맷팅 중 오류가 발생한 경우
-            return str(x)  # 원래 값을 문자열로 반환
+        series_ids = np.flatnonzero(self.table.series_names() == certi_name)  # 종목명이 같은 계열 번호
+        return self.table.display(series_ids)
+
+    def _display_schedule(self, certi_name):
+        """
+        선택한 자격증의 다가오는 시험 일정을 표시하는 내부 메서드
+
+        미리 만들어 둔 조인 색인(schedule_join)에서 자격증의 일정 목록을 바로 가져오므로,
+        시험명을 검색하거나 큐넷에 다시 요청하지 않습니다. (산업기사는 기사 일정으로 연결)
+
+        Args:
+            certi_name (str): 자격증 종목명
+        """
+        index = load_join_index()  # 저장된 월별 일정 파일이 바뀌었을 때만 다시 만듦
+        if certi_name not in index:
+            st.caption("📅 저장된 큐넷 일정에서 이 자격증의 시험 일정을 찾지 못했습니다.")
+            return
+        st.subheader("📅 다가오는 시험 일정")
+        events = index.upcoming(certi_name, limit=self.UPCOMING_LIMIT)
+        if events:
+            st.dataframe(ScheduleStore.to_dataframe(events), hide_index=True)  # 시작일 순 (구분, 회차, 시험명)
+        else:
+            st.caption(f"저장된 {index.year}년 일정 중 남은 일정이 없습니다. ('시험일정 확인' 탭에서 최신 일정을 불러올 수 있습니다.)")
+        with st.expander(f"{index.year}년 전체 일정 ({len(index.rounds(certi_name))}개 회차)"):
+            st.dataframe(ScheduleStore.to_dataframe(index.events_for(certi_name)), hide_index=True)
 
     def display_results(self):
         """검색 결과를 처리하고 표시하는 메서드"""
-        if not self.df.empty: # 데이터프레임이 비어있지 않은 경우에만 검색 수행
+        if self.table is not None: # 데이터를 불러온 경우에만 검색 수행
             if self.keyword:  # 사용자가 검색어를 입력한 경우 (certi_search.py에서 할당)
-                filtered = self.df[self.df['종목별'].str.contains(self.keyword, case=False, na=False)].copy()
-                filtered = filtered.sort_values(by='종목별',ascending=True)
-                # 데이터프레임의 '종목별' 컬럼에서 검색어를 포함하는 행을 찾습니다 (대소문자 구분 없이, NaN 값은 False 처리).
-                # .copy()를 사용하여 원본 데이터프레임 변경을 방지합니다.
-                # 검색 결과를 '종목별' 컬럼을 기준으로 오름차순 정렬합니다.
-
-                if not filtered.empty:  # 검색 결과가 있는 경우
-                    # st.success(f"✅ '{self.keyword}' 관련 항목 {len(filtered)}건이 검색되었습니다.")
-                    result_value = filtered['종목별'].unique() # 검색된 종목의 고유한 값들을 추출
-                    self.certi_name = st.selectbox("자격증 선택",result_value) # 추출된 고유한 종목명을 Selectbox 형태로 표시하고, 선택된 값을 self.certi_name에 저장
+                with METRICS.span('search.engine', keyword=self.keyword):
+                    result_value = self.engine.search(self.keyword, k=self.TOP_K)
+                # 검색 엔진에서 검색어와 일치하는 고유한 종목명을 순위대로 최대 TOP_K개 찾습니다.
+                # 정확한 일치 > 앞부분 일치 > 부분 일치 > 초성('ㅈㅂㅊㄹ') > 입력 중인 글자('정보처리기ㅅ') > 오타 순으로 정렬됩니다.
+
+                if result_value:  # 검색 결과가 있는 경우
+                    self.certi_name = st.selectbox("자격증 선택",result_value) # 검색된 고유한 종목명을 Selectbox 형태로 표시하고, 선택된 값을 self.certi_name에 저장
+                    st.dataframe(self._stats_frame(self.certi_name), hide_index=True)  # 선택된 자격증의 연도별 응시/합격 통계 표시
+                    self._display_schedule(self.certi_name)  # 선택된 자격증의 다가오는 시험 일정 표시 (조인 색인)
 
                 else:  # 검색 결과가 없는 경우
                     st.warning(f"❌ '{self.keyword}'에 해당하는 자격증 종목이 데이터에 없습니다.")  # 경고 메시지 표시
@@ -0,0 +1,116 @@
+import heapq  # 겹치는 조각 수 기준 상위 후보 선택
+from collections import Counter  # 조각별 등장 횟수 집계
+
+import numpy as np  # 행 번호 배열 처리
+
+
+class NameIndex:
+    """
+    자격증 이름(종목별)에 대한 문자 n-gram(1글자 + 2글자) 역색인 클래스
+
+    이름을 한 번만 색인해 두고, 검색어가 포함된 이름과 해당 행 번호를 찾습니다.
+    검색어의 2글자 조각(bigram)마다 그 조각을 가진 이름 목록을 교집합하므로,
+    검색 비용은 전체 행 수가 아니라 결과 크기에 비례합니다. (한글은 글자 단위 bigram이 잘 맞습니다.)
+    검색어는 정규식이 아닌 일반 문자열로 취급하며, 대소문자는 구분하지 않습니다.
+    """
+    def __init__(self, names):
+        """
+        Args:
+            names: 행마다 하나씩 있는 이름 목록 (pd.Series, 리스트 등)
+        """
+        values = np.asarray(names, dtype=str)
+        keys, codes = np.unique(values, return_inverse=True)
+        self.keys = keys.tolist()  # 고유한 이름 (사전순)
+        self._folded = [key.casefold() for key in self.keys]  # 대소문자 구분 없는 비교용 이름
+
+        # 이름 번호별 행 번호 (각 이름의 행 번호는 오름차순)
+        order = np.argsort(codes, kind='stable')
+        bounds = np.searchsorted(codes[order], np.arange(len(self.keys) + 1))
+        self._rows = [order[bounds[i]:bounds[i + 1]] for i in range(len(self.keys))]
+        self._all_rows = np.arange(len(values))
+
+        # n-gram -> 이름 번호 집합
+        self._postings = {}
+        for key_id, key in enumerate(self._folded):
+            for gram in self._grams(key):
+                self._postings.setdefault(gram, set()).add(key_id)
+
+    @staticmethod
+    def _grams(text):
+        """문자열의 1글자, 2글자 조각을 모두 반환합니다."""
+        grams = set(text)
+        grams.update(text[i:i + 2] for i in range(len(text) - 1))
+        return grams
+
+    def key_ids(self, keyword):
+        """
+        검색어를 포함하는 이름 번호를 오름차순(이름 사전순)으로 반환합니다.
+
+        Args:
+            keyword (str): 검색어 (일반 문자열)
+
+        Returns:
+            list: 이름 번호 리스트 (검색어가 비어 있으면 전체)
+        """
+        keyword = keyword.casefold()
+        if not keyword:
+            return list(range(len(self.keys)))
+        if len(keyword) == 1:
+            return sorted(self._postings.get(keyword, ()))
+
+        bigrams = {keyword[i:i + 2] for i in range(len(keyword) - 1)}
+        postings = [self._postings.get(gram) for gram in bigrams]
+        if not all(postings):  # 하나라도 없는 조각이 있으면 결과 없음
+            return []
+        postings.sort(key=len)  # 가장 작은 목록부터 교집합
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                return []
+        # bigram 은 순서를 보장하지 않으므로 후보 이름에 실제로 포함되는지 확인
+        return sorted(key_id for key_id in candidates if keyword in self._folded[key_id])
+
+    def names(self, keyword):
+        """검색어를 포함하는 고유한 이름을 사전순으로 반환합니다."""
+        return [self.keys[key_id] for key_id in self.key_ids(keyword)]
+
+    def rows(self, keyword):
+        """
+        검색어를 포함하는 이름의 행 번호를 원래 순서(오름차순)대로 반환합니다.
+
+        Args:
+            keyword (str): 검색어 (일반 문자열)
+
+        Returns:
+            np.ndarray: 행 번호 배열 (df.iloc 에 바로 사용할 수 있음)
+        """
+        if not keyword:
+            return self._all_rows
+        key_ids = self.key_ids(keyword)
+        if not key_ids:
+            return self._all_rows[:0]
+        return np.sort(np.concatenate([self._rows[key_id] for key_id in key_ids]))
+
+    def similar(self, text, limit):
+        """
+        2글자 조각이 가장 많이 겹치는 이름의 행 번호를 반환합니다. (오타 검색 후보 선정용)
+
+        검색어 조각의 posting 목록만 훑으므로 전체 이름을 비교하지 않고 후보를 최대 limit 개로 제한합니다.
+
+        Args:
+            text (str): 비교할 문자열
+            limit (int): 최대 후보 이름 수
+
+        Returns:
+            np.ndarray: 후보 이름의 행 번호 배열
+        """
+        text = text.casefold()
+        counts = Counter()
+        for gram in {text[i:i + 2] for i in range(len(text) - 1)}:
+            counts.update(self._postings.get(gram, ()))
+        key_ids = heapq.nlargest(limit, counts, key=counts.__getitem__)
+        if not key_ids:
+            return self._all_rows[:0]
+        return np.concatenate([self._rows[key_id] for key_id in key_ids])
+
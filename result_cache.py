@@ -0,0 +1,158 @@
+import contextlib  # 디스크 연결 정리
+import functools  # 프로세스 단위 캐시 객체 공유
+import json  # 디스크 저장용 직렬화
+import os  # 캐시 파일 경로
+import sqlite3  # 디스크 캐시 저장소 (표준 라이브러리)
+import threading  # 여러 세션(스레드)에서 동시에 접근
+import time  # 만료 시각 계산
+from collections import OrderedDict  # LRU 순서 유지
+
+BOOK_CACHE_PATH = os.path.join('data', 'book_cache.sqlite3')  # 책 검색 결과 디스크 캐시 파일
+BOOK_CACHE_TTL = 6 * 60 * 60  # 책 검색 결과 유효 시간 (초)
+
+
+class TwoTierCache:
+    """
+    메모리 LRU + 디스크(SQLite) 2단계 TTL 캐시 클래스
+
+    먼저 프로세스 메모리의 LRU 캐시를 확인하고, 없으면 재시작 후에도 남아 있는 디스크 캐시를 확인합니다.
+    모든 항목에는 개별 만료 시각(TTL)이 있으며, 메모리 캐시는 max_entries 개를 넘으면 가장 오래 쓰지 않은 항목부터 버립니다.
+    적중/실패/제거 횟수는 stats()로 확인할 수 있습니다.
+    """
+    def __init__(self, path, ttl, max_entries=256, max_disk_entries=5000):
+        """
+        Args:
+            path (str): 디스크 캐시(SQLite) 파일 경로
+            ttl (float): 기본 유효 시간 (초)
+            max_entries (int): 메모리에 유지할 최대 항목 수
+            max_disk_entries (int): 디스크에 유지할 최대 항목 수
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self._memory = OrderedDict()  # key -> (만료 시각, 값)
+        self._lock = threading.Lock()
+        self._counters = dict.fromkeys(['memory_hits', 'disk_hits', 'misses', 'evictions', 'expired', 'writes'], 0)
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, expires_at REAL, value TEXT)")
+
+    @contextlib.contextmanager
+    def _connect(self):
+        """디스크 캐시 연결을 열고, 작업이 끝나면 커밋 후 닫습니다. (작업마다 새로 열어 스레드 간 공유 문제를 피함)"""
+        conn = sqlite3.connect(self.path, timeout=5)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _count(self, name):
+        self._counters[name] += 1
+
+    def _remember(self, key, expires_at, value):
+        """메모리 캐시에 넣고, 크기를 넘으면 가장 오래 쓰지 않은 항목을 버립니다. (잠금 안에서 호출)"""
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._count('evictions')
+
+    def get(self, key):
+        """
+        캐시된 값을 반환합니다.
+
+        Args:
+            key (str): 캐시 키
+
+        Returns:
+            캐시된 값 (없거나 만료된 경우 None)
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._memory.move_to_end(key)
+                    self._count('memory_hits')
+                    return entry[1]
+                del self._memory[key]  # 만료된 항목 제거
+                self._count('expired')
+
+        with self._connect() as conn:
+            row = conn.execute("SELECT expires_at, value FROM cache WHERE key = ?", (key,)).fetchone()
+        with self._lock:
+            if row is not None and row[0] > now:
+                value = json.loads(row[1])
+                self._remember(key, row[0], value)  # 디스크 적중 항목은 메모리로 올림
+                self._count('disk_hits')
+                return value
+            if row is not None:
+                self._count('expired')
+            self._count('misses')
+        return None
+
+    def set(self, key, value, ttl=None):
+        """
+        값을 메모리와 디스크에 저장합니다.
+
+        Args:
+            key (str): 캐시 키
+            value: JSON 으로 저장할 수 있는 값
+            ttl (float): 유효 시간 (초, 기본값: 생성 시 지정한 ttl)
+        """
+        expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._remember(key, expires_at, value)
+            self._count('writes')
+        with self._connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO cache (key, expires_at, value) VALUES (?, ?, ?)",
+                         (key, expires_at, json.dumps(value, ensure_ascii=False)))
+            conn.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))  # 만료된 항목 정리
+            conn.execute("DELETE FROM cache WHERE key NOT IN "
+                         "(SELECT key FROM cache ORDER BY expires_at DESC LIMIT ?)", (self.max_disk_entries,))
+
+    def get_or_fetch(self, key, fetch, ttl=None):
+        """
+        캐시에 값이 있으면 반환하고, 없으면 fetch()를 호출한 결과를 저장한 뒤 반환합니다.
+
+        fetch()에서 발생한 예외는 저장하지 않고 그대로 전달합니다.
+        """
+        value = self.get(key)
+        if value is None:
+            value = fetch()
+            self.set(key, value, ttl)
+        return value
+
+    def stats(self):
+        """적중/실패/제거 횟수와 현재 메모리 항목 수를 딕셔너리로 반환합니다."""
+        with self._lock:
+            stats = dict(self._counters, memory_entries=len(self._memory), max_entries=self.max_entries)
+        lookups = stats['memory_hits'] + stats['disk_hits'] + stats['misses']
+        stats['hit_rate'] = (stats['memory_hits'] + stats['disk_hits']) / lookups if lookups else 0.0
+        return stats
+
+    def clear(self):
+        """메모리와 디스크의 모든 항목을 지웁니다."""
+        with self._lock:
+            self._memory.clear()
+        with self._connect() as conn:
+            conn.execute("DELETE FROM cache")
+
+
+def normalize_query(query):
+    """검색어의 앞뒤/중복 공백을 정리하고 대소문자를 통일합니다. (캐시 키용)"""
+    return ' '.join((query or '').split()).casefold()
+
+
+def book_cache_key(query, start, count):
+    """책 검색 결과 캐시 키 (정규화된 검색어 + 결과 범위)"""
+    return f"book|{normalize_query(query)}|{start}|{count}"
+
+
+@functools.lru_cache(maxsize=None)
+def get_book_cache():
+    """프로세스 전체에서 공유하는 네이버 책 검색 결과 캐시를 반환합니다."""
+    return TwoTierCache(BOOK_CACHE_PATH, ttl=BOOK_CACHE_TTL)
@@ -0,0 +1,160 @@
+import hashlib  # 일정 내용 해시
+import json  # 일정 파일 / 목록 파일 저장
+import os  # 파일 경로, 교체 방식 저장
+import threading  # 목록 파일 갱신 잠금
+import time  # 요청 / 확인 시각
+
+MANIFEST_NAME = 'schedule_manifest.json'  # 월 -> 내용 해시, 요청 시각, 조건부 요청 정보 목록
+MANIFEST_VERSION = 1
+
+_manifest_lock = threading.Lock()  # 같은 프로세스의 여러 세션 / 작업자 스레드가 목록 파일을 동시에 고치지 않도록 보호
+_path_locks = {}  # 일정 파일 경로 -> 잠금 (같은 달의 비교 -> 파일 쓰기 -> 목록 갱신을 한 번에 처리)
+_path_locks_lock = threading.Lock()
+
+
+def _path_lock(path):
+    """일정 파일 경로별 잠금 (백그라운드 갱신과 화면의 미리 불러오기가 같은 달을 동시에 저장해도 파일과 목록이 어긋나지 않도록)"""
+    path = os.path.abspath(path)
+    with _path_locks_lock:
+        return _path_locks.setdefault(path, threading.Lock())
+
+
+def schedule_hash(schedule):
+    """일정 딕셔너리의 내용 해시 (날짜 순서까지 같으면 같은 값)"""
+    text = json.dumps(schedule, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def write_atomic(path, text):
+    """임시 파일에 쓴 뒤 교체하여, 다른 세션이 반쯤 쓴 파일을 읽지 않게 저장합니다."""
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class ScheduleFiles:
+    """
+    월별 시험 일정 파일(test_schedule_{월}.json) 저장소
+
+    data 폴더의 schedule_manifest.json 에 월마다 내용 해시, 마지막으로 받은 시각(fetched_at),
+    마지막으로 사이트에 확인한 시각(checked_at), 조건부 요청용 ETag / Last-Modified 를 기록합니다.
+      - 새로 받은 일정의 해시가 기록과 같으면 파일을 다시 쓰지 않고 확인 시각만 갱신합니다.
+      - 파일은 임시 파일에 쓴 뒤 교체하므로 읽는 쪽은 항상 완전한 파일을 봅니다.
+      - 일정의 경과 시간은 파일 수정 시각이 아니라 마지막 확인 시각으로 계산합니다. (바뀌지 않아 다시 쓰지 않은 달도 새것으로 취급)
+    """
+    def __init__(self, data_folder, year):
+        """
+        Args:
+            data_folder (str): 일정 파일 폴더
+            year (int): 일정 연도 (목록 파일의 키에 사용)
+        """
+        self.data_folder = data_folder
+        self.year = year
+        self.manifest_path = os.path.join(data_folder, MANIFEST_NAME)
+
+    def path(self, month):
+        return os.path.join(self.data_folder, f'test_schedule_{month}.json')
+
+    def _key(self, month):
+        return f'{self.year}-{int(month):02d}'
+
+    def _read_manifest(self):
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {'version': MANIFEST_VERSION, 'months': {}}
+        if manifest.get('version') != MANIFEST_VERSION:
+            return {'version': MANIFEST_VERSION, 'months': {}}
+        return manifest
+
+    def _update_manifest(self, month, **fields):
+        with _manifest_lock:
+            manifest = self._read_manifest()
+            entry = manifest['months'].setdefault(self._key(month), {'file': os.path.basename(self.path(month))})
+            entry.update({name: value for name, value in fields.items() if value is not None})
+            write_atomic(self.manifest_path, json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True))
+        return entry
+
+    def entry(self, month):
+        """목록 파일에 기록된 월 정보 (없으면 빈 딕셔너리)"""
+        return self._read_manifest()['months'].get(self._key(month), {})
+
+    def manifest(self):
+        """전체 목록 {'YYYY-MM': {'file', 'sha256', 'fetched_at', 'checked_at', 'etag', 'last_modified'}}"""
+        return self._read_manifest()['months']
+
+    def load(self, month):
+        """
+        저장된 월별 일정을 읽습니다.
+
+        Returns:
+            dict: 일정 딕셔너리 (파일이 없으면 None)
+
+        Raises:
+            IOError: 파일을 읽을 수 없는 경우
+        """
+        try:
+            with open(self.path(month), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def save(self, month, schedule, validators=None):
+        """
+        일정을 저장합니다. 내용이 저장된 것과 같으면 파일을 다시 쓰지 않습니다.
+
+        Args:
+            month (int): 월
+            schedule (dict): 파싱한 일정 딕셔너리
+            validators (dict): 응답의 조건부 요청 정보 {'etag', 'last_modified'} (없으면 None)
+
+        Returns:
+            bool: 파일을 새로 썼으면 True, 내용이 같아 건너뛰었으면 False
+
+        Raises:
+            IOError: 파일을 쓸 수 없는 경우
+        """
+        digest = schedule_hash(schedule)
+        with _path_lock(self.path(month)):  # 비교 -> 파일 쓰기 -> 목록 갱신 사이에 같은 달의 다른 저장이 끼어들지 않도록
+            known = self.entry(month).get('sha256')
+            if known is None and os.path.exists(self.path(month)):  # 목록이 생기기 전에 저장된 파일은 내용으로 비교
+                try:
+                    known = schedule_hash(self.load(month))
+                except (IOError, ValueError):
+                    known = None
+            changed = digest != known or not os.path.exists(self.path(month))
+            if changed:
+                write_atomic(self.path(month), json.dumps(schedule, ensure_ascii=False, indent=4))  # json 저장시 한글 깨짐 방지
+            now = time.time()
+            self._update_manifest(month, sha256=digest, checked_at=now, fetched_at=now if changed else None,
+                                  **(validators or {}))
+        return changed
+
+    def mark_checked(self, month, validators=None):
+        """사이트가 '바뀌지 않음'(304)으로 응답한 경우 확인 시각만 갱신합니다."""
+        with _path_lock(self.path(month)):
+            self._update_manifest(month, checked_at=time.time(), **(validators or {}))
+
+    def validators(self, month):
+        """조건부 요청 헤더 (If-None-Match / If-Modified-Since, 기록이 없으면 빈 딕셔너리)"""
+        entry = self.entry(month)
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def age(self, month):
+        """마지막으로 사이트에 확인한 뒤 지난 시간 (초, 목록에 없으면 파일 수정 시각 기준, 파일이 없으면 None)"""
+        checked_at = self.entry(month).get('checked_at')
+        if checked_at is None:
+            try:
+                checked_at = os.path.getmtime(self.path(month))
+            except OSError:
+                return None
+        return max(0.0, time.time() - checked_at)
@@ -0,0 +1,273 @@
+import argparse  # 명령줄 인자 처리
+import bisect  # 자격증별 일정에서 다가오는 일정 위치 찾기
+import datetime  # 오늘 날짜
+import functools  # 자격증 목록 지문 캐시
+import hashlib  # 입력 지문 계산
+import json  # 색인 파일 저장
+import os  # 파일 경로, 일정 파일 상태 확인
+import threading  # 색인 캐시 잠금
+
+import numpy as np  # 종목명 배열
+
+import bar_graph as bg  # 합격률 데이터(종목별 이름)와 집계 큐브(자격증 등급)
+from schedule_files import write_atomic  # 색인 파일을 교체 방식으로 저장
+from schedule_store import CATEGORIES, ScheduleEvent, ScheduleStore  # 연간 시험 일정과 등급 구분
+from stats_cube import GRADE_HEADER  # 등급 구분 행('기사', '1급' 등)은 자격증이 아님
+
+# 자격증(합격률 데이터의 종목별 이름) -> 큐넷 시험 일정 조인 색인
+#   python schedule_join.py                        # 저장된 월별 일정(data/test_schedule_*.json)으로 색인을 만들어 저장
+#   index = schedule_join.load_join_index()        # 앱에서: 저장된 색인을 읽음 (일정 파일이 바뀌었으면 다시 만듦)
+#   index.upcoming('정보처리기사')                  # 다가오는 일정 (자격증별로 미리 모아 둔 목록에서 바로 찾음)
+# 큐넷 월별 일정에는 국가기술자격이 등급별로 묶여 있으므로('기사 제1회 필기시험') 등급으로 연결하고,
+# 그 밖의 자격증은 시험명에 자격증 이름이 단어 그대로 들어 있는 일정('제23회 가맹거래사 1차')과 연결합니다.
+
+JOIN_INDEX_PATH = os.path.join('data', 'schedule_join.json')
+JOIN_VERSION = 1  # 색인 형식이나 연결 규칙이 바뀌면 올려서 다시 만듦
+MAX_NAME_TOKENS = 4  # 시험명에서 자격증 이름으로 비교할 최대 연속 단어 수
+
+# 큐넷 월별 일정은 산업기사 시험을 기사와 함께 '기사 제n회' 로만 표시하므로 산업기사는 기사 일정에 연결
+SCHEDULE_TIER = {'산업기사': '기사'}
+
+
+def _schedule_files(data_folder):
+    return [os.path.join(data_folder, f'test_schedule_{month}.json') for month in range(1, 13)]
+
+
+def schedule_fingerprint(data_folder):
+    """월별 일정 파일의 (이름, 크기, 수정 시각) 지문 (파일이 바뀌거나 새로 받으면 달라짐)"""
+    states = []
+    for path in _schedule_files(data_folder):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        states.append([os.path.basename(path), stat.st_size, stat.st_mtime_ns])
+    return hashlib.sha256(json.dumps(states).encode('utf-8')).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def certification_names():
+    """
+    합격률 데이터의 종목별 이름과 자격증 등급, 지문을 반환합니다. (프로세스당 한 번만 계산)
+
+    Returns:
+        tuple: (이름 리스트, {이름: 등급}, 지문)
+    """
+    names = np.unique(bg.load_table().series_names()).tolist()
+    cube = bg.load_cube()
+    tiers = {name: cube.tiers[tier] for name, tier in zip(cube.cert_names.tolist(), cube.cert_tier.tolist())}  # 데이터의 등급 구분 행 기준
+    digest = hashlib.sha256(json.dumps([names, sorted(tiers.items())], ensure_ascii=False).encode('utf-8')).hexdigest()
+    return names, tiers, digest
+
+
+def _name_grams(name):
+    """시험명에서 회차('제23회')를 뺀 연속 단어 조각 (최대 MAX_NAME_TOKENS 단어)"""
+    tokens = [token for token in name.split() if not (token.startswith('제') and token.endswith('회'))]
+    return {' '.join(tokens[i:j]) for i in range(len(tokens))
+            for j in range(i + 1, min(i + MAX_NAME_TOKENS, len(tokens)) + 1)}
+
+
+class ScheduleJoinIndex:
+    """
+    자격증 -> 시험 일정 조인 색인 클래스
+
+    자격증마다 연결 키('tier:기사' 또는 'name:가맹거래사')를 정하고, 연결 키마다 해당 일정 번호를 시작일 순으로 미리 모아 둡니다.
+      - 국가기술자격(기술사/기능장/기사/산업기사/기능사): 데이터의 등급 구분(없으면 이름 끝)으로 등급 일정에 연결 (산업기사 -> 기사)
+      - 그 밖의 자격증: 회차를 뺀 시험명의 연속 단어가 자격증 이름과 같은 일정에 연결
+    같은 등급의 자격증은 일정 목록 하나를 함께 사용하며, 조회할 때는 자격증의 일정 목록만 봅니다. (전체 일정을 훑지 않음)
+    """
+    def __init__(self, events, cert_keys, key_events, year, fingerprint=None):
+        """
+        Args:
+            events (list): ScheduleEvent 리스트 (시작일 순)
+            cert_keys (dict): {자격증: 연결 키}
+            key_events (dict): {연결 키: 일정 번호 리스트 (시작일 순)}
+            year (int): 일정 연도
+            fingerprint (dict): 색인을 만든 입력 지문 {'schedules', 'certifications'}
+        """
+        self.events = list(events)
+        self.cert_keys = dict(cert_keys)
+        self.year = year
+        self.fingerprint = fingerprint or {}
+        self._key_ids = {key: list(ids) for key, ids in key_events.items()}
+        self._key_events = {key: [self.events[i] for i in ids] for key, ids in self._key_ids.items()}
+        self._key_starts = {key: [event.start.toordinal() for event in events]
+                            for key, events in self._key_events.items()}
+        self._key_max_days = {key: max(((event.end - event.start).days for event in events), default=0)
+                              for key, events in self._key_events.items()}
+
+    @classmethod
+    def build(cls, store, names, tiers, year, fingerprint=None):
+        """
+        연간 일정 저장소와 자격증 이름으로 색인을 만듭니다.
+
+        Args:
+            store (ScheduleStore): 저장된 모든 달의 일정
+            names (list): 합격률 데이터의 종목별 이름
+            tiers (dict): {자격증: 등급} (집계 큐브의 등급 구분)
+            year (int): 일정 연도
+            fingerprint (dict): 입력 지문
+
+        Returns:
+            ScheduleJoinIndex: 조인 색인
+        """
+        by_tier, by_name = {}, {}
+        for event_id, event in enumerate(store.events):
+            if event.category in CATEGORIES:
+                by_tier.setdefault(event.category, []).append(event_id)
+            else:
+                for gram in _name_grams(event.name):
+                    by_name.setdefault(gram, []).append(event_id)
+
+        cert_keys, key_events = {}, {}
+        for name in names:
+            if GRADE_HEADER.match(name):  # '기사', '1급', '단일등급' 같은 구분 행
+                continue
+            tier = tiers.get(name)  # 등급이 없는 자격증(1급/2급/단일등급 등)은 이름으로 일정을 찾음
+            tier = SCHEDULE_TIER.get(tier, tier)
+            if tier in by_tier:
+                key, ids = f'tier:{tier}', by_tier[tier]
+            elif tier in CATEGORIES:  # 등급 일정이 아직 저장되지 않은 경우
+                continue
+            else:
+                key, ids = f'name:{name}', by_name.get(' '.join(name.split()))
+                if not ids:
+                    continue
+            cert_keys[name] = key
+            key_events[key] = ids
+        return cls(store.events, cert_keys, key_events, year, fingerprint)
+
+    def __contains__(self, name):
+        return name in self.cert_keys
+
+    def __len__(self):
+        return len(self.cert_keys)
+
+    def events_for(self, name):
+        """자격증의 모든 일정 (시작일 순, 연결된 일정이 없으면 빈 리스트)"""
+        key = self.cert_keys.get(name)
+        return list(self._key_events[key]) if key else []
+
+    def upcoming(self, name, today=None, limit=None):
+        """
+        자격증의 오늘 이후 진행 중이거나 시작하는 일정을 시작일 순으로 반환합니다.
+
+        Args:
+            name (str): 자격증 이름 (종목별)
+            today (datetime.date): 기준 날짜 (기본값: 오늘)
+            limit (int): 최대 개수 (None 이면 전체)
+
+        Returns:
+            list: ScheduleEvent 리스트
+        """
+        key = self.cert_keys.get(name)
+        if key is None:
+            return []
+        today = today or datetime.date.today()
+        events = self._key_events[key]
+        lo = bisect.bisect_left(self._key_starts[key], today.toordinal() - self._key_max_days[key])  # 이보다 먼저 시작한 일정은 끝났음
+        result = [event for event in events[lo:] if event.end >= today]
+        return result[:limit] if limit is not None else result
+
+    def rounds(self, name):
+        """자격증의 일정을 회차별로 묶어 반환합니다. {회차: [ScheduleEvent, ...]} (회차가 없는 일정은 None)"""
+        grouped = {}
+        for event in self._key_events.get(self.cert_keys.get(name), []):
+            grouped.setdefault(event.round, []).append(event)
+        return grouped
+
+    def to_dict(self):
+        return {
+            'version': JOIN_VERSION, 'year': self.year, 'fingerprint': self.fingerprint,
+            'events': [[event.start.isoformat(), event.end.isoformat(), event.name, event.category, event.round, event.month]
+                       for event in self.events],
+            'certifications': self.cert_keys,
+            'keys': self._key_ids,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        events = [ScheduleEvent(datetime.date.fromisoformat(start), datetime.date.fromisoformat(end), name, category,
+                                round_, month)
+                  for start, end, name, category, round_, month in data['events']]
+        return cls(events, data['certifications'], data['keys'], data['year'], data.get('fingerprint'))
+
+    def save(self, path=JOIN_INDEX_PATH):
+        """색인을 JSON 파일로 저장합니다. (임시 파일에 쓴 뒤 교체)"""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        write_atomic(path, json.dumps(self.to_dict(), ensure_ascii=False))
+
+
+def build_join_index(data_folder='data', year=2025):
+    """저장된 월별 일정과 합격률 데이터로 조인 색인을 새로 만듭니다."""
+    names, tiers, names_digest = certification_names()
+    fingerprint = {'schedules': schedule_fingerprint(data_folder), 'certifications': names_digest}
+    return ScheduleJoinIndex.build(ScheduleStore.from_folder(data_folder, year), names, tiers, year, fingerprint)
+
+
+# 프로세스 전체(모든 세션)에서 공유하는 색인 ((일정 폴더, 연도) -> ScheduleJoinIndex)
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def load_join_index(data_folder='data', year=2025, path=None):
+    """
+    조인 색인을 반환합니다.
+
+    메모리에 있는 색인의 지문이 현재 일정 파일과 같으면 그대로 사용하고, 아니면 저장된 색인 파일을 확인한 뒤,
+    그것도 다르면(일정을 새로 받았거나 데이터가 바뀐 경우) 다시 만들어 저장합니다.
+    지문 확인은 월별 일정 파일의 상태(크기, 수정 시각)만 보므로 파일을 읽지 않습니다.
+
+    Args:
+        data_folder (str): 월별 일정 파일 폴더
+        year (int): 일정 연도
+        path (str): 색인 파일 경로 (기본값: data_folder 의 schedule_join.json)
+
+    Returns:
+        ScheduleJoinIndex: 조인 색인
+    """
+    path = path or os.path.join(data_folder, os.path.basename(JOIN_INDEX_PATH))
+    fingerprint = {'schedules': schedule_fingerprint(data_folder), 'certifications': certification_names()[2]}
+    with _indexes_lock:
+        index = _indexes.get((data_folder, year))
+        if index is not None and index.fingerprint == fingerprint:
+            return index
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            if saved.get('version') == JOIN_VERSION and saved.get('year') == year and saved.get('fingerprint') == fingerprint:
+                index = ScheduleJoinIndex.from_dict(saved)
+            else:
+                index = None
+        except (OSError, ValueError, KeyError, TypeError):
+            index = None
+        if index is None:
+            index = build_join_index(data_folder, year)
+            try:
+                index.save(path)
+            except OSError:
+                pass  # 저장하지 못해도 메모리의 색인은 사용
+        _indexes[(data_folder, year)] = index
+        return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="자격증 -> 큐넷 시험 일정 조인 색인 만들기")
+    parser.add_argument('--data', default='data', help="월별 일정 파일 폴더")
+    parser.add_argument('--year', type=int, default=2025, help="일정 연도")
+    parser.add_argument('--output', help="색인 파일 경로 (기본값: <data>/schedule_join.json)")
+    args = parser.parse_args()
+
+    index = build_join_index(args.data, args.year)
+    path = args.output or os.path.join(args.data, os.path.basename(JOIN_INDEX_PATH))
+    index.save(path)
+    keys = {}
+    for name, key in index.cert_keys.items():
+        keys.setdefault(key, []).append(name)
+    print(f"일정 {len(index.events)}건, 연결된 자격증 {len(index)}개 -> {path}")
+    for key, names in sorted(keys.items(), key=lambda item: -len(item[1])):
+        print(f"  {key:<24} 자격증 {len(names):>4}개, 일정 {len(index.events_for(names[0])):>3}건")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,190 @@
+import bisect  # 시작일 기준 구간 검색
+import datetime  # 시작일/종료일 날짜 타입
+import json  # 저장된 일정 파일 읽기
+import os  # 파일 경로
+import re  # 날짜 및 회차 추출
+from collections import namedtuple  # 일정 이벤트 레코드
+
+import pandas as pd  # 화면 표시용 데이터프레임
+
+from name_index import NameIndex  # 시험명 부분 문자열 색인
+
+# 시험 등급 구분 (앞에 있는 것부터 확인: '산업기사'가 '기사'보다 먼저)
+CATEGORIES = ['기술사', '기능장', '산업기사', '기사', '기능사']
+OTHER_CATEGORY = '기타'
+
+DATE_PATTERN = re.compile(r'(\d{1,2})\.(\d{1,2})')  # '03.31(월)' 의 월.일
+ROUND_PATTERN = re.compile(r'제\s*(\d+)\s*회')  # '기사 제1회 필기시험' 의 회차
+
+# 시험 일정 이벤트 하나 (여러 시험이 한 칸에 묶여 있던 것을 시험별로 나눈 것)
+ScheduleEvent = namedtuple('ScheduleEvent', ['start', 'end', 'name', 'category', 'round', 'month'])
+
+
+def category_of(name):
+    """시험명 또는 자격증명에서 등급 구분(기술사/기능장/산업기사/기사/기능사)을 찾습니다. (없으면 '기타')"""
+    for category in CATEGORIES:
+        if category in name:
+            return category
+    return OTHER_CATEGORY
+
+
+def _resolve_year(year, file_month, date_month):
+    """월별 페이지에 앞뒤 달의 날짜가 섞여 있는 경우(12월 <-> 1월)의 연도를 보정합니다."""
+    if date_month - file_month > 6:
+        return year - 1
+    if file_month - date_month > 6:
+        return year + 1
+    return year
+
+
+def parse_period(text, year, month):
+    """
+    '03.31(월)~04.04(금)' 또는 '03.08(토)' 형태의 일정 문자열을 (시작일, 종료일) 로 변환합니다.
+
+    Args:
+        text (str): 일정 문자열
+        year (int): 일정 연도
+        month (int): 일정이 저장된 월 (연도 경계 보정용)
+
+    Returns:
+        tuple: (datetime.date, datetime.date), 날짜를 찾지 못하면 None
+    """
+    dates = []
+    for date_month, day in DATE_PATTERN.findall(text)[:2]:
+        date_month, day = int(date_month), int(day)
+        try:
+            dates.append(datetime.date(_resolve_year(year, month, date_month), date_month, day))
+        except ValueError:
+            return None
+    if not dates:
+        return None
+    start, end = dates[0], dates[-1]
+    if end < start:  # '12.29~01.02' 처럼 해를 넘기는 일정
+        end = end.replace(year=end.year + 1)
+    return start, end
+
+
+def split_tests(text):
+    """"'제23회 가맹거래사 1차 ,  제23회 경매사 1차 '" 형태의 문자열을 시험명 리스트로 나눕니다."""
+    names = []
+    for part in text.split(','):
+        name = ' '.join(part.strip().strip("'\"").split())
+        if name:
+            names.append(name)
+    return names
+
+
+class ScheduleStore:
+    """
+    날짜 색인이 있는 시험 일정 저장소 클래스
+
+    parse_schedule()이 만든 월별 딕셔너리를 시험 하나당 한 행(ScheduleEvent)으로 풀어서
+    시작일/종료일을 날짜 타입으로, 등급 구분을 카테고리로 저장합니다.
+    구간 색인(시작일 정렬 + 최대 기간)과 등급/시험명 색인을 만들어 두어,
+    '다음 30일 동안의 기사 일정', '이번 주와 겹치는 모든 일정' 같은 질의를 연간 전체에 대해 색인으로 답합니다.
+    """
+    def __init__(self, events):
+        """
+        Args:
+            events (list): ScheduleEvent 리스트
+        """
+        self.events = sorted(set(events), key=lambda e: (e.start, e.end, e.name))  # 시작일 순으로 정렬 (중복 제거)
+        self._starts = [event.start.toordinal() for event in self.events]  # 구간 색인: 정렬된 시작일
+        self._max_days = max((event.end - event.start).days for event in self.events) if self.events else 0
+        self._by_category = {}  # 등급 구분 -> 이벤트 번호 (시작일 순)
+        for event_id, event in enumerate(self.events):
+            self._by_category.setdefault(event.category, []).append(event_id)
+        self._name_index = NameIndex([event.name for event in self.events])  # 시험명 부분 문자열 색인
+
+    @classmethod
+    def from_schedules(cls, schedules, year):
+        """
+        월별 일정 딕셔너리로 저장소를 만듭니다.
+
+        Args:
+            schedules (dict): {월: parse_schedule() 결과 딕셔너리} (값이 None 인 달은 건너뜀)
+            year (int): 일정 연도
+
+        Returns:
+            ScheduleStore: 일정 저장소
+        """
+        events = []
+        for month, schedule in schedules.items():
+            for period_text, tests_text in (schedule or {}).items():
+                period = parse_period(period_text, year, month)
+                if period is None:
+                    continue
+                for name in split_tests(tests_text):
+                    match = ROUND_PATTERN.search(name)
+                    events.append(ScheduleEvent(period[0], period[1], name, category_of(name),
+                                                int(match.group(1)) if match else None, month))
+        return cls(events)
+
+    @classmethod
+    def from_folder(cls, data_folder, year):
+        """data_folder 의 test_schedule_{월}.json 파일(1~12월)로 저장소를 만듭니다."""
+        schedules = {}
+        for month in range(1, 13):
+            try:
+                with open(os.path.join(data_folder, f'test_schedule_{month}.json'), 'r', encoding='utf-8') as f:
+                    schedules[month] = json.load(f)
+            except (OSError, ValueError):
+                continue  # 없는 달은 건너뜀
+        return cls.from_schedules(schedules, year)
+
+    def __len__(self):
+        return len(self.events)
+
+    def _overlapping_ids(self, start, end):
+        """[start, end] 기간과 겹치는 이벤트 번호 (시작일 순)"""
+        hi = bisect.bisect_right(self._starts, end.toordinal())  # end 이후에 시작하는 일정 제외
+        lo = bisect.bisect_left(self._starts, start.toordinal() - self._max_days)  # 최대 기간보다 먼저 시작한 일정은 겹칠 수 없음
+        return [event_id for event_id in range(lo, hi) if self.events[event_id].end >= start]
+
+    def query(self, start=None, end=None, category=None, keyword=None):
+        """
+        조건에 맞는 일정을 시작일 순으로 반환합니다. (조건은 모두 선택 사항이며 함께 주면 교집합)
+
+        Args:
+            start (datetime.date): 이 날짜 이후와 겹치는 일정
+            end (datetime.date): 이 날짜 이전과 겹치는 일정
+            category (str): 등급 구분 ('기사', '기능사' 등)
+            keyword (str): 시험명에 포함된 문자열
+
+        Returns:
+            list: ScheduleEvent 리스트
+        """
+        candidates = None
+        if start is not None or end is not None:
+            candidates = self._overlapping_ids(start or datetime.date.min, end or datetime.date.max)
+        if category is not None:
+            ids = self._by_category.get(category, [])
+            candidates = ids if candidates is None else sorted(set(candidates).intersection(ids))
+        if keyword:
+            ids = self._name_index.rows(keyword).tolist()
+            candidates = ids if candidates is None else sorted(set(candidates).intersection(ids))
+        if candidates is None:
+            return list(self.events)
+        return [self.events[event_id] for event_id in candidates]
+
+    def upcoming(self, days=30, category=None, today=None):
+        """오늘부터 days 일 안에 진행 중이거나 시작하는 일정을 반환합니다."""
+        today = today or datetime.date.today()
+        return self.query(today, today + datetime.timedelta(days=days), category=category)
+
+    def this_week(self, category=None, today=None):
+        """이번 주(월~일)와 겹치는 일정을 반환합니다."""
+        today = today or datetime.date.today()
+        monday = today - datetime.timedelta(days=today.weekday())
+        return self.query(monday, monday + datetime.timedelta(days=6), category=category)
+
+    @staticmethod
+    def to_dataframe(events):
+        """일정 리스트를 화면 표시용 데이터프레임으로 변환합니다."""
+        return pd.DataFrame([{
+            '시작일': event.start,
+            '종료일': event.end,
+            '구분': event.category,
+            '회차': event.round,
+            '시험명': event.name,
+        } for event in events], columns=['시작일', '종료일', '구분', '회차', '시험명']).astype({'회차': 'Int64'})
@@ -0,0 +1,179 @@
+import heapq  # 상위 k개 결과 선택
+
+from name_index import NameIndex  # 문자 n-gram 역색인
+
+# 한글 음절 분해용 호환 자모 테이블 (사용자가 입력하는 'ㅅ' 등과 같은 코드)
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+JUNGSEONG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+JONGSEONG = ['', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ', 'ㄿ', 'ㅀ',
+             'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+
+# 겹자모는 낱자모로 풀어서 비교 (입력 중인 '깃' 과 '기사' 의 'ㄱㅣㅅ' 이 일치하도록)
+COMPOUND_JAMO = {
+    'ㄳ': 'ㄱㅅ', 'ㄵ': 'ㄴㅈ', 'ㄶ': 'ㄴㅎ', 'ㄺ': 'ㄹㄱ', 'ㄻ': 'ㄹㅁ', 'ㄼ': 'ㄹㅂ', 'ㄽ': 'ㄹㅅ',
+    'ㄾ': 'ㄹㅌ', 'ㄿ': 'ㄹㅍ', 'ㅀ': 'ㄹㅎ', 'ㅄ': 'ㅂㅅ',
+    'ㅘ': 'ㅗㅏ', 'ㅙ': 'ㅗㅐ', 'ㅚ': 'ㅗㅣ', 'ㅝ': 'ㅜㅓ', 'ㅞ': 'ㅜㅔ', 'ㅟ': 'ㅜㅣ', 'ㅢ': 'ㅡㅣ',
+}
+
+HANGUL_BASE = 0xAC00  # '가'
+HANGUL_LAST = 0xD7A3  # '힣'
+
+# 일치 종류별 순위 (작을수록 먼저 표시)
+EXACT, PREFIX, SUBSTRING, CHOSEONG_PREFIX, CHOSEONG_SUBSTRING, JAMO_PREFIX, JAMO_SUBSTRING, FUZZY = range(8)
+
+FUZZY_CANDIDATES = 50  # 오타 검색에서 편집 거리를 계산할 최대 후보 수
+
+
+def to_choseong(text):
+    """한글 음절을 초성으로 바꾼 문자열을 반환합니다. (예: '정보처리' -> 'ㅈㅂㅊㄹ')"""
+    chars = []
+    for ch in text.casefold():
+        code = ord(ch)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            chars.append(CHOSEONG[(code - HANGUL_BASE) // 588])
+        else:
+            chars.append(ch)
+    return ''.join(chars)
+
+
+def to_jamo(text):
+    """한글 음절을 낱자모로 분해한 문자열을 반환합니다. (예: '기사' -> 'ㄱㅣㅅㅏ')"""
+    chars = []
+    for ch in text.casefold():
+        code = ord(ch)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            offset = code - HANGUL_BASE
+            chars.append(CHOSEONG[offset // 588])
+            chars.append(JUNGSEONG[(offset % 588) // 28])
+            chars.append(JONGSEONG[offset % 28])
+        else:
+            chars.append(ch)
+    return ''.join(COMPOUND_JAMO.get(ch, ch) for jamo in chars for ch in jamo)
+
+
+def is_choseong_query(text):
+    """검색어가 초성(자음)만으로 이루어져 있는지 확인합니다. (공백, 숫자, 영문은 허용)"""
+    has_consonant = False
+    for ch in text:
+        if ch in CHOSEONG:
+            has_consonant = True
+        elif HANGUL_BASE <= ord(ch) <= HANGUL_LAST or 'ㅏ' <= ch <= 'ㅣ':
+            return False
+    return has_consonant
+
+
+def edit_distance(a, b, max_distance):
+    """
+    두 문자열의 편집 거리(Levenshtein)를 계산합니다.
+
+    거리가 max_distance 를 넘는 것이 확실해지면 계산을 멈추고 max_distance + 1 을 반환합니다.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous = current
+    return previous[-1]
+
+
+class CertificationSearchEngine:
+    """
+    자격증 이름(종목별) 순위 검색 엔진 클래스
+
+    고유한 자격증 이름마다 초성 문자열과 자모 분해 문자열을 미리 만들어 n-gram 색인으로 저장하고,
+    일반 부분 일치 / 초성 검색('ㅈㅂㅊㄹ') / 입력 중인 글자 검색('정보처리기ㅅ') / 오타 검색을
+    색인에서 뽑은 후보에 대해서만 점수를 매겨 상위 k개를 반환합니다.
+    """
+    def __init__(self, names):
+        """
+        Args:
+            names: 자격증 이름 목록 (중복 허용, 예: 데이터프레임의 '종목별' 컬럼)
+        """
+        self.names = sorted({str(name) for name in names})  # 고유한 이름 (사전순)
+        self._folded = [name.casefold() for name in self.names]
+        self._choseong = [to_choseong(name) for name in self.names]
+        self._jamo = [to_jamo(name) for name in self.names]
+
+        # 각 색인의 행 번호는 self.names 의 번호와 같음
+        self._name_index = NameIndex(self._folded)
+        self._choseong_index = NameIndex(self._choseong)
+        self._jamo_index = NameIndex(self._jamo)
+
+    def _ranked(self, index, keys, query, prefix_rank, substring_rank):
+        """색인에서 query 를 포함하는 이름을 찾아 (순위, 위치, 길이, 이름 번호) 목록을 만듭니다."""
+        ranked = []
+        for name_id in index.rows(query):
+            position = keys[name_id].find(query)
+            rank = prefix_rank if position == 0 else substring_rank
+            ranked.append((rank, position, len(keys[name_id]), int(name_id)))
+        return ranked
+
+    def _fuzzy(self, query_jamo, exclude):
+        """자모 조각이 많이 겹치는 후보에 대해서만 편집 거리를 계산하여 오타 검색 결과를 만듭니다."""
+        max_distance = min(3, max(1, len(query_jamo) // 5))
+        ranked = []
+        for name_id in self._jamo_index.similar(query_jamo, FUZZY_CANDIDATES):
+            name_id = int(name_id)
+            if name_id in exclude:
+                continue
+            jamo = self._jamo[name_id]
+            # 이름 전체 또는 입력 길이만큼의 앞부분과 비교 (입력 중인 검색어의 오타도 허용)
+            distance = min(edit_distance(query_jamo, jamo, max_distance),
+                           edit_distance(query_jamo, jamo[:len(query_jamo)], max_distance))
+            if distance <= max_distance:
+                ranked.append((FUZZY, distance, len(jamo), name_id))
+        return ranked
+
+    def search_ranked(self, keyword, k=20):
+        """
+        검색어와 일치하는 자격증 이름을 순위와 함께 반환합니다.
+
+        Args:
+            keyword (str): 검색어
+            k (int): 최대 결과 수
+
+        Returns:
+            list: (이름, 일치 종류) 튜플 리스트 (일치 종류는 EXACT ~ FUZZY, 작을수록 정확한 일치)
+        """
+        query = keyword.strip().casefold()
+        if not query:
+            return []
+
+        ranked = self._ranked(self._name_index, self._folded, query, PREFIX, SUBSTRING)
+        if is_choseong_query(query):
+            ranked += self._ranked(self._choseong_index, self._choseong, query, CHOSEONG_PREFIX, CHOSEONG_SUBSTRING)
+        query_jamo = to_jamo(query)
+        ranked += self._ranked(self._jamo_index, self._jamo, query_jamo, JAMO_PREFIX, JAMO_SUBSTRING)
+
+        best = {}  # 이름 번호별로 가장 좋은 일치만 남김
+        for entry in ranked:
+            rank, position, length, name_id = entry
+            if self._folded[name_id] == query:
+                entry = (EXACT, 0, length, name_id)
+            if name_id not in best or entry < best[name_id]:
+                best[name_id] = entry
+
+        if len(best) < k:  # 정확한 일치가 부족할 때만 오타 검색
+            for entry in self._fuzzy(query_jamo, best):
+                best[entry[3]] = entry
+
+        top = heapq.nsmallest(k, best.values())
+        return [(self.names[entry[3]], entry[0]) for entry in top]
+
+    def search(self, keyword, k=20):
+        """
+        검색어와 일치하는 자격증 이름을 순위대로 최대 k개 반환합니다.
+
+        Args:
+            keyword (str): 검색어 (일반 검색어, 초성, 입력 중인 글자, 오타 모두 허용)
+            k (int): 최대 결과 수
+
+        Returns:
+            list: 자격증 이름 리스트 (정확한 일치 > 앞부분 일치 > 부분 일치 > 초성 > 자모 > 오타 순)
+        """
+        return [name for name, _ in self.search_ranked(keyword, k)]
@@ -0,0 +1,245 @@
+import re  # 등급 머리행 / 자격증 이름 판별
+from collections import Counter  # 이름별 등장 횟수
+
+import numpy as np  # 집계 배열
+import pandas as pd  # 화면 표시용 데이터프레임
+
+from stats_table import freeze_arrays  # 공유 배열 읽기 전용 처리
+
+# 원본 데이터에 등장하는 순서대로의 등급 구분
+TIERS = ['기술사', '기능장', '기사', '산업기사', '기능사']
+OTHER_TIER = '기타'  # 5개 등급 밖 구간(1급/2급/3급/단일등급)의 자격증 ('워드프로세서', '비서1급' 등)
+# 등급 구간을 시작하는 머리행 (서비스 분야 '1급'/'2급'/'3급'/'단일등급' 구간은 5개 등급에 포함하지 않음)
+GRADE_HEADER = re.compile(r'^(기술사|기능장|기사|산업기사|기능사|\d급|단일등급)$')
+# 자격증 이름 (분야 소계 행과 구분: '정보처리기사', '미용장', '소방설비기사(기계분야)' 등)
+CERT_NAME = re.compile(r'(사|장)(\(.+\))?$')
+MIN_APPLICANTS = 30  # 합격률 순위에 포함할 최소 응시 인원 (응시자가 적은 종목의 100% 합격률 등 제외)
+
+
+def tier_of(name):
+    """
+    자격증 이름의 등급 접미사로 TIERS 번호를 찾습니다. (없으면 None)
+
+    '3D프린터개발산업기사' -> 산업기사, '잠수기능장' -> 기능장 처럼 긴 접미사부터 확인하며, 괄호 안의 분야는 무시합니다.
+    """
+    base = re.sub(r'\(.+\)$', '', name)
+    for tier in sorted(TIERS, key=len, reverse=True):
+        if base.endswith(tier):
+            return TIERS.index(tier)
+    return None
+
+
+def _stage(item):
+    """항목 이름의 시험 단계 ('필기합격률[%]' -> '필기')"""
+    return item[:2]
+
+
+class StatsCube:
+    """
+    등급별 / 연도별 합격 통계 집계 클래스
+
+    StatsTable 을 한 번 훑어 아래 값을 모두 미리 계산해 두고, 질의는 배열 색인(slicing)만으로 답합니다.
+      - 등급(기술사/기능장/기사/산업기사/기능사)별 연도별 합계와 가중 합격률 (합격 인원 합 / 응시 인원 합)
+      - 등급 및 자격증별 전년 대비 증감 (합격률은 %p)
+      - 항목/연도별 자격증 순위 (전체 및 등급 안에서의 순위, 결측값은 맨 뒤)
+
+    등급 합계는 원본의 등급 머리행('기사' 등)을 사용합니다.
+    (세부 종목이 따로 나오지 않는 자격증도 합계에는 포함되어 있어 종목 합보다 정확합니다.)
+    """
+    def __init__(self, table, min_applicants=MIN_APPLICANTS):
+        """
+        Args:
+            table (StatsTable): 정규화된 합격률 테이블
+            min_applicants (int): 합격률 순위에 포함할 최소 응시 인원
+        """
+        self.years = list(table.years)
+        self.min_applicants = min_applicants
+
+        names = table.series_names()
+        item_codes = table.series_codes('항목')
+        codes, first = np.unique(item_codes, return_index=True)
+        codes = codes[np.argsort(first)]  # 항목을 원본에 처음 나오는 순서대로 (필기접수[명] ~ 실기합격률[%])
+        self.items = [str(item) for item in table.categories['항목'][codes]]
+        self._item_pos = {item: i for i, item in enumerate(self.items)}
+        position = np.empty(len(table.categories['항목']), dtype=np.int64)
+        position[codes] = np.arange(len(codes))
+        position = position[item_codes]  # 계열별 항목 위치
+
+        # 종목 하나는 연속된 계열로 이루어져 있으므로, 이름이 바뀌거나 항목 위치가 처음으로 돌아가면 새 종목
+        # ('안전관리' 처럼 같은 이름의 분야/세부 분야가 연달아 나오는 경우도 구분됨)
+        new_group = np.r_[True, (names[1:] != names[:-1]) | (position[1:] <= position[:-1])]
+        group = np.cumsum(new_group) - 1  # 계열별 종목 번호
+        group_names = names[new_group]
+
+        values = np.full((len(group_names), len(self.items), len(self.years)), np.nan, dtype=np.float32)
+        values[group, position] = table.values(np.arange(len(names)))  # (종목, 항목, 연도) 큐브
+
+        # 등급 구간 나누기: 등급 머리행부터 다음 머리행 전까지
+        tier_rows = np.full(len(TIERS), -1, dtype=np.int64)
+        cert_rows, cert_tier, other_rows = [], [], []
+        counts = Counter(group_names.tolist())  # 이름별 등장 횟수
+        section, header = None, None
+        for row, name in enumerate(group_names):
+            if GRADE_HEADER.match(name):
+                header = name
+                section = TIERS.index(name) if name in TIERS else None
+                if section is not None:
+                    tier_rows[section] = row
+                continue
+            # 분야 소계('건설', '비파괴검사' 등)는 등급마다 반복되므로, 한 번만 나오는 이름만 자격증으로 취급
+            if counts[name] != 1:
+                continue
+            # '단일등급' 등 5개 등급 밖의 구간 뒤에 나오는 자격증('방재기사', '한복기능장' 등)은 이름의 접미사로 등급을 정함
+            tier = section if section is not None else tier_of(name)
+            if tier is not None and CERT_NAME.search(name) and tier_rows[tier] >= 0:  # 등급 머리행이 있는 등급만
+                cert_rows.append(row)
+                cert_tier.append(tier)
+            elif section is None and header is not None and '.' not in name:
+                # 1급/2급/3급/단일등급 구간의 자격증 (분야 소계는 '숙박.여행.오락.스포츠' 처럼 '.' 으로 이어진 분류명)
+                other_rows.append(row)
+
+        self.tiers = [tier for tier, row in zip(TIERS, tier_rows) if row >= 0]
+        self.tier_values = self._with_weighted_rates(values[tier_rows[tier_rows >= 0]])  # (등급, 항목, 연도)
+        self.tier_yoy = self._yoy(self.tier_values)
+
+        cert_rows = np.array(cert_rows, dtype=np.int64)
+        self.cert_names = group_names[cert_rows]
+        tier_map = np.cumsum(tier_rows >= 0) - 1  # TIERS 번호 -> self.tiers 번호
+        self.cert_tier = tier_map[np.array(cert_tier, dtype=np.int64)].astype(np.int8)
+        self.cert_values = values[cert_rows]  # (자격증, 항목, 연도)
+        self.cert_yoy = self._yoy(self.cert_values)
+        # 등급 밖 자격증은 등급 합계 / 순위에는 넣지 않고 값만 보관 (내보내기 등에서 사용)
+        other_rows = np.array(other_rows, dtype=np.int64)
+        self.other_names = group_names[other_rows]
+        self.other_values = values[other_rows]  # (자격증, 항목, 연도)
+        self.other_yoy = self._yoy(self.other_values)
+        self._build_rankings()
+        # 큐브는 모든 세션이 공유하므로 읽기 전용 (질의 결과는 색인으로 새로 만든 배열)
+        freeze_arrays(self.tier_values, self.tier_yoy, self.cert_names, self.cert_tier, self.cert_values, self.cert_yoy,
+                      self.other_names, self.other_values, self.other_yoy,
+                      self._rank_all, self._rank_tier, self._valid_all, self._valid_tier, self._tier_offsets)
+
+    def _with_weighted_rates(self, values):
+        """합격률 항목을 (합격 인원 합 / 응시 인원 합 * 100) 가중 합격률로 다시 계산합니다."""
+        values = values.copy()
+        for item, pos in self._item_pos.items():
+            if '합격률' not in item:
+                continue
+            passed = self._find_item(_stage(item), '합격[')
+            applied = self._find_item(_stage(item), '응시')
+            with np.errstate(divide='ignore', invalid='ignore'):
+                values[:, pos] = np.where(values[:, applied] > 0, values[:, passed] / values[:, applied] * 100, np.nan)
+        return values
+
+    def _find_item(self, stage, keyword):
+        """시험 단계와 키워드로 항목 위치를 찾습니다. ('필기', '응시' -> '필기응시[명]' 의 위치)"""
+        for item, pos in self._item_pos.items():
+            if item.startswith(stage) and keyword in item:
+                return pos
+        raise KeyError(f"{stage} {keyword}")
+
+    @staticmethod
+    def _yoy(values):
+        """연도 축의 전년 대비 증감 (첫 해는 NaN)"""
+        yoy = np.full_like(values, np.nan)
+        yoy[..., 1:] = values[..., 1:] - values[..., :-1]
+        return yoy
+
+    def _build_rankings(self):
+        """항목/연도별 자격증 순위를 전체 및 등급별로 미리 정렬해 둡니다. (결측값은 각 구간의 맨 뒤)"""
+        keys = self.cert_values.copy()
+        for item, pos in self._item_pos.items():
+            if '합격률' in item:  # 응시 인원이 적은 종목은 합격률 순위에서 제외
+                applied = self._find_item(_stage(item), '응시')
+                keys[:, pos][~(self.cert_values[:, applied] >= self.min_applicants)] = np.nan
+        missing = np.isnan(keys)
+        keys = np.where(missing, -np.inf, keys)  # 내림차순 정렬 시 결측값이 맨 뒤로 가도록
+
+        n_items, n_years = len(self.items), len(self.years)
+        index_dtype = np.int16 if len(self.cert_names) <= np.iinfo(np.int16).max else np.int32
+        self._rank_all = np.empty((n_items, n_years, len(self.cert_names)), dtype=index_dtype)
+        self._rank_tier = np.empty_like(self._rank_all)
+        self._valid_all = (~missing).sum(axis=0)  # (항목, 연도)
+        self._valid_tier = np.zeros((n_items, n_years, len(self.tiers)), dtype=np.int64)
+        for pos in range(n_items):
+            for year in range(n_years):
+                column = keys[:, pos, year]
+                self._rank_all[pos, year] = np.argsort(-column, kind='stable')
+                self._rank_tier[pos, year] = np.lexsort((-column, self.cert_tier))  # 등급 순, 등급 안에서는 값 내림차순
+                self._valid_tier[pos, year] = np.bincount(self.cert_tier[~missing[:, pos, year]],
+                                                          minlength=len(self.tiers))
+        self._tier_offsets = np.r_[0, np.cumsum(np.bincount(self.cert_tier, minlength=len(self.tiers)))]
+
+    def _year_pos(self, year):
+        year = self.years[-1] if year is None else int(year)
+        return self.years.index(year)
+
+    def tier_summary(self, year=None):
+        """
+        연도 하나의 등급별 합계와 가중 합격률을 반환합니다.
+
+        Args:
+            year (int): 연도 (기본값: 가장 최근 연도)
+
+        Returns:
+            pd.DataFrame: 등급을 인덱스, 항목을 컬럼으로 하는 데이터프레임
+        """
+        return pd.DataFrame(self.tier_values[:, :, self._year_pos(year)], index=pd.Index(self.tiers, name='등급'),
+                            columns=self.items)
+
+    def tier_trend(self, item, tier=None):
+        """
+        항목 하나의 연도별 추이와 전년 대비 증감을 반환합니다.
+
+        Args:
+            item (str): 항목 ('실기합격률[%]' 등)
+            tier (str): 등급 (기본값: 모든 등급)
+
+        Returns:
+            pd.DataFrame: 연도를 인덱스로 하고 등급별 값과 '전년 대비' 컬럼이 있는 데이터프레임
+        """
+        pos = self._item_pos[item]
+        tiers = self.tiers if tier is None else [tier]
+        data = {}
+        for tier_name in tiers:
+            t = self.tiers.index(tier_name)
+            data[tier_name] = self.tier_values[t, pos]
+            data[f'{tier_name} 전년 대비'] = self.tier_yoy[t, pos]
+        return pd.DataFrame(data, index=pd.Index(self.years, name='연도'))
+
+    def _ranked(self, item, year, n, tier, ascending):
+        pos, year_pos = self._item_pos[item], self._year_pos(year)
+        if tier is None:
+            order, valid = self._rank_all[pos, year_pos], self._valid_all[pos, year_pos]
+        else:
+            t = self.tiers.index(tier)
+            lo = self._tier_offsets[t]
+            order = self._rank_tier[pos, year_pos, lo:self._tier_offsets[t + 1]]
+            valid = self._valid_tier[pos, year_pos, t]
+        rows = order[max(valid - n, 0):valid][::-1] if ascending else order[:min(n, valid)]
+        return pd.DataFrame({
+            '순위': np.arange(1, len(rows) + 1),
+            '종목별': self.cert_names[rows],
+            '등급': np.array(self.tiers)[self.cert_tier[rows]],
+            item: self.cert_values[rows, pos, year_pos],
+            '전년 대비': self.cert_yoy[rows, pos, year_pos],
+        })
+
+    def top(self, item, year=None, n=10, tier=None):
+        """
+        항목 값이 큰 순서로 자격증 n개를 반환합니다. (합격률은 응시 인원이 min_applicants 이상인 종목만)
+
+        Args:
+            item (str): 항목 ('실기합격률[%]', '필기응시[명]' 등)
+            year (int): 연도 (기본값: 가장 최근 연도)
+            n (int): 반환할 자격증 수
+            tier (str): 등급 (기본값: 전체)
+
+        Returns:
+            pd.DataFrame: 순위, 종목별, 등급, 항목 값, 전년 대비 컬럼의 데이터프레임
+        """
+        return self._ranked(item, year, n, tier, ascending=False)
+
+    def bottom(self, item, year=None, n=10, tier=None):
+        """항목 값이 작은 순서로 자격증 n개를 반환합니다. (결측값 제외, 인자는 top()과 같음)"""
+        return self._ranked(item, year, n, tier, ascending=True)
@@ -0,0 +1,355 @@
+import re  # 연도 컬럼 이름에서 연도 추출
+
+import numpy as np  # 컬럼 배열 저장
+import pandas as pd  # 화면 표시용 데이터프레임 구성
+
+from name_index import NameIndex  # 자격증 이름 n-gram 색인
+
+# 범주형(categorical) 코드로 저장하는 문자열 컬럼
+CATEGORY_COLUMNS = ['종목별', '항목', '단위']
+RATE_UNIT = '%'  # 합격률 행의 단위
+MISSING_LABEL = '-'  # 결측값 표시 문자열
+
+
+def year_label(year):
+    """연도 숫자를 화면/원본 CSV 에서 쓰는 컬럼 이름으로 바꿉니다. (2019 -> '2019 년')"""
+    return f"{year} 년"
+
+
+def parse_year(label):
+    """'2019 년' 형태의 컬럼 이름에서 연도 숫자를 꺼냅니다."""
+    return int(re.search(r'\d{4}', label).group())
+
+
+def format_values(values, is_rate, units):
+    """
+    수치 배열 전체를 화면 표시용 문자열로 한 번에 변환합니다. (행/셀 단위 반복 없음)
+
+    합격률 행은 소수점 한 자리와 '%' ('45.9%'), 그 외 행은 천 단위 쉼표와 단위 ('1,234명'), 결측값은 '-' 로 표시합니다.
+    같은 값은 한 번만 문자열로 만들고 나머지는 배열 색인으로 채웁니다.
+
+    Args:
+        values (np.ndarray): (행 수, 열 수) 수치 배열 (결측값은 NaN)
+        is_rate (np.ndarray): 행별 합격률 여부 (bool)
+        units (np.ndarray): 행별 단위 문자열 ('명', '%' 등)
+
+    Returns:
+        np.ndarray: values 와 같은 모양의 문자열(object) 배열
+    """
+    values = np.asarray(values)
+    labels = np.full(values.shape, MISSING_LABEL, dtype=object)
+    present = ~np.isnan(values)
+    rate = np.broadcast_to(np.asarray(is_rate, dtype=bool)[:, None], values.shape)
+
+    mask = present & rate
+    if mask.any():
+        # float32 값은 가장 짧은 십진 표기('45.95')를 거쳐 float64 로 바꿔야 원본 CSV 값과 같은 반올림 결과가 나옴
+        unique, inverse = np.unique(values[mask], return_inverse=True)
+        text = np.array([f"{x:.1f}%" for x in unique.astype(str).astype(np.float64).tolist()], dtype=object)
+        labels[mask] = text[inverse]
+
+    mask = present & ~rate
+    if mask.any():
+        unique, inverse = np.unique(values[mask].astype(np.int64), return_inverse=True)
+        text = np.array([f"{x:,}" for x in unique.tolist()], dtype=object)
+        unit = np.broadcast_to(np.asarray(units, dtype=object)[:, None], values.shape)[mask]
+        labels[mask] = text[inverse] + unit
+    return labels
+
+
+def freeze_arrays(*arrays):
+    """배열을 읽기 전용으로 바꿉니다. (여러 세션이 공유하는 배열을 실수로 수정하면 ValueError 발생)"""
+    for array in arrays:
+        array.flags.writeable = False
+
+
+def smallest_int_dtype(max_value):
+    """max_value 까지 담을 수 있는 가장 작은 부호 있는 정수 타입을 반환합니다."""
+    for dtype in (np.int8, np.int16, np.int32):
+        if max_value <= np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+
+class StatsTable:
+    """
+    자격증 합격률 통계의 정규화된(tidy) 테이블 클래스
+
+    원본 CSV 의 한 행(종목, 항목, 단위)을 '계열(series)'이라 하고,
+    (종목, 항목, 단위, 연도, 값) 한 행이 계열 하나의 한 해 값을 나타냅니다.
+    문자열 컬럼은 범주 코드(int8/int16)로, 연도는 int16, 값은 float32 로 저장하고 결측값은 NaN 으로 유지합니다.
+    관측값은 연도별 블록(블록마다 모든 계열이 같은 순서로 들어 있음)으로 저장하므로,
+    연도를 추가해도 컬럼이 늘지 않고 블록 하나만 뒤에 붙습니다.
+    """
+    def __init__(self, categories, codes, year, value, n_series):
+        """
+        Args:
+            categories (dict): 컬럼 -> 범주 목록 (np.ndarray of str)
+            codes (dict): 컬럼 -> 관측값별 범주 코드 배열
+            year (np.ndarray): 관측값별 연도 (int16)
+            value (np.ndarray): 관측값 (float32, 결측값은 NaN)
+            n_series (int): 계열 수 (연도 블록 하나의 길이)
+        """
+        self.categories = categories
+        self.codes = codes
+        self.year = year
+        self.value = value
+        self.n_series = int(n_series)
+        self.years = [int(y) for y in year[::self.n_series]] if self.n_series else []  # 블록 순서대로의 연도 목록
+
+        units = list(categories['단위'])
+        rate_code = units.index(RATE_UNIT) if RATE_UNIT in units else -1
+        self.is_rate = codes['단위'] == rate_code  # 관측값별 합격률 여부 (합격 인원은 ~is_rate)
+        self._views = {}
+        self._labels = None  # 관측값별 표시 문자열 (처음 사용할 때 한 번만 생성)
+
+    @classmethod
+    def from_wide(cls, df):
+        """
+        원본 CSV 형태(연도가 컬럼)의 데이터프레임으로 테이블을 만듭니다.
+
+        Args:
+            df (pd.DataFrame): '종목별', '항목', '단위' 와 '2019 년' 같은 연도 컬럼이 있는 데이터프레임
+
+        Returns:
+            StatsTable: 정규화된 테이블
+        """
+        year_cols = [col for col in df.columns if '년' in col]
+        n_series, n_years = len(df), len(year_cols)
+        categories, codes = {}, {}
+        for col in CATEGORY_COLUMNS:
+            cat = pd.Categorical(df[col].astype(str))
+            categories[col] = np.asarray(cat.categories, dtype=str)
+            dtype = smallest_int_dtype(len(cat.categories))
+            codes[col] = np.tile(cat.codes.astype(dtype), n_years)  # 연도 블록마다 같은 계열 순서
+        year = np.repeat(np.array([parse_year(col) for col in year_cols], dtype=np.int16), n_series)
+        value = df[year_cols].to_numpy(dtype=np.float32).T.reshape(-1)  # 연도별 블록으로 펼침
+        return cls(categories, codes, year, value, n_series)
+
+    def append_years(self, years, values):
+        """
+        연도 블록을 뒤에 이어 붙인 새 테이블을 반환합니다. (기존 블록은 다시 변환하지 않음)
+
+        계열 구성(종목, 항목, 단위)은 그대로이므로 범주 목록, 보기, 보기별 종목명 색인은 그대로 넘겨받고,
+        표시 문자열도 이미 만들어 둔 경우 새 블록만 변환하여 이어 붙입니다.
+
+        Args:
+            years (list): 추가할 연도 (기존 마지막 연도보다 뒤, 오름차순)
+            values (np.ndarray): (연도 수, 계열 수) 값 배열 (계열 순서는 테이블과 같음, 결측값은 NaN)
+
+        Returns:
+            StatsTable: 연도가 추가된 테이블
+
+        Raises:
+            ValueError: 연도가 기존 연도보다 앞서거나 값 배열의 모양이 맞지 않는 경우
+        """
+        years = [int(year) for year in years]
+        values = np.asarray(values, dtype=np.float32)
+        if values.shape != (len(years), self.n_series):
+            raise ValueError(f"값 배열의 모양이 {values.shape} 입니다. ({(len(years), self.n_series)} 이어야 함)")
+        if any(a >= b for a, b in zip(self.years[-1:] + years, years)):
+            raise ValueError(f"연도는 기존 마지막 연도 뒤에 오름차순으로만 추가할 수 있습니다: {years}")
+
+        n_new = len(years)
+        codes = {col: np.concatenate([self.codes[col], np.tile(self.series_codes(col), n_new)])
+                 for col in CATEGORY_COLUMNS}
+        year = np.concatenate([self.year, np.repeat(np.array(years, dtype=np.int16), self.n_series)])
+        value = np.concatenate([self.value, values.reshape(-1)])
+        table = StatsTable(self.categories, codes, year, value, self.n_series)
+
+        for kind, view in self._views.items():  # 계열 번호와 종목명 색인은 연도와 무관
+            table._views[kind] = StatsView(table, view.series_ids)
+            table._views[kind]._index = view._index
+        if self._labels is not None:
+            units = self.categories['단위'][self.series_codes('단위')]
+            block = format_values(values.T, self.is_rate[:self.n_series], units)  # (계열 수, 새 연도 수)
+            table._labels = np.concatenate([self._labels, block.T.reshape(-1)])
+        return table
+
+    def __len__(self):
+        return len(self.value)
+
+    @property
+    def nbytes(self):
+        """테이블이 차지하는 메모리 (bytes)"""
+        arrays = [self.year, self.value, self.is_rate, *self.codes.values(), *self.categories.values()]
+        return sum(array.nbytes for array in arrays)
+
+    def year_labels(self):
+        """사용 가능한 연도 컬럼 이름 목록 ('2019 년' 등, 데이터에서 자동으로 찾음)"""
+        return [year_label(year) for year in self.years]
+
+    def series_codes(self, column):
+        """계열별 범주 코드 (첫 연도 블록의 코드, 복사 없음)"""
+        return self.codes[column][:self.n_series]
+
+    def series_names(self):
+        """계열별 종목명 (str 배열)"""
+        return self.categories['종목별'][self.series_codes('종목별')]
+
+    def series_mask(self, kind):
+        """
+        계열 단위 보기 마스크를 반환합니다.
+
+        Args:
+            kind (str): 'people' (합격 인원) 또는 'rate' (합격률)
+
+        Returns:
+            np.ndarray: 계열별 bool 마스크 (관측값 마스크 is_rate 의 첫 블록, 복사 없음)
+        """
+        rate = self.is_rate[:self.n_series]
+        return rate if kind == 'rate' else ~rate
+
+    def values(self, series_ids, years=None):
+        """
+        선택한 계열의 연도별 값을 (계열 수, 연도 수) 배열로 모읍니다.
+
+        Args:
+            series_ids (np.ndarray): 계열 번호
+            years (list): 연도 목록 (기본값: 전체)
+
+        Returns:
+            np.ndarray: float32 배열 (결측값은 NaN)
+        """
+        years = self.years if years is None else years
+        blocks = np.array([self.years.index(year) for year in years], dtype=np.int64) * self.n_series
+        return self.value[blocks[None, :] + np.asarray(series_ids, dtype=np.int64)[:, None]]
+
+    def wide(self, series_ids=None, years=None, index=None):
+        """
+        선택한 계열만 원본 CSV 형태(연도가 컬럼)의 데이터프레임으로 만듭니다. (화면 표시용)
+
+        Args:
+            series_ids (np.ndarray): 계열 번호 (기본값: 전체)
+            years (list): 연도 목록 (기본값: 전체)
+            index: 데이터프레임 인덱스 (기본값: 계열 번호)
+
+        Returns:
+            pd.DataFrame: '종목별', '항목', '단위', 연도 컬럼으로 이루어진 데이터프레임
+        """
+        series_ids = np.arange(self.n_series) if series_ids is None else np.asarray(series_ids)
+        years = self.years if years is None else years
+        data = {}
+        for col in CATEGORY_COLUMNS:
+            data[col] = pd.Categorical.from_codes(self.series_codes(col)[series_ids], categories=self.categories[col])
+        values = self.values(series_ids, years)
+        for i, year in enumerate(years):
+            data[year_label(year)] = values[:, i]
+        return pd.DataFrame(data, index=series_ids if index is None else index)
+
+    @property
+    def labels(self):
+        """관측값별 화면 표시 문자열 배열 ('45.9%', '1,234명', '-') - 처음 사용할 때 전체를 한 번에 변환"""
+        if self._labels is None:
+            units = self.categories['단위'][self.codes['단위']]
+            self._labels = format_values(self.value[:, None], self.is_rate, units)[:, 0]
+        return self._labels
+
+    def display(self, series_ids, years=None):
+        """
+        선택한 계열을 화면 표시용 데이터프레임으로 만듭니다. (값은 단위가 붙은 문자열)
+
+        표시 문자열은 테이블 전체에 대해 미리 만들어 두므로, 검색 결과가 수천 행이어도 배열 색인만 합니다.
+
+        Args:
+            series_ids (np.ndarray): 계열 번호
+            years (list): 연도 목록 (기본값: 전체)
+
+        Returns:
+            pd.DataFrame: '종목별', '항목', 연도 컬럼으로 이루어진 데이터프레임 (인덱스는 0부터)
+        """
+        series_ids = np.asarray(series_ids, dtype=np.int64)
+        years = self.years if years is None else years
+        blocks = np.array([self.years.index(year) for year in years], dtype=np.int64) * self.n_series
+        labels = self.labels[blocks[None, :] + series_ids[:, None]]
+        data = {col: self.categories[col][self.series_codes(col)[series_ids]] for col in ('종목별', '항목')}
+        for i, year in enumerate(years):
+            data[year_label(year)] = labels[:, i]
+        return pd.DataFrame(data)
+
+    def to_frame(self):
+        """정규화된 (종목, 항목, 단위, 연도, 값) 데이터프레임을 반환합니다."""
+        data = {col: pd.Categorical.from_codes(self.codes[col], categories=self.categories[col])
+                for col in CATEGORY_COLUMNS}
+        data['연도'] = self.year
+        data['값'] = self.value
+        return pd.DataFrame(data)
+
+    def missing_ratio(self):
+        """연도별 결측값 비율 {연도: 비율}"""
+        blocks = np.isnan(self.value).reshape(len(self.years), self.n_series)
+        return dict(zip(self.years, blocks.mean(axis=1)))
+
+    def view(self, kind):
+        """합격 인원('people') 또는 합격률('rate') 보기를 반환합니다. (보기마다 한 번만 생성)"""
+        if kind not in self._views:
+            self._views[kind] = StatsView(self, np.flatnonzero(self.series_mask(kind)))
+        return self._views[kind]
+
+    def freeze(self):
+        """
+        모든 세션이 공유할 수 있도록 테이블을 읽기 전용으로 만듭니다.
+
+        처음 사용할 때 만들던 표시 문자열(labels)과 보기 / 보기별 색인을 미리 만들어 두고,
+        모든 배열을 읽기 전용으로 바꿉니다. 이후 테이블은 조회만 하므로 여러 세션(스레드)이 잠금 없이 함께 읽을 수 있으며,
+        각 세션에는 검색 결과처럼 배열 색인으로 새로 만든 결과만 남습니다.
+
+        Returns:
+            StatsTable: 자기 자신
+        """
+        for kind in ('people', 'rate'):
+            view = self.view(kind)
+            view.index  # 보기별 종목명 색인 생성
+            freeze_arrays(view.series_ids)
+        freeze_arrays(self.year, self.value, self.is_rate, self.labels, *self.codes.values(), *self.categories.values())
+        return self
+
+
+class StatsView:
+    """
+    StatsTable 의 일부 계열만 보는 보기 클래스 (합격 인원 / 합격률)
+
+    데이터를 복사하지 않고 계열 번호만 가지고 있다가, 검색 결과처럼 필요한 행만 데이터프레임으로 만듭니다.
+    보기 안에서의 행 번호(0부터)는 기존 people_pr_df / per_pr_df 의 행 번호와 같습니다.
+    """
+    def __init__(self, table, series_ids):
+        """
+        Args:
+            table (StatsTable): 원본 테이블
+            series_ids (np.ndarray): 보기에 포함된 계열 번호 (오름차순)
+        """
+        self.table = table
+        self.series_ids = series_ids
+        self._index = None
+
+    def __len__(self):
+        return len(self.series_ids)
+
+    @property
+    def index(self):
+        """보기의 종목명 n-gram 색인 (처음 사용할 때 한 번만 생성)"""
+        if self._index is None:
+            self._index = NameIndex(self.table.series_names()[self.series_ids])
+        return self._index
+
+    def year_labels(self):
+        """사용 가능한 연도 컬럼 이름 목록"""
+        return self.table.year_labels()
+
+    def frame(self, rows=None, years=None):
+        """
+        보기의 행(rows, 보기 안의 행 번호)을 데이터프레임으로 만듭니다.
+
+        Args:
+            rows (np.ndarray): 보기 안의 행 번호 (기본값: 전체)
+            years (list): 연도 목록 (기본값: 전체)
+
+        Returns:
+            pd.DataFrame: 보기 안의 행 번호를 인덱스로 하는 데이터프레임
+        """
+        rows = np.arange(len(self)) if rows is None else np.asarray(rows)
+        return self.table.wide(self.series_ids[rows], years=years, index=rows)
+
+    def search(self, keyword):
+        """종목명에 검색어(일반 문자열)가 포함된 행만 데이터프레임으로 반환합니다."""
+        return self.frame(self.index.rows(keyword))
@@ -14,8 +14,7 @@ else:  # Linux (Colab, Ubuntu 등)
 plt.rcParams['axes.unicode_minus'] = False  # 마이너스 깨짐 방지
 
 # 📌 전처리된 데이터프레임
-people_df = bg.people_pr_df  # 합격 인원
-per_df = bg.per_pr_df        # 합격률
+people_df, per_df = bg.load_views()  # 합격 인원, 합격률 (정규화 테이블의 보기)
 
 # 🏷️ 앱 제목
 st.title("📊 자격증 연도별 통계 시각화")
@@ -24,7 +23,7 @@ st.title("📊 자격증 연도별 통계 시각화")
 view_type = st.selectbox("📈 보고 싶은 항목을 선택하세요", ["합격률 (%)", "합격 인원 수"])
 
 # 📅 연도 선택 (멀티 선택)
-all_years = ['2019 년', '2020 년', '2021 년', '2022 년', '2023 년']
+all_years = people_df.year_labels()  # 데이터에 있는 연도를 자동으로 찾음 (새 연도를 추가해도 코드 수정 없음)
 selected_years = st.multiselect("📆 확인할 연도를 선택하세요", all_years, default=all_years)
 
 # 🔍 검색어 입력
@@ -42,7 +41,7 @@ else:
 
 # 🔎 검색 및 시각화
 if search_term:
-    filtered_df = current_df[current_df['종목별'].str.contains(search_term, case=False)]
+    filtered_df = current_df.search(search_term)
 
     if filtered_df.empty:
         st.warning("검색 결과가 없습니다.")
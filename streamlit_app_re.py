@@ -1,48 +1,187 @@
 import streamlit as st  # Streamlit 라이브러리 import (웹 앱 개발)
 import pandas as pd  # Pandas 라이브러리 import (데이터 조작 및 분석)
-import matplotlib.pyplot as plt  # Matplotlib 라이브러리 import (그래프 그리기)
+import matplotlib  # Matplotlib 라이브러리 import (그래프 설정)
+from matplotlib.figure import Figure  # pyplot 전역 상태 없이 그래프 그리기 (여러 스레드에서 동시에 그려도 안전)
 import platform  # 플랫폼 정보 접근 라이브러리 import
-import bar_graph as bg  # bar_graph.py 파일에서 정의된 객체(bg)를 import
+import io  # 그래프 이미지를 메모리 버퍼에 저장
+import math  # 그래프 격자 행 수 계산
+import threading  # 그래프 이미지 캐시 잠금
+from collections import OrderedDict  # 그래프 이미지 LRU 캐시
+import bar_graph as bg  # bar_graph.py 파일의 데이터 로더(bg)를 import
+from metrics import METRICS  # 그래프 캐시 적중 횟수 / 그리기 시간 기록
 
 # streamlit run streamlit_app_re.py
 
+CHARTS_PER_PAGE = 12  # 한 페이지(한 장의 이미지)에 그릴 그래프 수
+CHART_COLUMNS = 3  # 한 줄에 그릴 그래프 수
+CHART_CACHE_SIZE = 128  # 메모리에 보관할 그래프 이미지(페이지) 수
+VIEW_TYPES = {"합격률 (%)": ('rate', "합격률 (%)", 100), "합격 인원 수": ('people', "합격 인원 수", None)}
+# 보기 종류 -> (테이블 보기 이름, y축 레이블, y축 최대값)
+
+# 렌더링된 그래프 이미지 캐시 (모든 세션이 공유)
+# 키: (((종목, 항목), ...), 선택 연도, 보기 종류) -> PNG 이미지 bytes
+_chart_cache = OrderedDict()
+_chart_cache_lock = threading.Lock()
+
+
+def set_korean_font():
+    """플랫폼에 따라 Matplotlib 한글 폰트를 설정합니다. (이미 설정되어 있으면 전역 rcParams 를 건드리지 않음)"""
+    if platform.system() == 'Windows':  # 운영체제가 Windows인 경우
+        family = 'Malgun Gothic'  # 맑은 고딕 폰트 설정
+    elif platform.system() == 'Darwin':  # macOS인 경우
+        family = 'AppleGothic'  # AppleGothic 폰트 설정
+    else:  # Linux 등 다른 운영체제인 경우
+        family = 'NanumGothic'  # 나눔고딕 폰트 설정
+    if matplotlib.rcParams['font.family'] == [family] and not matplotlib.rcParams['axes.unicode_minus']:
+        return  # Streamlit 이 스크립트를 다시 실행할 때 (미리 불러오기 스레드가 그리는 중일 수 있음)
+    matplotlib.rcParams['font.family'] = family
+    matplotlib.rcParams['axes.unicode_minus'] = False  # 그래프에서 음수 기호 깨짐 방지
+
+
+set_korean_font()  # 전역 rcParams 는 import 할 때 한 번만 설정 (그리는 중에 다른 스레드가 바꾸지 않도록)
+
+
+@METRICS.timed('chart.render')
+def render_chart_grid(years, values, titles, y_labels, y_max=None, columns=CHART_COLUMNS):
+    """
+    여러 행의 연도별 값을 한 장의 작은 그래프 묶음(small multiples)으로 그려 PNG bytes로 반환합니다.
+
+    Streamlit 화면(CertificationVisualizer), 미리 불러오기 스레드, 일괄 내보내기(export_stats.py)에서 함께 사용합니다.
+    pyplot 을 거치지 않고 Figure 를 직접 만들므로 여러 스레드에서 동시에 호출해도 되고, 닫을 필요 없이 반환 후 메모리가 해제됩니다.
+
+    Args:
+        years (list): x축 연도 컬럼 이름 ('2019 년' 등)
+        values (np.ndarray): (행 수, 연도 수) 배열 (결측값 NaN 은 막대를 그리지 않음)
+        titles (list): 그래프별 제목
+        y_labels (list): 그래프별 y축 레이블
+        y_max (float or list): y축 최대값 (합격률은 100, 그 외는 None 으로 자동 설정, 그래프별로 다르면 리스트)
+        columns (int): 한 줄에 그릴 그래프 수
+
+    Returns:
+        bytes: PNG 이미지
+    """
+    y_maxes = list(y_max) if isinstance(y_max, (list, tuple)) else [y_max] * len(titles)
+    n_cols = min(columns, len(titles))
+    n_rows = math.ceil(len(titles) / n_cols)
+    fig = Figure(figsize=(4 * n_cols, 2.8 * n_rows))  # pyplot 에 등록되지 않는 그래프 (plt.close 불필요)
+    axes = fig.subplots(n_rows, n_cols, squeeze=False,
+                        sharey=not isinstance(y_max, (list, tuple)) and bool(y_max))  # 합격률만 그릴 때는 같은 y축(0~100)을 공유
+    for i, ax in enumerate(axes.flat):
+        if i >= len(titles):
+            ax.axis('off')  # 남는 칸은 숨김
+            continue
+        ax.bar(years, values[i])
+        ax.set_title(titles[i], fontsize=10)
+        ax.set_ylabel(y_labels[i], fontsize=8)
+        ax.tick_params(labelsize=8)
+        if y_maxes[i]:
+            ax.set_ylim(0, y_maxes[i])
+        ax.grid(axis='y', linestyle='--', alpha=0.5)
+    fig.tight_layout()
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=100)
+    return buffer.getvalue()
+
+
+def chart_key(page_df, selected_years, view_type):
+    """그래프 이미지 캐시 키 (페이지의 (종목, 항목) 목록, 선택 연도, 보기 종류)"""
+    pairs = tuple(zip(page_df['종목별'].astype(str), page_df['항목'].astype(str)))
+    return pairs, tuple(selected_years), view_type
+
+
+def chart_page_image(page_df, selected_years, view_type, y_label, y_max):
+    """
+    한 페이지의 그래프 이미지를 반환합니다. 캐시에 같은 페이지 이미지가 있으면 그대로 사용하고, 없으면 그려서 캐시에 저장합니다.
+
+    연도별 값은 행마다 꺼내지 않고 한 번에 배열로 가져옵니다. (Streamlit 출력 없음, 미리 불러오기 스레드에서도 사용)
+
+    Args:
+        page_df (pd.DataFrame): 한 페이지에 그릴 행들
+        selected_years (list): 선택 연도 컬럼 이름
+        view_type (str): 보기 종류 ("합격률 (%)" 또는 "합격 인원 수")
+        y_label (str): y축 레이블
+        y_max (float): y축 최대값 (None 이면 자동)
+
+    Returns:
+        bytes: PNG 이미지
+    """
+    key = chart_key(page_df, selected_years, view_type)
+    with _chart_cache_lock:
+        image = _chart_cache.get(key)
+        if image is not None:
+            _chart_cache.move_to_end(key)
+            METRICS.incr('chart.cache_hit')
+            return image
+    METRICS.incr('chart.cache_miss')
+    values = page_df[list(selected_years)].to_numpy(dtype=float)  # (행 수, 연도 수) 배열 (결측값 NaN 은 막대를 그리지 않음)
+    titles = (page_df['종목별'].astype(str) + " - " + page_df['항목'].astype(str)).tolist()
+    image = render_chart_grid(list(selected_years), values, titles, [y_label] * len(titles), y_max)
+    with _chart_cache_lock:
+        _chart_cache[key] = image
+        while len(_chart_cache) > CHART_CACHE_SIZE:
+            _chart_cache.popitem(last=False)  # 가장 오래 쓰지 않은 이미지부터 제거
+    return image
+
+
+def is_chart_cached(page_df, selected_years, view_type):
+    """같은 페이지 이미지가 캐시에 있는지 확인합니다. (LRU 순서와 적중 횟수는 바꾸지 않음)"""
+    with _chart_cache_lock:
+        return chart_key(page_df, selected_years, view_type) in _chart_cache
+
+
+def warm_charts(search_term, selected_years=None):
+    """
+    검색어의 첫 페이지 그래프를 두 보기 종류(합격률 / 합격 인원) 모두 미리 그려 캐시에 넣습니다.
+
+    화면의 기본값(모든 연도 선택, 1페이지)과 같은 캐시 키를 사용하므로, 같은 검색어로 탭을 열면 바로 캐시에서 표시됩니다.
+
+    Args:
+        search_term (str): 검색어 (세션 상태의 search_keyword 와 같은 값)
+        selected_years (list): 선택 연도 컬럼 이름 (기본값: 데이터의 모든 연도)
+
+    Returns:
+        int: 새로 그린 이미지 수 (이미 캐시에 있으면 0)
+    """
+    table = bg.load_table()
+    selected_years = table.year_labels() if selected_years is None else selected_years
+    rendered = 0
+    for view_type, (view_name, y_label, y_max) in VIEW_TYPES.items():
+        filtered_df = table.view(view_name).search(search_term)
+        if filtered_df is None or filtered_df.empty:
+            continue
+        page_df = filtered_df.iloc[:CHARTS_PER_PAGE]
+        if not is_chart_cached(page_df, selected_years, view_type):
+            chart_page_image(page_df, selected_years, view_type, y_label, y_max)
+            rendered += 1
+    return rendered
+
+
 class CertificationVisualizer:
     """자격증 연도별 통계 시각화를 위한 클래스"""
-    def __init__(self, people_df, per_df):
+    def __init__(self, people_view, per_view):
         """
         초기화 메서드
 
         Args:
-            people_df (pd.DataFrame): 합격 인원 데이터프레임
-            per_df (pd.DataFrame): 합격률 데이터프레임
+            people_view (StatsView): 합격 인원 보기 (bar_graph.load_views())
+            per_view (StatsView): 합격률 보기 (bar_graph.load_views())
         """
-        self.people_df = people_df  # 인수로 받은 합격 인원 데이터프레임을 클래스 속성에 저장
-        self.per_df = per_df        # 인수로 받은 합격률 데이터프레임을 클래스 속성에 저장
-        self._set_korean_font()   # 한글 폰트 설정 메서드 호출
+        self.people_view = people_view  # 인수로 받은 합격 인원 보기를 클래스 속성에 저장
+        self.per_view = per_view        # 인수로 받은 합격률 보기를 클래스 속성에 저장
         st.title("📊 자격증 연도별 통계 시각화")  # Streamlit 앱 제목 표시
-        self.all_years = ['2019 년', '2020 년', '2021 년', '2022 년', '2023 년']  # 선택 가능한 모든 연도 리스트 정의
+        self.all_years = people_view.year_labels()  # 선택 가능한 모든 연도 리스트 (데이터에 있는 연도를 자동으로 찾음)
         self.selected_years = st.multiselect("📆 확인할 연도를 선택하세요", self.all_years, default=self.all_years)  # 연도 선택 멀티 셀렉트 위젯 생성 (기본값으로 모든 연도 선택)
         self.view_type = st.selectbox("📈 보고 싶은 항목을 선택하세요", ["합격률 (%)", "합격 인원 수"])  # 보고 싶은 항목 선택 셀렉트 박스 생성
-        self.current_df = self._set_current_dataframe()  # 선택된 보기에 따라 사용할 데이터프레임 설정 메서드 호출
+        self.current_view = self._set_current_view()  # 선택된 보기에 따라 사용할 데이터 보기 설정 메서드 호출
         self.y_label = self._set_y_label()        # y축 레이블 설정 메서드 호출
         self.y_max = self._set_y_max()          # y축 최대값 설정 메서드 호출
 
-    def _set_korean_font(self):
-        """플랫폼에 따라 한글 폰트를 설정하는 내부 메서드"""
-        if platform.system() == 'Windows':  # 운영체제가 Windows인 경우
-            plt.rcParams['font.family'] = 'Malgun Gothic'  # 맑은 고딕 폰트 설정
-        elif platform.system() == 'Darwin':  # macOS인 경우
-            plt.rcParams['font.family'] = 'AppleGothic'  # AppleGothic 폰트 설정
-        else:  # Linux 등 다른 운영체제인 경우
-            plt.rcParams['font.family'] = 'NanumGothic'  # 나눔고딕 폰트 설정
-        plt.rcParams['axes.unicode_minus'] = False  # 그래프에서 음수 기호 깨짐 방지
-
-    def _set_current_dataframe(self):
-        """선택된 보기에 따라 사용할 데이터프레임을 반환하는 내부 메서드"""
+    def _set_current_view(self):
+        """선택된 보기에 따라 사용할 데이터 보기를 반환하는 내부 메서드"""
         if self.view_type == "합격률 (%)":  # 보고 싶은 항목으로 '합격률 (%)'이 선택된 경우
-            return self.per_df  # 합격률 데이터프레임 반환
+            return self.per_view  # 합격률 보기 반환
         else:  # 그 외 (여기서는 '합격 인원 수'가 선택된 경우)
-            return self.people_df  # 합격 인원 데이터프레임 반환
+            return self.people_view  # 합격 인원 보기 반환
 
     def _set_y_label(self):
         """선택된 보기에 따라 y축 레이블을 반환하는 내부 메서드"""
@@ -61,19 +200,35 @@ class CertificationVisualizer:
     def _filter_dataframe(self):
         """검색어에 따라 데이터프레임을 필터링하는 내부 메서드"""
         if self.search_term:  # 검색어가 입력된 경우
-            filtered_df = self.current_df[self.current_df['종목별'].str.contains(self.search_term, case=False)]  # '종목별' 컬럼에 검색어를 포함하는 행을 찾아 필터링 (대소문자 구분 없이)
+            filtered_df = self.current_view.search(self.search_term)  # '종목별' 색인에서 검색어를 포함하는 행만 데이터프레임으로 만듦 (대소문자 구분 없이, 일반 문자열로 비교)
             return filtered_df  # 필터링된 데이터프레임 반환
         return None  # 검색어가 없으면 None 반환
 
-    def _plot_bar_chart(self, data, title):
-        """막대 그래프를 그리고 Streamlit에 표시하는 내부 메서드"""
-        plt.figure(figsize=(8, 4))  # 그래프의 가로, 세로 크기 설정
-        plt.bar(self.selected_years, data[self.selected_years].values)  # 선택된 연도를 x축, 해당 연도의 값을 y축으로 하는 막대 그래프 생성
-        plt.ylabel(self.y_label)  # y축 레이블 설정
-        if self.y_max:  # y축 최대값이 설정된 경우
-            plt.ylim(0, self.y_max)  # y축의 범위를 0부터 y축 최대값까지로 설정
-        plt.grid(axis='y', linestyle='--', alpha=0.5)  # y축 방향으로 점선 형태의 격자선 표시 (투명도 0.5)
-        st.pyplot(plt)  # Matplotlib으로 그린 그래프를 Streamlit 앱에 표시
+    def _page_image(self, page_df):
+        """캐시에 같은 페이지 이미지가 있으면 그대로 사용하고, 없으면 그려서 캐시에 저장하는 내부 메서드 (미리 불러오기와 같은 캐시)"""
+        return chart_page_image(page_df, self.selected_years, self.view_type, self.y_label, self.y_max)
+
+    def display_rankings(self):
+        """등급별 추이와 자격증 순위를 표시하는 메서드 (bar_graph.load_cube()에 미리 계산된 값을 잘라서 보여줌)"""
+        cube = bg.load_cube()  # 등급별 / 연도별 집계 큐브 (프로세스당 한 번만 계산)
+        is_rate = self.view_type == "합격률 (%)"
+        items = [item for item in cube.items if ('%' in item) == is_rate]  # 선택한 보기에 맞는 항목만
+        col1, col2, col3 = st.columns(3)
+        item = col1.selectbox("📋 항목", items, index=len(items) - 1)  # 기본값: 실기합격률 / 실기합격 인원
+        tier = col2.selectbox("🏷️ 등급", ["전체"] + cube.tiers)
+        year = col3.selectbox("📆 기준 연도", cube.years[::-1])  # 최근 연도부터
+        tier = None if tier == "전체" else tier
+
+        st.subheader("등급별 추이")
+        st.dataframe(cube.tier_trend(item, tier))  # 연도별 값과 전년 대비 증감
+        st.subheader(f"{year}년 순위")
+        top_col, bottom_col = st.columns(2)
+        top_col.markdown("**상위 10개**")
+        top_col.dataframe(cube.top(item, year, n=10, tier=tier), hide_index=True)
+        bottom_col.markdown("**하위 10개**")
+        bottom_col.dataframe(cube.bottom(item, year, n=10, tier=tier), hide_index=True)
+        if is_rate:
+            st.caption(f"합격률 순위는 응시 인원이 {cube.min_applicants}명 이상인 종목만 포함합니다.")
 
     def display_results(self):
         """검색 결과를 표시하고 해당하는 그래프를 출력하는 메서드"""
@@ -83,17 +238,21 @@ class CertificationVisualizer:
                 st.warning("검색 결과가 없습니다.")  # 경고 메시지 표시
             else:  # 필터링된 데이터프레임이 있는 경우
                 st.dataframe(filtered_df)  # 필터링된 데이터프레임 표시
-                for idx, row in filtered_df.iterrows():  # 필터링된 데이터프레임의 각 행에 대해 반복 처리
-                    st.subheader(f"{row['종목별']} - {row['항목']}")  # 종목명과 항목을 조합하여 하위 제목 표시
-                    self._plot_bar_chart(row, f"{row['종목별']} - {row['항목']}")  # 해당 종목의 연도별 데이터를 사용하여 막대 그래프 그림
+                n_pages = math.ceil(len(filtered_df) / CHARTS_PER_PAGE)  # 그래프 페이지 수
+                page = 1
+                if n_pages > 1:  # 결과가 많으면 페이지를 나누어 표시
+                    page = st.number_input(f"📄 그래프 페이지 (총 {n_pages}페이지, 페이지당 {CHARTS_PER_PAGE}개)",
+                                           min_value=1, max_value=n_pages, value=1)
+                page_df = filtered_df.iloc[(page - 1) * CHARTS_PER_PAGE:page * CHARTS_PER_PAGE]  # 현재 페이지의 행
+                st.image(self._page_image(page_df))  # 페이지의 모든 행을 한 장의 이미지로 표시 (같은 조건이면 캐시 사용)
         else:  # 검색어가 없는 경우
             st.info("종목명을 입력하여 검색하세요.")  # 안내 메시지 표시
+            self.display_rankings()  # 검색어가 없으면 등급별 추이와 순위 표시
 
 # 사용 예시 (bg 객체가 이미 정의되어 있다고 가정)
 if __name__ == '__main__':
-    # 📌 전처리된 데이터프레임 (bar_graph.py에서 로드 및 전처리됨)
-    people_df = bg.people_pr_df  # bar_graph.py에서 합격 인원 데이터프레임 로드
-    per_df = bg.per_pr_df        # bar_graph.py에서 합격률 데이터프레임 로드
+    # 📌 전처리된 데이터 보기 (bar_graph.py에서 로드됨)
+    people_view, per_view = bg.load_views()  # bar_graph.py에서 합격 인원 / 합격률 보기 로드
 
-    visualizer = CertificationVisualizer(people_df, per_df)  # CertificationVisualizer 클래스의 인스턴스 생성
+    visualizer = CertificationVisualizer(people_view, per_view)  # CertificationVisualizer 클래스의 인스턴스 생성
     visualizer.display_results()  # 결과 표시 메서드 호출
\ No newline at end of file
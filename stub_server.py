@@ -0,0 +1,306 @@
+import argparse  # 명령행 인자 처리
+import hashlib  # 기록 파일 이름 (요청 해시)
+import json  # JSON 응답 생성
+import os  # 기록 / 고정 응답 파일 경로
+import random  # 지연 / 오류 주입
+import threading  # 서버를 백그라운드 스레드에서 실행
+import time  # 응답 지연 및 시간 측정
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer  # 로컬 HTTP 서버
+from urllib.parse import parse_qs, parse_qsl, urlencode, urlparse  # 요청 주소 파싱
+
+# 네트워크 없이 측정하기 위한 로컬 네이버 책 검색 API / 큐넷 시험 일정 스텁 서버
+#   python stub_server.py --latency 0.1           # 스텁 서버와 순차 / 동시 요청 속도 비교
+#   python stub_server.py --serve --record bench/recordings   # 실제 서버 응답을 기록하며 중계
+#   python stub_server.py --serve --replay bench/recordings --error-rate 0.1   # 기록된 응답 재생 + 오류 주입
+#   NAVER_BOOK_URL=http://127.0.0.1:<port>/v1/search/book.json QNET_SCHEDULE_URL=http://127.0.0.1:<port>/crf021.do streamlit run certi_search.py
+
+
+def fake_books(query, start, display, total):
+    """검색어와 위치에 따라 항상 같은 가짜 책 정보를 만듭니다."""
+    books = []
+    for rank in range(start, min(start + display, total + 1)):
+        books.append({
+            "title": f"{query} 수험서 {rank}",
+            "link": f"https://example.com/book/{rank}",
+            "image": f"https://example.com/book/{rank}.jpg",
+            "author": f"저자{rank % 17}",
+            "discount": str(10000 + (rank * 7919) % 30000),
+            "publisher": f"출판사{rank % 11}",
+            "pubdate": "20250101",
+            "isbn": f"979{rank:010d}",
+            "description": f"{query} 대비 도서",
+        })
+    return books
+
+
+NAVER_BOOK_PATH = '/v1/search/book.json'  # 네이버 책 검색 API 경로
+QNET_SCHEDULE_PATH = '/crf021.do'  # 큐넷 월별 시험 일정 페이지 경로
+# 기록(record) 모드에서 요청을 그대로 전달할 실제 서버
+UPSTREAMS = {NAVER_BOOK_PATH: 'https://openapi.naver.com', QNET_SCHEDULE_PATH: 'https://www.q-net.or.kr'}
+FORWARD_HEADERS = ('X-Naver-Client-Id', 'X-Naver-Client-Secret', 'User-Agent')  # 실제 서버로 전달할 요청 헤더
+ERROR_STATUSES = (500, 503)  # 오류 주입 시 반환할 상태 코드
+EMPTY_SCHEDULE_HTML = '<!DOCTYPE html><html lang="ko"><body><table><tbody></tbody></table></body></html>'
+
+
+def recording_key(path, query):
+    """요청 경로와 (정렬된) 쿼리로 기록 파일 이름을 만듭니다. (같은 요청은 항상 같은 이름)"""
+    canonical = path + '?' + urlencode(sorted(parse_qsl(query, keep_blank_values=True)))
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()
+
+
+class Recordings:
+    """
+    실제 서버 응답을 요청별 JSON 파일로 저장하고 다시 꺼내는 클래스
+
+    파일 하나에 경로, 쿼리, 상태 코드, Content-Type, 응답 본문이 들어 있어 사람이 읽고 고칠 수 있습니다.
+    """
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, path, query):
+        return os.path.join(self.directory, recording_key(path, query) + '.json')
+
+    def get(self, path, query):
+        """기록된 응답 (status, content_type, body bytes) 또는 None"""
+        try:
+            with open(self._path(path, query), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        return entry['status'], entry['content_type'], entry['body'].encode('utf-8')
+
+    def put(self, path, query, status, content_type, body):
+        """응답을 기록합니다. (임시 파일에 쓴 뒤 교체)"""
+        target = self._path(path, query)
+        entry = {'path': path, 'query': query, 'status': status, 'content_type': content_type,
+                 'body': body.decode('utf-8', errors='replace')}
+        tmp_path = f"{target}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, target)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    네이버 책 검색 API(/v1/search/book.json)와 큐넷 시험 일정 페이지(/crf021.do)를 흉내 내는 요청 처리 클래스
+
+    응답 순서: 오류 주입 -> 기록 모드(실제 서버에 전달 후 저장) -> 저장된 기록 -> 가짜 응답 (책: fake_books 또는 저장된 JSON, 큐넷: bench/fixtures 의 HTML)
+    성공 응답에는 본문 해시로 만든 ETag 를 붙이고, If-None-Match 가 같으면 본문 없이 304 로 응답합니다.
+    """
+    protocol_version = 'HTTP/1.1'  # keep-alive 연결 유지
+
+    def do_GET(self):
+        server = self.server
+        url = urlparse(self.path)
+        if url.path not in UPSTREAMS:
+            self.send_error(404)
+            return
+        with server.lock:
+            server.request_count += 1
+            server.request_counts[url.path] = server.request_counts.get(url.path, 0) + 1
+            delay = server.latency + (server.random.uniform(0, server.jitter) if server.jitter else 0.0)
+            fail = server.error_rate > 0 and server.random.random() < server.error_rate
+            if fail:
+                server.error_count += 1
+                status = server.random.choice(ERROR_STATUSES)
+        time.sleep(delay)  # 네트워크 왕복 시간 흉내 (jitter 만큼 무작위로 더 지연)
+        if fail:  # 오류 주입
+            self._send(status, 'text/plain; charset=utf-8', f'injected error {status}'.encode('utf-8'))
+            return
+        status, content_type, body = self._response(url)
+        etag = '"%s"' % hashlib.sha1(body).hexdigest() if status == 200 else None  # 조건부 요청(If-None-Match) 지원
+        if etag is not None and self.headers.get('If-None-Match') == etag:
+            with server.lock:
+                server.not_modified_count += 1
+            self._send(304, content_type, b'', etag=etag)
+            return
+        self._send(status, content_type, body, etag=etag)
+
+    def _response(self, url):
+        server = self.server
+        if server.record:
+            return self._forward(url)
+        if server.recordings is not None:
+            recorded = server.recordings.get(url.path, url.query)
+            if recorded is not None:
+                return recorded
+        if url.path == NAVER_BOOK_PATH:
+            return self._fake_books(url)
+        return self._fake_schedule(url)
+
+    def _forward(self, url):
+        """실제 서버에 같은 요청을 보내고 응답을 기록합니다."""
+        import requests
+        headers = {name: self.headers[name] for name in FORWARD_HEADERS if self.headers.get(name)}
+        response = requests.get(UPSTREAMS[url.path] + url.path + '?' + url.query, headers=headers, timeout=(3.05, 10))
+        content_type = response.headers.get('Content-Type', 'application/octet-stream')
+        if response.status_code == 200:
+            self.server.recordings.put(url.path, url.query, response.status_code, content_type, response.content)
+        return response.status_code, content_type, response.content
+
+    def _fake_books(self, url):
+        server = self.server
+        params = parse_qs(url.query)
+        query = params.get('query', [''])[0]
+        start = int(params.get('start', ['1'])[0])
+        display = int(params.get('display', ['10'])[0])
+        if server.books is not None:  # 저장된 실제 형식의 응답(canned JSON)을 잘라서 반환
+            total, items = len(server.books), server.books[start - 1:start - 1 + display]
+        else:
+            total, items = server.total, fake_books(query, start, display, server.total)
+        body = json.dumps({
+            "total": total,
+            "start": start,
+            "display": display,
+            "items": items,
+        }, ensure_ascii=False).encode('utf-8')
+        return 200, 'application/json; charset=utf-8', body
+
+    def _fake_schedule(self, url):
+        """schMonth(YYYYMM01)에 해당하는 qnet_YYYY_MM.html 을 반환합니다. (없으면 일정이 없는 빈 페이지)"""
+        month = parse_qs(url.query).get('schMonth', [''])[0]
+        html = EMPTY_SCHEDULE_HTML
+        if self.server.qnet_dir and len(month) >= 6:
+            path = os.path.join(self.server.qnet_dir, f'qnet_{month[:4]}_{month[4:6]}.html')
+            if os.path.exists(path):
+                with open(path, 'r', encoding='utf-8') as f:
+                    html = f.read()
+        return 200, 'text/html; charset=utf-8', html.encode('utf-8')
+
+    def _send(self, status, content_type, body, etag=None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        if etag is not None:
+            self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # 요청마다 로그를 출력하지 않음
+
+
+def load_canned_books(path):
+    """저장된 네이버 책 검색 응답(JSON 파일)의 items 리스트를 읽습니다."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)['items']
+
+
+def start_stub_server(latency=0.05, total=1000, port=0, books=None, qnet_dir=None, jitter=0.0, error_rate=0.0,
+                      recordings_dir=None, record=False, seed=None):
+    """
+    스텁 서버를 백그라운드 스레드에서 시작합니다.
+
+    Args:
+        latency (float): 요청마다 추가할 지연 시간 (초)
+        total (int): 검색어마다 반환할 전체 결과 수 (books 가 없을 때)
+        port (int): 사용할 포트 (0이면 빈 포트 자동 선택)
+        books (list): 검색어와 관계없이 반환할 책 정보 리스트 (load_canned_books() 결과, 없으면 가짜 책 생성)
+        qnet_dir (str): 큐넷 일정 HTML(qnet_YYYY_MM.html) 폴더 (예: bench/fixtures)
+        jitter (float): 요청마다 0 ~ jitter 초의 지연을 무작위로 더함
+        error_rate (float): 500/503 오류를 반환할 요청 비율 (0 ~ 1)
+        recordings_dir (str): 기록된 응답 폴더 (있으면 가짜 응답보다 먼저 사용)
+        record (bool): True 이면 실제 서버에 요청을 전달하고 응답을 recordings_dir 에 기록
+        seed (int): 지연 / 오류 주입 난수 시드 (같은 시드면 같은 순서로 주입)
+
+    Returns:
+        ThreadingHTTPServer: 실행 중인 서버 (server.url 로 책 검색 API 주소, server.qnet_url 로 큐넷 일정 주소 확인, server.shutdown() 으로 종료)
+    """
+    if record and not recordings_dir:
+        raise ValueError("record 모드에는 recordings_dir 가 필요합니다.")
+    server = ThreadingHTTPServer(('127.0.0.1', port), StubHandler)
+    server.daemon_threads = True
+    server.latency = latency
+    server.jitter = jitter
+    server.error_rate = error_rate
+    server.random = random.Random(seed)
+    server.total = total
+    server.books = books
+    server.qnet_dir = qnet_dir
+    server.recordings = Recordings(recordings_dir) if recordings_dir else None
+    server.record = record
+    server.request_count = 0
+    server.request_counts = {}  # 경로별 요청 수
+    server.error_count = 0  # 주입한 오류 수
+    server.not_modified_count = 0  # 조건부 요청에 304 로 응답한 수
+    server.lock = threading.Lock()
+    base_url = f'http://127.0.0.1:{server.server_address[1]}'
+    server.url = base_url + NAVER_BOOK_PATH
+    server.qnet_url = base_url + QNET_SCHEDULE_PATH
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _sequential_fetch(url, query, max_results):
+    """기존 BookSearchApp.search_books 방식 (display=10 씩 새 연결로 순차 요청)"""
+    import requests
+    books, start = [], 1
+    while len(books) < max_results:
+        response = requests.get(url, params={"query": query, "display": 10, "start": start})
+        items = response.json().get('items', [])
+        if not items:
+            break
+        books.extend(items)
+        start += 10
+    return books
+
+
+def _serve(args, books):
+    """스텁 서버를 포그라운드에서 실행합니다. (Ctrl+C 로 종료)"""
+    server = start_stub_server(latency=args.latency, port=args.port, books=books, qnet_dir=args.qnet_dir,
+                               jitter=args.jitter, error_rate=args.error_rate,
+                               recordings_dir=args.record or args.replay, record=bool(args.record), seed=args.seed)
+    print(f"NAVER_BOOK_URL={server.url}")
+    print(f"QNET_SCHEDULE_URL={server.qnet_url}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        print(f"요청 {server.request_count}회 {server.request_counts}, 주입한 오류 {server.error_count}회")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="네이버 책 검색 스텁 서버로 순차 / 동시 요청 속도를 비교합니다.")
+    parser.add_argument('--latency', type=float, default=0.05, help="요청별 지연 시간 (초)")
+    parser.add_argument('--max-results', type=int, default=100, help="가져올 책 개수")
+    parser.add_argument('--repeat', type=int, default=5, help="반복 측정 횟수")
+    parser.add_argument('--fixture', help="가짜 책 대신 반환할 저장된 응답 JSON 파일 (예: bench/fixtures/naver_book.json)")
+    parser.add_argument('--serve', action='store_true', help="속도 비교 대신 스텁 서버만 실행")
+    parser.add_argument('--port', type=int, default=0, help="--serve 로 실행할 포트 (기본값: 빈 포트)")
+    parser.add_argument('--qnet-dir', default=os.path.join('bench', 'fixtures'), help="큐넷 일정 HTML 폴더")
+    parser.add_argument('--jitter', type=float, default=0.0, help="요청별 추가 무작위 지연 최대값 (초)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="500/503 오류를 반환할 요청 비율 (0 ~ 1)")
+    parser.add_argument('--seed', type=int, help="지연 / 오류 주입 난수 시드")
+    recording = parser.add_mutually_exclusive_group()
+    recording.add_argument('--record', metavar='DIR', help="실제 네이버 / 큐넷 서버로 중계하며 응답을 DIR 에 기록")
+    recording.add_argument('--replay', metavar='DIR', help="DIR 에 기록된 응답을 재생 (기록이 없는 요청은 가짜 응답)")
+    args = parser.parse_args()
+
+    books = load_canned_books(args.fixture) if args.fixture else None
+    if args.serve:
+        _serve(args, books)
+        return
+
+    from book_fetch import BookFetcher
+
+    server = start_stub_server(latency=args.latency, books=books, jitter=args.jitter, seed=args.seed)
+    fetcher = BookFetcher("stub", "stub", url=server.url)
+    try:
+        for name, fetch in [("순차 (display=10)", lambda: _sequential_fetch(server.url, "정보처리기사", args.max_results)),
+                            ("BookFetcher", lambda: fetcher.fetch("정보처리기사", args.max_results))]:
+            server.request_count = 0
+            began = time.perf_counter()
+            for _ in range(args.repeat):
+                books = fetch()
+            elapsed = (time.perf_counter() - began) / args.repeat
+            print(f"{name}: {elapsed * 1000:.1f} ms/검색, 결과 {len(books)}개, 요청 {server.request_count // args.repeat}회")
+    finally:
+        fetcher.close()
+        server.shutdown()
+
+if __name__ == '__main__':
+    main()
@@ -2,8 +2,22 @@ import streamlit as st  # Streamlit 라이브러리 import (웹 앱 개발)
 import requests  # HTTP 요청을 보내는 라이브러리
 from bs4 import BeautifulSoup  # HTML 및 XML 파일 파싱 라이브러리
 import pandas as pd  # 데이터 분석 및 조작 라이브러리
-import json  # JSON 데이터 처리 라이브러리
 import os  # 운영체제 관련 기능 라이브러리
+from concurrent.futures import ThreadPoolExecutor  # 여러 달의 일정을 동시에 불러오기 위한 작업자 풀
+from metrics import METRICS  # 큐넷 요청 횟수 / 시간 기록
+from fetch_policy import BackgroundRefresher, CircuitBreaker, CircuitOpenError, SingleFlight, throttle  # 큐넷 요청 차단기, 백그라운드 갱신, 동시 요청 합치기, 속도 제한
+from schedule_files import ScheduleFiles  # 월별 일정 파일 저장 (변경 감지, 교체 방식 저장, 목록 파일)
+from schedule_store import OTHER_CATEGORY, ScheduleStore, category_of, split_tests  # 날짜 색인이 있는 연간 시험 일정 저장소
+from schedule_join import SCHEDULE_TIER, load_join_index  # 자격증 -> 시험 일정 조인 색인
+
+# 큐넷 시험 일정 페이지 주소 (부하 테스트 등 로컬 스텁 서버로 측정할 때는 QNET_SCHEDULE_URL 환경 변수로 변경)
+QNET_SCHEDULE_URL = os.getenv("QNET_SCHEDULE_URL", "https://www.q-net.or.kr/crf021.do")
+
+# 프로세스 전체(모든 세션)에서 공유하는 큐넷 요청 정책
+QNET_BREAKER = CircuitBreaker(failure_threshold=3, reset_timeout=60,
+                              failure_exceptions=(requests.exceptions.RequestException,))  # 연속 3번 실패하면 60초 동안 요청 중단
+QNET_REFRESHER = BackgroundRefresher(max_workers=2)  # 오래된 일정 파일을 백그라운드에서 갱신
+QNET_FLIGHTS = SingleFlight('qnet')  # 같은 달을 동시에 요청하면 사이트 요청 한 번의 결과를 함께 사용
 
 # streamlit run test_calender.py
 
@@ -13,26 +27,58 @@ class QnetScheduleApp:
         os.makedirs(self.data_folder, exist_ok=True)  # data 폴더 생성 (이미 존재하는 경우 오류를 발생시키지 않음)
         self.year = 2025 #url에 사용될 연도 변수화 (기본적으로 2025년으로 설정)
         self.tag = None # 검색할 태그를 저장하는 변수 초기화 (run 메서드에서 사용자 입력을 받을 예정)
+        self.max_workers = 4 # 12개월 일정을 미리 불러올 때 동시에 요청할 최대 개수 (사이트 부담을 줄이기 위해 제한)
+        self.timeout = (3.05, 5) # 큐넷 요청 제한 시간 (연결, 응답) 초 - 사이트가 느려도 화면이 무한정 멈추지 않도록 함
+        self.max_age = 24 * 60 * 60 # 저장된 일정 파일이 이 시간(초)보다 오래되면 백그라운드에서 새로 불러옴
+        self.schedule_ages = {} # 월별로 화면에 표시한 일정 파일의 경과 시간 (초)
 
     def search_text(self, text, text_list):
         return [s for s in text_list if text in s] #text_list에서 text를 포함하는 단어를 가진 단어들을 list로 반환
         # 주어진 text가 text_list의 각 요소(문자열)에 포함되어 있는지 확인하고, 포함된 요소들로 이루어진 새로운 리스트를 반환합니다.
 
-    def fetch_schedule(self, month):  #사이트 request 요청 확인 및 html 반환
+    @property
+    def files(self):  # 월별 일정 파일 저장소 (내용 해시 비교, 교체 방식 저장, 월별 해시/요청 시각 목록)
+        return ScheduleFiles(self.data_folder, self.year)
+
+    def _request_schedule(self, month, conditional=False):  #사이트 request 요청 후 (html, 조건부 요청 정보) 반환 (실패 시 예외 발생, 작업자 스레드에서도 사용)
         month_str = f'0{month}' if month < 10 else str(month)  #url에 쓰일 month string 화 (한 자리 수 월 앞에 '0'을 붙여 두 자리 문자열로 만듦)
-        url = f'https://www.q-net.or.kr/crf021.do?id=crf02103&gSite=Q&gId=&schGb=list&schMonth={self.year}{month_str}01'
+        url = f'{QNET_SCHEDULE_URL}?id=crf02103&gSite=Q&gId=&schGb=list&schMonth={self.year}{month_str}01'
         # 큐넷 시험 일정 페이지 URL 생성 (year와 month_str 변수를 사용하여 동적으로 URL을 만듦)
         headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36'}
         # 웹사이트 요청 시 User-Agent 헤더를 설정하여 브라우저처럼 보이게 함 (일부 사이트에서 요청을 거부하는 것을 방지)
+        if conditional: # 저장된 ETag / Last-Modified 가 있으면 조건부 요청 (바뀌지 않았으면 사이트가 본문 없이 304 응답)
+            headers.update(self.files.validators(month))
+        key = (url, tuple(sorted(headers.items())))
+        return QNET_FLIGHTS.do(key, self._download, url, headers)  # 다른 세션이 같은 달을 요청 중이면 새로 요청하지 않고 그 결과를 기다림
+
+    def _get(self, url, headers):  # GET 요청 후 사이트 오류(5xx)와 요청 제한(429)은 예외로 바꿔 차단기가 실패로 세도록 함 (304 는 성공)
+        response = requests.get(url, headers=headers, timeout=self.timeout)
+        if response.status_code >= 500 or response.status_code == 429:
+            response.raise_for_status()
+        return response
+
+    @METRICS.timed('qnet.request')
+    def _download(self, url, headers):  # 실제 사이트 요청 (같은 주소의 동시 요청 중 하나만 실행)
+        throttle(url)  # 큐넷 요청 속도 제한 (차례가 올 때까지 대기)
+        METRICS.incr('qnet.requests')
+        response = QNET_BREAKER.call(self._get, url, headers)
+        #request 요청 (생성된 URL로 HTTP GET 요청을 보냄, 제한 시간 적용, 연결 실패나 5xx / 429 응답이 연속되면 차단기가 열려 CircuitOpenError 발생)
+        validators = {'etag': response.headers.get('ETag'), 'last_modified': response.headers.get('Last-Modified')}
+        if response.status_code == 304: # 조건부 요청에 '바뀌지 않음' 응답
+            METRICS.incr('qnet.not_modified')
+            return None, validators
+        response.raise_for_status()  #오류 발생 확인 (HTTP 응답 상태 코드가 200 OK가 아니면 예외 발생)
+        response.encoding = 'utf-8' #인코딩 설정 (응답 텍스트의 인코딩을 UTF-8로 설정)
+        return response.text, validators # HTML 내용과 조건부 요청 정보 반환
+
+    def fetch_schedule(self, month):  #사이트 request 요청 확인 및 (html, 조건부 요청 정보) 반환
         try:
-            response = requests.get(url, headers=headers)  #request 요청 (생성된 URL로 HTTP GET 요청을 보냄)
-            response.raise_for_status()  #오류 발생 확인 (HTTP 응답 상태 코드가 200 OK가 아니면 예외 발생)
-            response.encoding = 'utf-8' #인코딩 설정 (응답 텍스트의 인코딩을 UTF-8로 설정)
-            return response.text # HTML 내용 반환
-        except requests.exceptions.RequestException as e:
+            return self._request_schedule(month) # HTML 내용 반환
+        except (requests.exceptions.RequestException, CircuitOpenError) as e:
             st.error(f"URL 요청 실패: {e}") #에러 메세지 출력 (요청 중 발생한 오류 메시지를 Streamlit에 표시)
             return None # 오류 발생 시 None 반환
 
+    @METRICS.timed('qnet.parse')
     def parse_schedule(self, html):  #월별 시험일정 파싱
         soup = BeautifulSoup(html, 'html.parser') # BeautifulSoup 객체 생성 (HTML 내용을 파싱하기 위해)
         dates = [p.text.strip() for p in soup.select('th p.month')]  # 날짜는 p태그에 month 부분에 존재, 문자열 앞뒤 공백 제거
@@ -45,27 +91,139 @@ class QnetScheduleApp:
             # 추출된 부분들을 쉼표와 공백으로 연결하여 하나의 문자열로 만들고, 앞뒤 공백을 제거하여 tests 리스트에 추가
         return dict(zip(dates, tests)) # 날짜와 시험 명을 zip하여 dictionary 화 (날짜 리스트와 시험명 리스트를 묶어 딕셔너리 형태로 반환)
 
-    def save_schedule(self, schedule, month):  # 저장하기
-        filename = os.path.join(self.data_folder, f'test_schedule_{month}.json')  #파일 이름 설정 (데이터 폴더 경로와 월 정보를 이용하여 JSON 파일 이름 생성)
+    def _write_schedule(self, schedule, month, validators=None):  # 저장하기 (실패 시 예외 발생, 백그라운드 스레드에서도 사용)
+        if self.files.save(month, schedule, validators): # 내용이 바뀐 경우에만 임시 파일에 쓴 뒤 교체 (목록 파일에 해시와 시각 기록)
+            METRICS.incr('schedule.written')
+        else: # 저장된 일정과 같으면 파일을 다시 쓰지 않음
+            METRICS.incr('schedule.unchanged')
+
+    def save_schedule(self, schedule, month, validators=None):  # 저장하기
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(schedule, f, ensure_ascii=False, indent=4) #json 저장시 한글 깨짐 방지
-                # 생성한 딕셔너리 형태의 시험 일정을 JSON 파일로 저장 (ensure_ascii=False로 설정하여 한글 깨짐 방지, indent=4로 설정하여 들여쓰기 적용)
+            self._write_schedule(schedule, month, validators)
         except IOError as e:
             st.error(f"파일 저장 실패: {e}") # 파일 저장 중 오류 발생 시 오류 메시지 출력
 
     def load_schedule(self, month):  #json 파일 읽어오기
-        filename = os.path.join(self.data_folder, f'test_schedule_{month}.json')
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                return json.load(f) # JSON 파일 내용을 읽어와 파이썬 딕셔너리 형태로 반환
-        except FileNotFoundError:
-            return None # 파일이 없을 경우 None 반환
-        except IOError as e:
+            return self.files.load(month) # JSON 파일 내용을 읽어와 파이썬 딕셔너리 형태로 반환 (파일이 없을 경우 None)
+        except (IOError, ValueError) as e:
             st.error(f"파일 로딩 실패: {e}")
             return None # 파일 로딩 중 오류 발생 시 None 반환
 
+    def schedule_age(self, month):  # 저장된 일정을 마지막으로 사이트에 확인한 뒤 지난 시간 (초, 파일이 없으면 None)
+        return self.files.age(month)
+
+    def _refresh_month(self, month):  # 백그라운드 갱신 작업 (Streamlit 출력 없이 조용히 실패, 성공하면 True)
+        try:
+            html, validators = self._request_schedule(month, conditional=True)
+            if html is None: # 304: 바뀌지 않았으므로 확인 시각만 갱신
+                self.files.mark_checked(month, validators)
+            else:
+                self._write_schedule(self.parse_schedule(html), month, validators)
+            return True
+        except (requests.exceptions.RequestException, CircuitOpenError, IOError):
+            return False # 갱신에 실패해도 기존 파일을 계속 사용 (실패 횟수는 차단기가 기록)
+
+    def get_schedule(self, month):  # 저장된 일정 우선으로 월별 일정 가져오기 (stale-while-revalidate)
+        schedule = self.load_schedule(month) # 저장된 json 파일이 있으면 사이트에 요청하지 않고 바로 사용
+        if schedule is not None:
+            METRICS.incr('schedule.cache_hit')
+            age = self.schedule_age(month)
+            self.schedule_ages[month] = age # 화면에 표시할 일정의 경과 시간 기록
+            if age is not None and age > self.max_age: # 오래된 파일이면 지금은 그대로 보여주고 백그라운드에서 새로 불러옴
+                QNET_REFRESHER.submit((self.data_folder, self.year, month), self._refresh_month, month)
+        else: # 저장된 파일이 없을 때만 사이트에 요청 (제한 시간 안에 응답이 없으면 실패 처리)
+            METRICS.incr('schedule.cache_miss')
+            fetched = self.fetch_schedule(month)
+            if fetched is None:
+                return None # 요청 실패 시 None 반환 (오류 메시지는 fetch_schedule에서 출력)
+            html, validators = fetched
+            schedule = self.parse_schedule(html)
+            self.save_schedule(schedule, month, validators) # 다음부터는 파일에서 읽을 수 있도록 저장
+            self.schedule_ages[month] = 0.0
+        return schedule
+
+    def _describe_age(self, month):  # 표시 중인 일정이 언제 저장된 것인지 안내 문구 생성
+        age = self.schedule_ages.get(month)
+        if age is None:
+            return None
+        if age < 60:
+            text = "방금"
+        elif age < 60 * 60:
+            text = f"{int(age // 60)}분 전"
+        elif age < 24 * 60 * 60:
+            text = f"{int(age // 3600)}시간 전"
+        else:
+            text = f"{int(age // 86400)}일 전"
+        if age > self.max_age:
+            return f"🕒 {text}에 저장된 일정입니다. 최신 일정을 백그라운드에서 불러오고 있습니다."
+        return f"🕒 {text}에 저장된 일정입니다."
+
+    def _download_month(self, month):  # 작업자 스레드용: 저장된 파일이 없는 달만 요청 및 파싱
+        if self.load_schedule(month) is not None:
+            return month, None, None, None # 이미 저장된 달은 요청하지 않음
+        try:
+            html, validators = self._request_schedule(month)
+            return month, self.parse_schedule(html), validators, None
+        except (requests.exceptions.RequestException, CircuitOpenError) as e:
+            return month, None, None, e # 작업자 스레드에서는 Streamlit 출력을 하지 않고 오류를 돌려줌
+
+    def prefetch_year(self):  # self.year의 12개월 일정을 동시에 미리 불러오기
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            results = list(pool.map(self._download_month, range(1, 13)))
+        # 저장된 파일이 없는 달만 최대 max_workers개씩 동시에 요청하므로, 12번의 순차 요청 대신 한 번의 병렬 요청으로 끝남
+        failed = []
+        for month, schedule, validators, error in results: # 파일 저장과 오류 출력은 스크립트 스레드에서 처리
+            if schedule is not None:
+                self.save_schedule(schedule, month, validators)
+            elif error is not None:
+                failed.append(month)
+        if failed:
+            st.error(f"일부 월 일정 불러오기 실패: {', '.join(f'{m}월' for m in failed)}")
+        return {month: self.load_schedule(month) for month in range(1, 13)} # 저장된 파일에서 12개월 일정 반환 (실패한 달은 None)
+
+    def warm_months(self, months, should_continue=lambda: True, spend=lambda: None):  # 미리 불러오기: 저장되지 않았거나 오래된 달만 요청 (Streamlit 출력 없음)
+        # should_continue: 다음 달을 요청해도 되는지 (예산 확인), spend: 요청을 보낼 때마다 한 번씩 호출 (실패한 요청도 예산에서 차감)
+        warmed = []
+        for month in months:
+            if not should_continue(): # 미리 불러오기 예산을 다 쓰면 중단
+                break
+            age = self.schedule_age(month)
+            if age is not None and age <= self.max_age:
+                continue # 최근에 확인한 달은 요청하지 않음
+            spend()
+            if age is None: # 저장된 파일이 없는 달
+                _, schedule, validators, error = self._download_month(month)
+                if schedule is None:
+                    continue # 요청 실패 (다음 미리 불러오기 때 다시 시도)
+                try:
+                    self._write_schedule(schedule, month, validators)
+                except IOError:
+                    continue
+            elif not self._refresh_month(month): # 오래된 달은 조건부 요청 (바뀌지 않았으면 확인 시각만 갱신)
+                continue # 갱신 실패 (기존 파일 유지, 다음 미리 불러오기 때 다시 시도)
+            warmed.append(month)
+        return warmed # 요청에 성공한 달 목록
+
+    def _to_dataframe(self, schedule):  # 일정 딕셔너리를 '일정', '시험명' 컬럼의 데이터프레임으로 변환
+        return pd.DataFrame(list(schedule.items()), columns=['일정', '시험명'])
+
+    def _year_dataframe(self, schedules):  # 12개월 일정을 '월' 컬럼을 붙여 하나의 데이터프레임으로 합치기
+        frames = [self._to_dataframe(schedule).assign(월=month) for month, schedule in schedules.items() if schedule]
+        if not frames:
+            return pd.DataFrame(columns=['월', '일정', '시험명'])
+        return pd.concat(frames, ignore_index=True)[['월', '일정', '시험명']]
+
     def filter_and_display(self, tag, df):  # 검색하기
+        index = load_join_index(self.data_folder, self.year) # 자격증 -> 시험 일정 조인 색인 (일정 파일이 바뀌었을 때만 다시 만듦)
+        if tag in index: # 데이터에 있는 자격증이면 색인에 연결된 시험명으로 찾음 (예: '정보처리산업기사' -> '기사 제1회 필기시험' 등)
+            names = {event.name for event in index.events_for(tag)}
+            matched = df['시험명'].map(lambda text: any(name in names for name in split_tests(text)))
+            if matched.any():
+                st.dataframe(df[matched].reset_index(drop=True))
+            else:
+                st.info(f"'{tag}' 관련 시험 일정이 없습니다.")
+            return
         if tag.endswith('기사'):
             tag = '기사'
         elif tag.endswith('기술사'):
@@ -92,21 +250,22 @@ class QnetScheduleApp:
             st.session_state.schedule_df = None
             # Streamlit 세션 상태에 'schedule_df' 키가 존재하는지 확인하고, 없으면 None으로 초기화 (앱이 다시 실행될 때 이전 상태를 유지하기 위함)
 
-        selected_cal = st.radio("일정 필터링", ["검색","전체"], horizontal=True,key="filtering_selector")
+        selected_cal = st.radio("일정 필터링", ["검색","전체","연간"], horizontal=True,key="filtering_selector")
         if selected_cal == "검색":
             if st.button("일정 불러오기"): #일정 불러오기 버튼 클릭시 실행
                 with st.spinner("일정을 불러오는 중..."): # 로딩 중 스피너 표시 (작업이 오래 걸릴 수 있음을 사용자에게 알림)
-                    html = self.fetch_schedule(month) # html 불러오기 (입력된 월에 해당하는 시험 일정 HTML 내용을 가져옴)
-                    if html: #html 이 있다면
-                        schedule = self.parse_schedule(html) #html 파싱 (가져온 HTML 내용을 파싱하여 시험 일정 정보를 딕셔너리 형태로 변환)
-                        self.save_schedule(schedule, month) #파싱한 데이터 json으로 저장 (파싱된 시험 일정 정보를 JSON 파일로 저장)
-                        st.session_state.schedule_df = pd.DataFrame(list(schedule.items()), columns=['일정', '시험명']) #세션 상태에 저장
-                        # 파싱된 딕셔너리를 Pandas DataFrame으로 변환하여 '일정'과 '시험명' 컬럼을 갖도록 하고, 세션 상태에 저장 (앱이 다시 실행되어도 데이터를 유지)
-                    else: #html이 없다면
-                        st.error("일정 불러오기 실패") # HTML 내용을 가져오지 못한 경우 오류 메시지 출력
+                    schedule = self.get_schedule(month) # 저장된 json 파일을 먼저 확인하고, 없을 때만 사이트에서 불러와 파싱 및 저장
+                    if schedule is not None: #일정이 있다면
+                        st.session_state.schedule_df = self._to_dataframe(schedule) #세션 상태에 저장
+                        # 시험 일정 딕셔너리를 Pandas DataFrame으로 변환하여 '일정'과 '시험명' 컬럼을 갖도록 하고, 세션 상태에 저장 (앱이 다시 실행되어도 데이터를 유지)
+                        st.session_state.schedule_notice = self._describe_age(month) #저장된 일정의 경과 시간 안내
+                    else: #일정이 없다면
+                        st.error("일정 불러오기 실패") # 일정을 가져오지 못한 경우 오류 메시지 출력
 
 
             if st.session_state.schedule_df is not None: #세션 상태에 schedule_df 가 존재 한다면
+                if st.session_state.get('schedule_notice'): #저장된 일정이면 경과 시간 표시
+                    st.caption(st.session_state.schedule_notice)
                 tag = self.tag #태그 입력 받기 (사용자로부터 검색할 태그를 입력받는 텍스트 입력 위젯 생성)
                 if tag: #태그가 있다면
                     self.filter_and_display(tag, st.session_state.schedule_df) #태그 검색 및 출력 (입력된 태그와 세션 상태에 저장된 시험 일정 DataFrame을 이용하여 검색 및 결과 표시)
@@ -115,16 +274,39 @@ class QnetScheduleApp:
         elif selected_cal == "전체":
             if st.button("일정 불러오기"): #일정 불러오기 버튼 클릭시 실행
                 with st.spinner("일정을 불러오는 중..."): # 로딩 중 스피너 표시 (작업이 오래 걸릴 수 있음을 사용자에게 알림)
-                    html = self.fetch_schedule(month) # html 불러오기 (입력된 월에 해당하는 시험 일정 HTML 내용을 가져옴)
-                    if html: #html 이 있다면
-                        schedule = self.parse_schedule(html) #html 파싱 (가져온 HTML 내용을 파싱하여 시험 일정 정보를 딕셔너리 형태로 변환)
-                        self.save_schedule(schedule, month) #파싱한 데이터 json으로 저장 (파싱된 시험 일정 정보를 JSON 파일로 저장)
-                        st.session_state.schedule_df = pd.DataFrame(list(schedule.items()), columns=['일정', '시험명']) #세션 상태에 저장
-                        # 파싱된 딕셔너리를 Pandas DataFrame으로 변환하여 '일정'과 '시험명' 컬럼을 갖도록 하고, 세션 상태에 저장 (앱이 다시 실행되어도 데이터를 유지)
+                    schedule = self.get_schedule(month) # 저장된 json 파일을 먼저 확인하고, 없을 때만 사이트에서 불러와 파싱 및 저장
+                    if schedule is not None: #일정이 있다면
+                        st.session_state.schedule_df = self._to_dataframe(schedule) #세션 상태에 저장
+                        st.session_state.schedule_notice = self._describe_age(month) #저장된 일정의 경과 시간 안내
+                        if st.session_state.schedule_notice: #저장된 일정이면 경과 시간 표시
+                            st.caption(st.session_state.schedule_notice)
                         st.dataframe(st.session_state.schedule_df) #전체 데이터프레임 출력 (태그가 입력되지 않았으면 전체 시험 일정 DataFrame을 화면에 표시)
-                    else: #html이 없다면
-                        st.error("일정 불러오기 실패") # HTML 내용을 가져오지 못한 경우 오류 메시지 출력
+                    else: #일정이 없다면
+                        st.error("일정 불러오기 실패") # 일정을 가져오지 못한 경우 오류 메시지 출력
+        elif selected_cal == "연간":
+            if st.button("12개월 일정 불러오기"): #12개월 일정 불러오기 버튼 클릭시 실행
+                with st.spinner(f"{self.year}년 12개월 일정을 불러오는 중..."):
+                    schedules = self.prefetch_year() # 저장되지 않은 달만 동시에 불러와 저장한 뒤 12개월 일정 반환
+                    st.session_state.schedule_store = ScheduleStore.from_schedules(schedules, self.year)
+                    # 시험 하나당 한 행으로 나누고 날짜/등급 색인을 만든 연간 일정 저장소를 세션 상태에 저장
 
+            store = st.session_state.get('schedule_store')
+            if store is not None: #연간 일정 저장소가 있다면 색인으로 조회
+                category = category_of(self.tag) if self.tag else OTHER_CATEGORY # 검색어의 등급 구분 (예: '정보처리기사' -> '기사')
+                category = SCHEDULE_TIER.get(category, category) # 산업기사는 기사 일정으로 표시됨
+                category = None if category == OTHER_CATEGORY else category # 등급을 알 수 없으면 전체 등급 조회
+                period = st.radio("기간", ["다가오는 30일", "이번 주", "연간 전체"], horizontal=True, key="schedule_period")
+                if period == "다가오는 30일":
+                    events = store.upcoming(30, category=category)
+                elif period == "이번 주":
+                    events = store.this_week(category=category)
+                else:
+                    events = store.query(category=category)
+                if events:
+                    st.caption(f"{category or '전체'} 일정 {len(events)}건")
+                    st.dataframe(store.to_dataframe(events)) # 시작일 순으로 정렬된 일정 출력
+                else:
+                    st.info(f"'{category or '전체'}' 관련 시험 일정이 없습니다.")
 
 
 if __name__ == "__main__":
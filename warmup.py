@@ -0,0 +1,295 @@
+import functools  # 프로세스 단위 스케줄러 공유
+import json  # 인기 검색어 / 미리 불러오기 기록 저장
+import os  # 파일 경로, 환경 변수 설정
+import threading  # 백그라운드 스레드
+import time  # 실행 시각, 점수 감쇠
+from collections import deque  # 최근 미리 불러오기 기록 (개수 제한)
+
+from app_Re import cached_books, fetch_books  # 책 검색 결과 캐시 / API 호출 (Streamlit 출력 없음)
+from metrics import METRICS  # 미리 불러오기 횟수 / 시간 기록
+from schedule_files import write_atomic  # 기록 파일을 교체 방식으로 저장
+from schedule_join import load_join_index  # 일정을 새로 받으면 자격증 -> 일정 조인 색인도 미리 다시 만듦
+from streamlit_app_re import warm_charts  # 검색어의 첫 페이지 그래프를 그래프 캐시에 미리 그림
+from test_calender import QnetScheduleApp  # 월별 시험 일정 파일 (저장되지 않았거나 오래된 달만 요청)
+
+# 인기 검색어 미리 불러오기 (앱과 함께 시작하는 백그라운드 스레드)
+#   scheduler = warmup.start_warmup()       # 프로세스당 한 번만 시작 (다시 호출해도 같은 스케줄러)
+#   scheduler.record('정보처리기사')           # 세션에서 검색어를 선택할 때마다 순위에 반영
+#   scheduler.status()                      # 무엇을 언제 미리 불러왔는지
+# 순위와 기록은 data/warmup.json 에 저장되므로, 재시작 후에도 전날의 인기 검색어를 바로 미리 불러옵니다.
+# 설정은 환경 변수로 바꿀 수 있습니다. (WARMUP_ENABLED=0 이면 스레드를 시작하지 않음)
+
+WARMUP_PATH = os.path.join('data', 'warmup.json')  # 인기 검색어 순위 + 미리 불러오기 기록
+WARMUP_VERSION = 1
+WARMUP_ENABLED = os.getenv('WARMUP_ENABLED', '1') != '0'
+WARMUP_INTERVAL = float(os.getenv('WARMUP_INTERVAL', 30 * 60))  # 미리 불러오기 주기 (초)
+WARMUP_START_DELAY = float(os.getenv('WARMUP_START_DELAY', 10))  # 앱 시작 후 첫 실행까지 대기 (초, 첫 화면 표시를 방해하지 않도록)
+WARMUP_TOP_N = int(os.getenv('WARMUP_TOP_N', 5))  # 한 번에 미리 불러올 인기 검색어 수
+WARMUP_BUDGET_SECONDS = float(os.getenv('WARMUP_BUDGET_SECONDS', 60))  # 한 번의 실행에 쓸 최대 시간 (초)
+WARMUP_MAX_FETCHES = int(os.getenv('WARMUP_MAX_FETCHES', 10))  # 한 번의 실행에서 보낼 최대 외부 요청 수 (네이버 + 큐넷)
+WARMUP_MONTHS_AHEAD = int(os.getenv('WARMUP_MONTHS_AHEAD', 2))  # 이번 달부터 미리 불러올 시험 일정 개월 수
+HALF_LIFE = 7 * 24 * 60 * 60  # 검색어 점수 반감기 (초) - 오래전에 많이 검색된 검색어보다 최근 검색어를 우선
+MAX_KEYWORDS = 200  # 순위에 보관할 최대 검색어 수
+MAX_HISTORY = 50  # 보관할 최근 미리 불러오기 기록 수
+
+
+class KeywordRanking:
+    """
+    검색어별 인기 점수를 관리하는 클래스
+
+    검색할 때마다 점수가 1씩 오르고, 점수는 HALF_LIFE 마다 절반으로 줄어듭니다. (지수 감쇠)
+    MAX_KEYWORDS 개를 넘으면 점수가 가장 낮은 검색어부터 버립니다.
+    스레드 안전하지 않으므로 WarmupScheduler 의 잠금 안에서 사용합니다.
+    """
+    def __init__(self, half_life=HALF_LIFE, max_keywords=MAX_KEYWORDS):
+        self.half_life = half_life
+        self.max_keywords = max_keywords
+        self._entries = {}  # 검색어 -> {'score', 'count', 'updated_at'}
+
+    def _decayed(self, entry, now):
+        return entry['score'] * 0.5 ** (max(0.0, now - entry['updated_at']) / self.half_life)
+
+    def record(self, keyword, now=None):
+        """검색어의 점수를 1 올립니다."""
+        now = time.time() if now is None else now
+        entry = self._entries.get(keyword)
+        if entry is None:
+            entry = self._entries[keyword] = {'score': 0.0, 'count': 0, 'updated_at': now}
+        entry['score'] = self._decayed(entry, now) + 1.0
+        entry['count'] += 1
+        entry['updated_at'] = now
+        if len(self._entries) > self.max_keywords:
+            weakest = min(self._entries, key=lambda k: self._decayed(self._entries[k], now))
+            del self._entries[weakest]
+
+    def top(self, n, now=None):
+        """
+        현재 점수가 높은 순서로 검색어를 반환합니다.
+
+        Returns:
+            list: [{'keyword', 'score', 'count', 'updated_at'}, ...] (최대 n개)
+        """
+        now = time.time() if now is None else now
+        ranked = sorted(self._entries.items(), key=lambda item: (-self._decayed(item[1], now), item[0]))
+        return [{'keyword': keyword, 'score': round(self._decayed(entry, now), 3), 'count': entry['count'],
+                 'updated_at': entry['updated_at']} for keyword, entry in ranked[:n]]
+
+    def to_dict(self):
+        return {keyword: dict(entry) for keyword, entry in self._entries.items()}
+
+    def load(self, entries):
+        """저장된 {검색어: {'score', 'count', 'updated_at'}} 를 읽습니다. (형식이 맞지 않는 항목은 무시)"""
+        for keyword, entry in entries.items():
+            try:
+                self._entries[str(keyword)] = {'score': float(entry['score']), 'count': int(entry['count']),
+                                               'updated_at': float(entry['updated_at'])}
+            except (KeyError, TypeError, ValueError):
+                continue
+
+
+class WarmupBudget:
+    """한 번의 미리 불러오기 실행에 쓸 수 있는 시간과 외부 요청 수"""
+    def __init__(self, seconds, max_fetches):
+        self.deadline = time.monotonic() + seconds
+        self.fetches_left = max_fetches
+
+    def exhausted(self, fetch=False):
+        """시간을 다 썼거나, fetch 가 True 일 때 외부 요청 수를 다 쓴 경우 True"""
+        return time.monotonic() >= self.deadline or (fetch and self.fetches_left <= 0)
+
+    def spend(self, fetches=1):
+        self.fetches_left -= fetches
+
+
+class WarmupScheduler:
+    """
+    인기 검색어의 책 검색 결과, 시험 일정, 통계 그래프를 주기적으로 미리 불러오는 백그라운드 스케줄러
+
+    실행마다 점수 상위 top_n 개 검색어에 대해
+      - 책 검색 결과: 캐시에 없을 때만 네이버 API 호출 (app_Re.fetch_books, 화면과 같은 캐시 키)
+      - 통계 그래프: 합격률 / 합격 인원 첫 페이지 이미지를 그래프 캐시에 그림 (streamlit_app_re.warm_charts)
+    를 채우고, 검색어와 관계없는 시험 일정은 이번 달부터 months_ahead 개월 중 저장되지 않았거나 오래된 달만 요청합니다.
+    한 번의 실행은 budget_seconds 초와 외부 요청 max_fetches 번을 넘지 않으며, 남은 작업은 다음 실행으로 미룹니다.
+    작업 안에서는 Streamlit 출력을 하지 않습니다.
+    """
+    def __init__(self, path=WARMUP_PATH, interval=WARMUP_INTERVAL, top_n=WARMUP_TOP_N,
+                 budget_seconds=WARMUP_BUDGET_SECONDS, max_fetches=WARMUP_MAX_FETCHES,
+                 months_ahead=WARMUP_MONTHS_AHEAD, start_delay=WARMUP_START_DELAY, data_folder='data'):
+        """
+        Args:
+            path (str): 순위 / 기록 파일 경로
+            interval (float): 실행 주기 (초)
+            top_n (int): 한 번에 미리 불러올 인기 검색어 수
+            budget_seconds (float): 한 번의 실행에 쓸 최대 시간 (초)
+            max_fetches (int): 한 번의 실행에서 보낼 최대 외부 요청 수
+            months_ahead (int): 이번 달부터 미리 불러올 시험 일정 개월 수
+            start_delay (float): 시작 후 첫 실행까지 대기 시간 (초)
+            data_folder (str): 시험 일정 파일 폴더
+        """
+        self.path = path
+        self.interval = interval
+        self.top_n = top_n
+        self.budget_seconds = budget_seconds
+        self.max_fetches = max_fetches
+        self.months_ahead = months_ahead
+        self.start_delay = start_delay
+        self.data_folder = data_folder
+        self.ranking = KeywordRanking()
+        self._history = deque(maxlen=MAX_HISTORY)  # 최근 미리 불러온 항목 {'kind', 'target', 'at', 'ms', 'detail'}
+        self._last_run = None  # 마지막 실행 보고
+        self._next_run_at = None
+        self._started_at = None
+        self._thread = None
+        self._stop = threading.Event()
+        self._run_lock = threading.Lock()  # 실행은 한 번에 하나만
+        self._lock = threading.Lock()  # 순위 / 기록 / 파일 보호
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        if saved.get('version') != WARMUP_VERSION:
+            return
+        self.ranking.load(saved.get('keywords', {}))
+        self._history.extend(saved.get('history', []))
+        self._last_run = saved.get('last_run')
+
+    def _save_locked(self):
+        """순위와 기록을 파일에 저장합니다. (self._lock 안에서 호출, 저장 실패는 무시)"""
+        state = {'version': WARMUP_VERSION, 'keywords': self.ranking.to_dict(), 'last_run': self._last_run,
+                 'history': list(self._history)}
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            write_atomic(self.path, json.dumps(state, ensure_ascii=False, indent=2))
+        except OSError:
+            pass
+
+    def record(self, keyword):
+        """세션에서 선택한 검색어를 순위에 반영합니다."""
+        keyword = ' '.join((keyword or '').split())
+        if not keyword:
+            return
+        with self._lock:
+            self.ranking.record(keyword)
+            self._save_locked()
+
+    def start(self):
+        """백그라운드 스레드를 시작합니다. (이미 실행 중이면 아무것도 하지 않음)"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return False
+            self._stop.clear()
+            self._started_at = time.time()
+            self._next_run_at = self._started_at + self.start_delay
+            self._thread = threading.Thread(target=self._loop, name="warmup", daemon=True)
+            self._thread.start()
+            return True
+
+    def stop(self, timeout=None):
+        """백그라운드 스레드를 멈춥니다. (진행 중인 작업이 끝날 때까지 최대 timeout 초 대기)"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _loop(self):
+        delay = self.start_delay
+        while not self._stop.wait(delay):
+            self.run_once()
+            with self._lock:
+                self._next_run_at = time.time() + self.interval
+            delay = self.interval
+
+    def _warm(self, report, budget, kind, target, func, fetch=False):
+        """하나의 미리 불러오기 작업을 실행하고 보고에 기록합니다. (예산을 다 썼으면 건너뜀, 오류는 기록만 하고 계속 진행)"""
+        if budget.exhausted(fetch=fetch):
+            report['skipped'].append({'kind': kind, 'target': target})
+            return
+        began = time.perf_counter()
+        try:
+            detail = func(target, budget)
+        except Exception as e:  # 외부 요청 실패 등 (다음 실행 때 다시 시도)
+            METRICS.incr('warmup.errors')
+            report['errors'].append({'kind': kind, 'target': target, 'error': f"{type(e).__name__}: {e}"})
+            return
+        if detail is None:  # 이미 준비되어 있음
+            return
+        item = {'kind': kind, 'target': target, 'at': round(time.time(), 3),
+                'ms': round((time.perf_counter() - began) * 1000, 3), 'detail': detail}
+        METRICS.incr(f'warmup.{kind}')
+        report['warmed'].append(item)
+        with self._lock:
+            self._history.append(item)
+
+    def _warm_books(self, keyword, budget):
+        if cached_books(keyword) is not None:
+            return None
+        if not os.getenv("CID"):  # API 키가 없으면 요청하지 않음
+            raise RuntimeError("네이버 API 키(CID)가 없습니다.")
+        budget.spend()
+        return f"{len(fetch_books(keyword))}권"
+
+    def _warm_charts(self, keyword, budget):
+        rendered = warm_charts(keyword)
+        return f"{rendered}장" if rendered else None
+
+    def _warm_schedule(self, target, budget):
+        app = QnetScheduleApp(self.data_folder)
+        this_month = time.localtime().tm_mon
+        months = range(this_month, min(this_month + self.months_ahead, 13))
+        warmed = app.warm_months(months, should_continue=lambda: not budget.exhausted(fetch=True), spend=budget.spend)
+        if not warmed:
+            return None
+        load_join_index(self.data_folder, app.year)  # 일정 파일이 바뀌었으면 조인 색인을 다시 만들어 저장 (검색 탭에서 만들지 않도록)
+        return ', '.join(f'{month}월' for month in warmed)
+
+    def run_once(self):
+        """
+        미리 불러오기를 한 번 실행합니다.
+
+        Returns:
+            dict: {'started_at', 'finished_at', 'keywords', 'warmed', 'skipped', 'errors'}
+        """
+        with self._run_lock, METRICS.span('warmup.run'):
+            with self._lock:
+                keywords = [entry['keyword'] for entry in self.ranking.top(self.top_n)]
+            budget = WarmupBudget(self.budget_seconds, self.max_fetches)
+            report = {'started_at': round(time.time(), 3), 'keywords': keywords, 'warmed': [], 'skipped': [], 'errors': []}
+            for keyword in keywords:  # 인기 순서대로 (예산이 부족하면 순위가 낮은 검색어부터 다음 실행으로 미룸)
+                self._warm(report, budget, 'books', keyword, self._warm_books, fetch=True)
+                self._warm(report, budget, 'charts', keyword, self._warm_charts)
+            self._warm(report, budget, 'schedule', 'upcoming', self._warm_schedule, fetch=True)
+            report['finished_at'] = round(time.time(), 3)
+            with self._lock:
+                self._last_run = report
+                self._save_locked()
+            return report
+
+    def status(self):
+        """
+        스케줄러 상태를 반환합니다.
+
+        Returns:
+            dict: {'running', 'started_at', 'next_run_at', 'ranking', 'last_run', 'history'}
+        """
+        with self._lock:
+            return {'running': self._thread is not None and self._thread.is_alive(),
+                    'started_at': self._started_at, 'next_run_at': self._next_run_at,
+                    'ranking': self.ranking.top(self.top_n), 'last_run': self._last_run,
+                    'history': list(self._history)[::-1]}  # 최근 항목부터
+
+
+@functools.lru_cache(maxsize=None)
+def get_scheduler():
+    """프로세스 전체(모든 세션)에서 공유하는 미리 불러오기 스케줄러를 반환합니다."""
+    return WarmupScheduler()
+
+
+def start_warmup():
+    """공유 스케줄러를 반환하고, WARMUP_ENABLED 이면 백그라운드 스레드를 시작합니다. (여러 번 호출해도 한 번만 시작)"""
+    scheduler = get_scheduler()
+    if WARMUP_ENABLED:
+        scheduler.start()
+    return scheduler